@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from accounts.models import User, GuideProfile, PasswordResetOTP
+from accounts.models import User, GuideProfile, PasswordResetOTP, EmailOutbox
 # from destinations.models import Destination
 # from socials.models import Post, Comment, Bookmark, Share
 # from reports.models import IncidentReport, AlertBroadcast
@@ -48,3 +48,9 @@ class PasswordResetOTPAdmin(admin.ModelAdmin):
     search_fields = ('user__email',)
     readonly_fields = ('createdAt', 'expiresAt')
 
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = ('toEmail', 'subject', 'status', 'attempts', 'nextAttemptAt', 'sentAt')
+    list_filter = ('status',)
+    search_fields = ('toEmail', 'subject')
+    readonly_fields = ('createdAt', 'sentAt', 'lastError')
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from accounts.outbox import deliver_outbox
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued outbox emails over a pooled SMTP connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling for new emails instead of exiting when the queue is empty'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep between polls when the queue is empty (with --loop)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Emails sent per SMTP connection (default: EMAIL_OUTBOX_BATCH_SIZE)'
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+
+        while True:
+            sent, failed = deliver_outbox(options['batch_size'])
+            total_sent += sent
+            total_failed += failed
+
+            if sent or failed:
+                self.stdout.write(f"Sent {sent}, failed {failed}")
+                continue
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Done — {total_sent} sent, {total_failed} failed'
+        ))
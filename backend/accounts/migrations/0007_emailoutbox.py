@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:37
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_remove_guideprofile_address_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailOutbox',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('toEmail', models.EmailField(max_length=254)),
+                ('subject', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('SENT', 'Sent'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('nextAttemptAt', models.DateTimeField(default=django.utils.timezone.now)),
+                ('lastError', models.TextField(blank=True)),
+                ('createdAt', models.DateTimeField(default=django.utils.timezone.now)),
+                ('sentAt', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'email_outbox',
+                'indexes': [models.Index(fields=['status', 'nextAttemptAt'], name='outbox_due_idx')],
+            },
+        ),
+    ]
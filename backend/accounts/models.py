@@ -124,4 +124,39 @@ class PasswordResetOTP(models.Model):
         return timezone.now() > self.expiresAt
 
     def __str__(self):
-        return f"OTP for {self.user.email} - {self.purpose}"
\ No newline at end of file
+        return f"OTP for {self.user.email} - {self.purpose}"
+
+class EmailOutbox(models.Model):
+    """
+    Transactional email outbox. Rows are written in the same transaction as
+    the change that triggered them and delivered by
+    `manage.py send_outbox_emails`, never inside the request.
+    """
+
+    STATUS_CHOICES = (
+        ('PENDING', 'Pending'),
+        ('SENT', 'Sent'),
+        ('FAILED', 'Failed'),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    toEmail = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    nextAttemptAt = models.DateTimeField(default=timezone.now)
+    lastError = models.TextField(blank=True)
+
+    createdAt = models.DateTimeField(default=timezone.now)
+    sentAt = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'email_outbox'
+        indexes = [
+            models.Index(fields=['status', 'nextAttemptAt'], name='outbox_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} → {self.toEmail} ({self.status})"
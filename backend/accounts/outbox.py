@@ -0,0 +1,111 @@
+"""
+Transactional email outbox.
+
+queue_email() only inserts an EmailOutbox row, so it commits (or rolls back)
+with the surrounding transaction and never touches SMTP. deliver_outbox()
+is run by the `send_outbox_emails` worker: it claims a batch of due rows,
+sends them over a single SMTP connection and schedules failed rows for retry
+with exponential backoff.
+
+Claiming is a short transaction that pushes the rows' nextAttemptAt out by
+EMAIL_OUTBOX_LEASE_SECONDS; SMTP then runs with no transaction or row lock
+open, and each outcome is saved on its own. A worker that dies mid-batch
+leaves its rows to become due again when the lease runs out.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+
+def queue_email(subject, message, recipient):
+    return EmailOutbox.objects.create(toEmail=recipient, subject=subject, body=message)
+
+
+def _retry_delay(attempts):
+    seconds = settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+    return timedelta(seconds=min(seconds, settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS))
+
+
+def _mark_failed(row, error, now):
+    row.attempts += 1
+    row.lastError = str(error)[:1000]
+    if row.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        row.status = "FAILED"
+    else:
+        row.nextAttemptAt = now + _retry_delay(row.attempts)
+    row.save(update_fields=["attempts", "lastError", "status", "nextAttemptAt"])
+
+
+def claim_batch(batch_size, now):
+    """Lease up to ``batch_size`` due rows to this worker and return them."""
+    with transaction.atomic():
+        batch = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status="PENDING", nextAttemptAt__lte=now)
+            .order_by("nextAttemptAt")[:batch_size]
+        )
+        if batch:
+            EmailOutbox.objects.filter(pk__in=[row.pk for row in batch]).update(
+                nextAttemptAt=now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+            )
+    return batch
+
+
+def deliver_outbox(batch_size=None):
+    """
+    Send one batch of due emails. Returns (sent, failed).
+
+    Rows are claimed with SKIP LOCKED plus a lease, so several workers can
+    run side by side without sending the same row.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    now = timezone.now()
+    sent = failed = 0
+
+    batch = claim_batch(batch_size, now)
+    if not batch:
+        return 0, 0
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.warning("Outbox: SMTP connection failed: %s", exc)
+        for row in batch:
+            _mark_failed(row, exc, now)
+        return 0, len(batch)
+
+    try:
+        for row in batch:
+            message = EmailMessage(
+                subject=row.subject,
+                body=row.body,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[row.toEmail],
+            )
+            try:
+                connection.send_messages([message])
+            except Exception as exc:
+                logger.warning("Outbox: failed to send %s to %s: %s", row.id, row.toEmail, exc)
+                _mark_failed(row, exc, timezone.now())
+                failed += 1
+                continue
+
+            row.status = "SENT"
+            row.attempts += 1
+            row.sentAt = timezone.now()
+            row.save(update_fields=["status", "attempts", "sentAt"])
+            sent += 1
+    finally:
+        connection.close()
+
+    return sent, failed
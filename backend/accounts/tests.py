@@ -1,3 +1,66 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.core import mail
 from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import EmailOutbox
+from accounts.outbox import _retry_delay, claim_batch, deliver_outbox, queue_email
+
+
+class EmailOutboxTests(TestCase):
+    def test_queue_email_only_inserts(self):
+        row = queue_email("Welcome", "Hello", "trekker@example.com")
+        self.assertEqual((row.status, row.attempts), ("PENDING", 0))
+        self.assertEqual(mail.outbox, [])
+
+    def test_deliver_sends_due_rows(self):
+        queue_email("Welcome", "Hello", "trekker@example.com")
+        later = queue_email("Later", "Hi", "guide@example.com")
+        EmailOutbox.objects.filter(pk=later.pk).update(nextAttemptAt=timezone.now() + timedelta(hours=1))
+
+        self.assertEqual(deliver_outbox(), (1, 0))
+        self.assertEqual([m.to for m in mail.outbox], [["trekker@example.com"]])
+        sent = EmailOutbox.objects.get(subject="Welcome")
+        self.assertEqual((sent.status, sent.attempts), ("SENT", 1))
+        self.assertIsNotNone(sent.sentAt)
+        self.assertEqual(deliver_outbox(), (0, 0))
+
+    def test_claimed_rows_are_leased(self):
+        queue_email("Welcome", "Hello", "trekker@example.com")
+        now = timezone.now()
+        self.assertEqual(len(claim_batch(10, now)), 1)
+        # A second worker finds nothing until the lease runs out
+        self.assertEqual(claim_batch(10, now), [])
+        lease = timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+        self.assertEqual(len(claim_batch(10, now + lease)), 1)
+
+    def test_retry_delay_doubles_and_caps(self):
+        base = settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS
+        self.assertEqual(_retry_delay(1), timedelta(seconds=base))
+        self.assertEqual(_retry_delay(3), timedelta(seconds=base * 4))
+        self.assertEqual(_retry_delay(50), timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS))
+
+    def test_failures_back_off_then_stop(self):
+        row = queue_email("Welcome", "Hello", "trekker@example.com")
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=OSError("SMTP down"),
+        ):
+            before = timezone.now()
+            self.assertEqual(deliver_outbox(), (0, 1))
+            row.refresh_from_db()
+            self.assertEqual((row.status, row.attempts, row.lastError), ("PENDING", 1, "SMTP down"))
+            self.assertGreaterEqual(row.nextAttemptAt, before + _retry_delay(1))
+
+            for attempt in range(2, settings.EMAIL_OUTBOX_MAX_ATTEMPTS + 1):
+                EmailOutbox.objects.filter(pk=row.pk).update(nextAttemptAt=timezone.now())
+                deliver_outbox()
+                row.refresh_from_db()
+                self.assertEqual(row.attempts, attempt)
 
-# Create your tests here.
+        self.assertEqual(row.status, "FAILED")
+        EmailOutbox.objects.filter(pk=row.pk).update(nextAttemptAt=timezone.now())
+        self.assertEqual(deliver_outbox(), (0, 0))
@@ -1,8 +1,7 @@
 import random
 import hashlib
-from django.conf import settings
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
+from accounts.outbox import queue_email
 
 
 def generate_otp():
@@ -17,7 +16,7 @@ def hash_otp(otp):
 
 def send_otp_email(user, otp, purpose='registration'):
     """
-    Send OTP email to user
+    Queue OTP email to user (delivered by the outbox worker)
     
     Args:
         user: User instance
@@ -25,7 +24,7 @@ def send_otp_email(user, otp, purpose='registration'):
         purpose: 'registration' or 'reset_password'
     
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email queued successfully, False otherwise
     """
     try:
         if purpose == 'registration':
@@ -63,13 +62,7 @@ Tourist Alert System Team
         else:
             return False
         
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        queue_email(subject, message, user.email)
         return True
         
     except Exception as e:
@@ -85,7 +78,7 @@ def send_welcome_email(user):
         user: User instance
     
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if email queued successfully, False otherwise
     """
     try:
         if user.role == 'TOURIST':
@@ -144,13 +137,7 @@ Best regards,
 Tourist Alert System Team
 """
         
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        queue_email(subject, message, user.email)
         return True
         
     except Exception as e:
@@ -165,7 +152,7 @@ def send_guide_verification_approved_email(user):
         user: User instance (must have .guideProfile)
     
     Returns:
-        bool: True if sent successfully
+        bool: True if queued successfully
     """
     try:
         guide_profile = user.guideProfile
@@ -202,13 +189,7 @@ Best regards,
 Tourist Alert System Team
 """
         
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        queue_email(subject, message, user.email)
         return True
         
     except Exception as e:
@@ -224,7 +205,7 @@ def send_guide_verification_rejected_email(user, reason=""):
         reason: Optional rejection reason from admin
     
     Returns:
-        bool: True if sent successfully
+        bool: True if queued successfully
     """
     try:
         
@@ -259,13 +240,7 @@ Best regards,
 Tourist Alert System Team
 """
         
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        queue_email(subject, message, user.email)
         return True
         
     except Exception as e:
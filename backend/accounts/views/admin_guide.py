@@ -1,6 +1,5 @@
-from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
+from accounts.outbox import queue_email
 
 from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
@@ -225,13 +224,7 @@ Tourist Alert System Team
         
         # Send email notification
         try:
-            send_mail(
-                subject=email_subject,
-                message=email_body,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[user.email],
-                fail_silently=False,
-            )
+            queue_email(email_subject, email_body, user.email)
         except Exception as e:
             # Log error but don't fail the approval process
             print(f"Error sending {action} email to {user.email}: {str(e)}")
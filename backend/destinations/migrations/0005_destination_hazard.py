@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-19 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('destinations', '0004_rename_city_destination_district'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='destination',
+            name='hazardClusters',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='destination',
+            name='hazardScore',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name='destination',
+            name='hazardUpdatedAt',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
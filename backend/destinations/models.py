@@ -22,6 +22,11 @@ class Destination(models.Model):
     climate = models.CharField(max_length=100, null=True, blank=True)
     safetyLevel = models.CharField(max_length=50, null=True, blank=True)
 
+    # Live overlay from active incident clusters nearby (reports.hazards)
+    hazardScore = models.FloatField(default=0.0)
+    hazardClusters = models.JSONField(default=list, blank=True)
+    hazardUpdatedAt = models.DateTimeField(null=True, blank=True)
+
     permitsRequired = models.BooleanField(default=False)
     image = models.URLField(
         max_length=500,
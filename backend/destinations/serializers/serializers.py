@@ -16,11 +16,12 @@ class DestinationListSerializer(serializers.ModelSerializer):
             "averageCost",
             "crowdLevel",
             "safetyLevel",
+            "hazardScore",
             "duration",
             "createdAt",
             "image"
         ]
-        read_only_fields = ["id", "createdAt"]
+        read_only_fields = ["id", "createdAt", "hazardScore"]
 
 
 class DestinationSerializer(serializers.ModelSerializer):
@@ -44,6 +45,9 @@ class DestinationSerializer(serializers.ModelSerializer):
             "altitude",
             "climate",
             "safetyLevel",
+            "hazardScore",
+            "hazardClusters",
+            "hazardUpdatedAt",
             "permitsRequired",
             "crowdLevel",
             "internetAvailability",
@@ -52,7 +56,7 @@ class DestinationSerializer(serializers.ModelSerializer):
             "district",
             "country"
         ]
-        read_only_fields = ["id", "createdAt"]
+        read_only_fields = ["id", "createdAt", "hazardScore", "hazardClusters", "hazardUpdatedAt"]
 
 
     def validate_latitude(self, value):
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 import os
 from pathlib import Path
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 from decouple import config
 import dj_database_url
@@ -98,9 +99,31 @@ INCIDENT_CLUSTER_WINDOW_HOURS = 1
 CLUSTER_MIN_REPORTS = 3
 
 CLUSTER_AUTO_BROADCAST_THRESHOLD = 5
+CLUSTER_ACTIVE_HOURS = 24   # a cluster leaves the active set this long after it forms
+# Repeat AUTO alerts for the same cell + category within this window update
+# the first alert instead of broadcasting again (reports/suppression.py)
+ALERT_SUPPRESSION_SECONDS = 3 * 3600
+ALERT_SUPPRESSION_CELL_DEGREES = 0.05   # ~5 km
+# Active clusters within this distance feed a destination's hazardScore (reports/hazards.py)
+DESTINATION_HAZARD_RADIUS_KM = 25
 DBSCAN_EPS = 0.5        # max distance between reports to be in same cluster
 DBSCAN_MIN_SAMPLES = 3   # minimum reports to form a cluster
 
+# Clustering window per region (rollup cells, REPORTS_REGION_CELL_DEGREES):
+# the span holding the region's newest CLUSTER_MAX_REPORTS_PER_REGION
+# reports, kept within these bounds (reports/clustering.py)
+CLUSTER_WINDOW_MIN_HOURS = 1
+CLUSTER_WINDOW_MAX_HOURS = 6
+CLUSTER_MAX_REPORTS_PER_REGION = 400
+
+# Spike detection per (cell, category) ahead of clustering (reports/spikes.py)
+REPORTS_SPIKE_CELL_DEGREES = 0.1        # ~11 km, about one valley
+REPORTS_SPIKE_FAST_MINUTES = 60
+REPORTS_SPIKE_SLOW_HOURS = 24
+REPORTS_SPIKE_MIN_REPORTS = 3           # decayed recent count, matches CLUSTER_MIN_REPORTS
+REPORTS_SPIKE_RATIO = 2.5               # recent rate vs baseline rate
+REPORTS_SPIKE_COOLDOWN_SECONDS = 300
+
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
@@ -108,6 +131,69 @@ CACHES = {
     }
 }
 
+# Admin report list (reports/pagination.py)
+REPORTS_PAGE_SIZE = 50
+REPORTS_MAX_PAGE_SIZE = 200
+REPORTS_STATS_CACHE_SECONDS = 60
+REPORTS_OVERVIEW_CACHE_SECONDS = 30
+REPORTS_REGION_CELL_DEGREES = 0.5       # rollup region size (~55 km)
+REPORTS_BATCH_MAX_SIZE = 50             # reports per POST /reports/batch
+REPORTS_MODERATION_MAX_IDS = 500        # reports per POST /reports/moderate
+
+# Map aggregation grid (reports/mapgrid.py)
+REPORTS_MAP_CELLS_PER_TILE = 8          # cells per tile side
+REPORTS_MAP_CACHE_SECONDS = 60          # time bucket + cache TTL
+REPORTS_MAP_MAX_TILES = 64              # per request
+REPORTS_MAP_MAX_HOURS = 24 * 30
+REPORTS_MAP_DEFAULT_HOURS = 72
+
+# Route safety (reports/routes.py); the time window reuses the map's hours limits
+REPORTS_ROUTE_MAX_POINTS = 500
+REPORTS_ROUTE_DEFAULT_RADIUS_KM = 5
+REPORTS_ROUTE_MAX_RADIUS_KM = 50
+REPORTS_ROUTE_MAX_HAZARDS = 500
+REPORTS_ROUTE_MAX_CANDIDATES = 20000    # newest reports in the route's bbox
+
+# ?near=lat,lon&radius=km on alerts, clusters and reports/nearby (reports/nearby.py)
+REPORTS_NEARBY_DEFAULT_RADIUS_KM = 10
+REPORTS_NEARBY_MAX_RADIUS_KM = 100
+REPORTS_NEARBY_PAGE_SIZE = 20
+
+# Idempotency-Key replay window for create endpoints (reports/idempotency.py)
+IDEMPOTENCY_KEY_TTL_SECONDS = 24 * 3600
+IDEMPOTENCY_IN_FLIGHT_SECONDS = 120     # lease on a key whose first request has not finished
+
+# Server-Sent Events (reports/events.py). RedisBroker reaches clients on every
+# worker; InProcessBroker only those connected to the same process, so set it
+# only for a single-process setup without Redis.
+REPORTS_EVENT_BROKER = os.getenv('REPORTS_EVENT_BROKER', 'reports.events.RedisBroker')
+REPORTS_EVENT_REDIS_URL = os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1')
+REPORTS_EVENT_CHANNEL = 'globalmitra:events'
+REPORTS_EVENT_TICKET_SECONDS = 60       # lifetime of a single-use stream ticket
+
+# Notification retention (manage.py purge_notifications). Read rows older than
+# their type's TTL are archived and deleted; unread rows get the grace period
+# on top before they go too.
+NOTIFICATION_RETENTION_DAYS = {
+    'AUTO_ALERT': 7,
+    'ALERT_BROADCAST': 7,
+    'NEW_INCIDENT': 30,
+    'CLUSTER_FORMED': 30,
+    'REPORT_VERIFIED': 90,
+    'REPORT_REJECTED': 90,
+}
+NOTIFICATION_UNREAD_GRACE_DAYS = 30
+
+# Report image pipeline (manage.py process_report_images). Longest edge in px
+# per rendition; "full" replaces the uploaded original.
+REPORT_IMAGE_RENDITIONS = {
+    'full': 2048,
+    'medium': 1024,
+    'thumbnail': 320,
+}
+REPORT_IMAGE_WEBP_QUALITY = 80
+REPORT_IMAGE_BATCH_SIZE = 20
+
 ROOT_URLCONF = 'globalmitra.urls'
 
 TEMPLATES = [
@@ -211,6 +297,7 @@ if not DEBUG:
 # CORS Settings (Uncomment if using Django REST Framework)
 CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', 'http://localhost:3000').split(',')
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -267,6 +354,13 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL')
 EMAIL_TIMEOUT = 10
+
+# Email outbox worker (manage.py send_outbox_emails)
+EMAIL_OUTBOX_BATCH_SIZE = 50
+EMAIL_OUTBOX_MAX_ATTEMPTS = 6
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = 30      # doubles each attempt
+EMAIL_OUTBOX_RETRY_MAX_SECONDS = 3600
+EMAIL_OUTBOX_LEASE_SECONDS = 15 * 60      # claimed rows come due again if the worker dies
   
 
 
@@ -1,20 +1,28 @@
 from django.contrib import admin
-from .models import IncidentReport, AlertBroadcast, IncidentCluster, Notification
+from .models import (
+    IncidentReport,
+    AlertBroadcast,
+    IncidentCluster,
+    Notification,
+    UnreadNotificationCounter,
+    ArchivedNotification,
+    ClusteringRun,
+)
 
 
 @admin.register(IncidentReport)
 class IncidentReportAdmin(admin.ModelAdmin):
-    list_display = ('id', 'user', 'category', 'status', 'confidenceScore', 'createdAt')
+    list_display = ('id', 'user', 'category', 'status', 'imageStatus', 'confidenceScore', 'createdAt')
     search_fields = ('description', 'category', 'user__email')
-    list_filter = ('status', 'category')
+    list_filter = ('status', 'category', 'imageStatus')
     readonly_fields = ('createdAt', 'confidenceScore')
 
 
 @admin.register(IncidentCluster)
 class IncidentClusterAdmin(admin.ModelAdmin):
-    list_display = ('id', 'dominantCategory', 'confidenceScore', 'isAlertTriggered', 'createdAt')
-    list_filter = ('isAlertTriggered', 'dominantCategory')
-    readonly_fields = ('createdAt', 'topKeywords', 'confidenceScore')
+    list_display = ('id', 'dominantCategory', 'confidenceScore', 'isAlertTriggered', 'state', 'reportCount', 'createdAt')
+    list_filter = ('state', 'isAlertTriggered', 'dominantCategory')
+    readonly_fields = ('createdAt', 'topKeywords', 'confidenceScore', 'reportCount')
 
 
 @admin.register(AlertBroadcast)
@@ -29,4 +37,23 @@ class AlertBroadcastAdmin(admin.ModelAdmin):
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ('recipient', 'notificationType', 'title', 'isRead', 'createdAt')
     list_filter = ('notificationType', 'isRead')
-    readonly_fields = ('createdAt',)
\ No newline at end of file
+    readonly_fields = ('createdAt',)
+
+
+@admin.register(UnreadNotificationCounter)
+class UnreadNotificationCounterAdmin(admin.ModelAdmin):
+    list_display = ('user', 'unread')
+    search_fields = ('user__email',)
+
+
+@admin.register(ArchivedNotification)
+class ArchivedNotificationAdmin(admin.ModelAdmin):
+    list_display = ('recipient', 'notificationType', 'title', 'isRead', 'createdAt', 'archivedAt')
+    list_filter = ('notificationType',)
+    readonly_fields = ('createdAt', 'archivedAt')
+
+
+@admin.register(ClusteringRun)
+class ClusteringRunAdmin(admin.ModelAdmin):
+    list_display = ('createdAt', 'reason', 'reportCount', 'clustersCreated', 'durationMs')
+    readonly_fields = ('createdAt', 'reason', 'bbox', 'regions', 'reportCount', 'clustersCreated', 'durationMs')
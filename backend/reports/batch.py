@@ -0,0 +1,162 @@
+"""
+Batch report submission for devices uploading an offline backlog.
+
+    POST /reports/batch   multipart: reports=<JSON list>, image_<n>=<file>, ...
+
+Every item carries a device-generated clientId. Items this user already
+submitted, or that repeat a clientId earlier in the batch, come back as
+duplicates instead of being inserted, so retrying a whole upload is safe.
+The remaining items are validated together — one bad item rejects the
+batch — and inserted with a single bulk_create.
+
+bulk_create skips post_save, so the counters, search index, stats cache
+and spike detector are updated here. Rather than one regional clustering
+run per spiking cell, a batch schedules a single run over the area its new
+reports cover once the insert commits.
+"""
+
+import json
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers
+
+from reports.clustering import cluster_recent_reports
+from reports.counters import record_reports_created
+from reports.dedup import simhash
+from reports.models import IncidentReport
+from reports.search import index_reports
+from reports.serializers import IncidentReportCreateSerializer
+from reports.spikes import observe, reports_bbox
+from reports.stats import invalidate_report_stats
+
+
+def parse_batch(data, files):
+    """
+    Turn the request body into a list of item dicts with their image files
+    attached. An item's ``image`` names its multipart part (default
+    ``image_<index>``). Raises ValidationError on a malformed manifest.
+    """
+    raw = data.get("reports")
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except ValueError:
+            raise serializers.ValidationError({"reports": ["Must be a JSON list."]})
+    if not isinstance(raw, list) or not raw:
+        raise serializers.ValidationError({"reports": ["Must be a non-empty list."]})
+    if len(raw) > settings.REPORTS_BATCH_MAX_SIZE:
+        raise serializers.ValidationError(
+            {"reports": [f"At most {settings.REPORTS_BATCH_MAX_SIZE} reports per batch."]}
+        )
+
+    items, errors = [], {}
+    for i, item in enumerate(raw):
+        if not isinstance(item, dict):
+            errors[i] = {"non_field_errors": ["Must be an object."]}
+            continue
+        item = dict(item)
+        part = str(item.pop("image", "") or f"image_{i}")
+        if part in files:
+            item["image"] = files[part]
+        try:
+            item["clientId"] = uuid.UUID(str(item.get("clientId")))
+        except ValueError:
+            errors[i] = {"clientId": ["A valid UUID is required."]}
+        items.append(item)
+
+    if errors:
+        raise serializers.ValidationError({"errors": errors})
+    return items
+
+
+def submit_report_batch(user, items):
+    """
+    Insert the new items of a parsed batch for ``user``.
+
+    Returns (results, created): one {"index", "clientId", "status", "id"} per
+    input item, status "created" or "duplicate", and the inserted reports.
+    """
+    existing = dict(
+        IncidentReport.objects.filter(
+            user=user, clientId__in=[item["clientId"] for item in items]
+        ).values_list("clientId", "id")
+    )
+
+    first_seen = {}
+    new_indexes = []
+    for i, item in enumerate(items):
+        client_id = item["clientId"]
+        if client_id not in existing and client_id not in first_seen:
+            first_seen[client_id] = i
+            new_indexes.append(i)
+
+    serializer = IncidentReportCreateSerializer(
+        data=[items[i] for i in new_indexes], many=True
+    )
+    if not serializer.is_valid():
+        raise serializers.ValidationError(
+            {
+                "errors": {
+                    new_indexes[j]: error
+                    for j, error in enumerate(serializer.errors)
+                    if error
+                }
+            }
+        )
+
+    reports = [
+        IncidentReport(user=user, clientId=items[i]["clientId"], **validated)
+        for i, validated in zip(new_indexes, serializer.validated_data)
+    ]
+    for report in reports:
+        # bulk_create bypasses IncidentReport.save()
+        report.descriptionSimhash = simhash(report.description)
+        if not report.image:
+            report.imageStatus = "NONE"
+
+    with transaction.atomic():
+        # A concurrent retry of the same upload may have inserted some of
+        # these already; the unique (user, clientId) key drops those rows.
+        IncidentReport.objects.bulk_create(reports, ignore_conflicts=True)
+        inserted = set(
+            IncidentReport.objects.filter(pk__in=[r.pk for r in reports]).values_list(
+                "pk", flat=True
+            )
+        )
+        created = [r for r in reports if r.pk in inserted]
+        if len(created) < len(reports):
+            existing.update(
+                IncidentReport.objects.filter(
+                    user=user,
+                    clientId__in=[r.clientId for r in reports if r.pk not in inserted],
+                ).values_list("clientId", "id")
+            )
+
+        if created:
+            record_reports_created(created)
+            index_reports(created)
+            transaction.on_commit(invalidate_report_stats)
+            for report in created:
+                # Keeps the rates current; the batch clusters its area below
+                observe(report.latitude, report.longitude, report.category, report.createdAt)
+            bbox = reports_bbox(created)
+            transaction.on_commit(
+                lambda: cluster_recent_reports(f"batch of {len(created)} reports", bbox=bbox)
+            )
+
+    created_ids = {r.clientId: r.pk for r in created}
+    results = []
+    for i, item in enumerate(items):
+        client_id = item["clientId"]
+        is_new = first_seen.get(client_id) == i and client_id in created_ids
+        results.append(
+            {
+                "index": i,
+                "clientId": str(client_id),
+                "status": "created" if is_new else "duplicate",
+                "id": str(created_ids.get(client_id) or existing.get(client_id)),
+            }
+        )
+    return results, created
@@ -1,18 +1,31 @@
+import logging
 import math
+import time
 import numpy as np
-from collections import Counter
+from collections import Counter, defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Count
+from django.utils import timezone
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import DBSCAN
 from typing import List, Dict, Any
-from reports.models import  IncidentCluster
+from reports.dedup import collapse_near_duplicates
+from reports.geo import bbox_around, region_for
+from reports.lifecycle import active_clusters
+from reports.models import  IncidentCluster, IncidentReport
+
+logger = logging.getLogger(__name__)
 
-TIME_WINDOW_HOURS = 3
 GEO_RADIUS_KM = 3.0
 MIN_CLUSTER_REPORTS = 3
 DBSCAN_EPS = 0.82
 DBSCAN_MIN_SAMPLES = 3
 GUIDE_WEIGHT = 1.5
+# Reports this close to a region's edge also join the neighbouring region's
+# run, so an incident on the boundary is clustered whole (see plan_windows)
+REGION_MARGIN_KM = 2 * GEO_RADIUS_KM
 
 
 def haversine_km(lat1, lon1, lat2, lon2):
@@ -81,34 +94,81 @@ def severity_from_confidence(score):
     return "LOW"
 
 
+def membership_strength(idxs, cos_sim, in_reach, is_core):
+    """
+    How firmly each point of one cluster belongs to it, 0–1:
+
+        0.5 × mean similarity to the other members
+      + 0.3 × share of the other members within DBSCAN_EPS
+      + 0.2 if it is a core point
+    """
+    idxs = np.asarray(idxs)
+    others = max(len(idxs) - 1, 1)
+    sim = cos_sim[np.ix_(idxs, idxs)]
+    mean_sim = (sim.sum(axis=1) - np.diag(sim)) / others
+    neighbours = in_reach[np.ix_(idxs, idxs)].sum(axis=1) - 1
+    score = 0.5 * mean_sim + 0.3 * neighbours / others + 0.2 * is_core[idxs]
+    return np.round(np.clip(score, 0.0, 1.0), 4)
+
+
+def save_membership_scores(cluster_data_list, report_ids=()):
+    """
+    Write IncidentReport.confidenceScore in one bulk_update: each member's
+    membership strength, and 0 for the rest of ``report_ids`` (the reports
+    the run considered), so a report that fell out of its cluster does not
+    keep a stale score.
+    """
+    scores = dict.fromkeys(report_ids, 0.0)
+    for data in cluster_data_list:
+        scores.update(zip(data["report_ids"], data["membership"]))
+    reports = [
+        IncidentReport(pk=report_id, confidenceScore=score)
+        for report_id, score in scores.items()
+    ]
+    if reports:
+        IncidentReport.objects.bulk_update(reports, ["confidenceScore"], batch_size=1000)
+    return len(reports)
+
+
 def run_clustering_pipeline(reports_queryset) -> List[Dict[str, Any]]:
     reports = list(reports_queryset)
     if len(reports) < MIN_CLUSTER_REPORTS:
         return []
 
-    descriptions = [r.description for r in reports]
-    lats = [r.latitude for r in reports]
-    lons = [r.longitude for r in reports]
-    roles = [getattr(r.user, "role", "TOURIST") for r in reports]
-    categories = [r.category for r in reports]
-    n = len(reports)
-
+    # One point per group of near-duplicate reports (reports.dedup): the
+    # first report stands in for the group, weight = group size.
+    groups = collapse_near_duplicates(reports)
+    if len(groups) < MIN_CLUSTER_REPORTS:
+        return []
+    points = [reports[g[0]] for g in groups]
+    weights = np.array([len(g) for g in groups], dtype=float)
+
+    descriptions = [r.description for r in points]
+    lats = [r.latitude for r in points]
+    lons = [r.longitude for r in points]
+    roles = [
+        "GUIDE"
+        if any(getattr(reports[i].user, "role", "TOURIST") == "GUIDE" for i in g)
+        else getattr(points[k].user, "role", "TOURIST")
+        for k, g in enumerate(groups)
+    ]
     geo_dist = build_geo_matrix(lats, lons)
     cos_sim = build_cosine_matrix(descriptions, roles)
-
-    for i in range(n):
-        for j in range(n):
-            if geo_dist[i][j] > GEO_RADIUS_KM:
-                cos_sim[i][j] = 0.0
+    cos_sim[geo_dist > GEO_RADIUS_KM] = 0.0
 
     dist_matrix = 1.0 - cos_sim
     np.fill_diagonal(dist_matrix, 0.0)
 
-    labels = DBSCAN(
+    # Unweighted on purpose: a burst of resubmissions is one piece of evidence
+    db = DBSCAN(
         eps=DBSCAN_EPS,
         min_samples=DBSCAN_MIN_SAMPLES,
         metric="precomputed",
-    ).fit_predict(dist_matrix)
+    ).fit(dist_matrix)
+    labels = db.labels_
+    is_core = np.zeros(len(points), dtype=bool)
+    is_core[db.core_sample_indices_] = True
+    in_reach = dist_matrix <= DBSCAN_EPS
 
     clusters = []
     unique_labels = set(labels)
@@ -121,22 +181,23 @@ def run_clustering_pipeline(reports_queryset) -> List[Dict[str, Any]]:
         if len(idxs) < MIN_CLUSTER_REPORTS:
             continue
 
-        c_reps = [
-            (lats[i], lons[i], descriptions[i], roles[i], categories[i]) for i in idxs
-        ]
-        n_rep = len(c_reps)
+        members = [m for i in idxs for m in groups[i]]
+        n_rep = len(idxs)
 
-        c_lat = sum(lats[i] for i in idxs) / len(idxs)
-        c_lon = sum(lons[i] for i in idxs) / len(idxs)
+        w = weights[idxs]
+        c_lat = float(np.dot(w, [lats[i] for i in idxs]) / w.sum())
+        c_lon = float(np.dot(w, [lons[i] for i in idxs]) / w.sum())
 
-        dominant_cat = Counter(categories[i] for i in idxs).most_common(1)[0][0]
+        dominant_cat = Counter(reports[m].category for m in members).most_common(1)[0][0]
         n_guides = sum(1 for i in idxs if roles[i] == "GUIDE")
         guide_ratio = n_guides / n_rep
         confidence = round(min(0.7, n_rep / 10) + guide_ratio * 0.3, 4)
         keywords = get_top_keywords(descriptions, idxs)
         severity = severity_from_confidence(confidence)
 
-        report_ids = [reports[i].id for i in idxs]
+        report_ids = [reports[m].id for m in members]
+        strength = membership_strength(idxs, cos_sim, in_reach, is_core)
+        membership = [float(strength[k]) for k, i in enumerate(idxs) for _ in groups[i]]
 
         clusters.append(
             {
@@ -147,48 +208,283 @@ def run_clustering_pipeline(reports_queryset) -> List[Dict[str, Any]]:
                 "confidence_score": confidence,
                 "top_keywords": keywords,
                 "severity": severity,
-                "report_count": n_rep,
+                "report_count": len(members),
+                "point_count": n_rep,
+                "membership": membership,
             }
         )
 
     return clusters
 
 
+def matching_active_cluster(report_ids, exclude=()):
+    """The ACTIVE cluster sharing the most of ``report_ids``, or None."""
+    return (
+        active_clusters()
+        .filter(reports__in=report_ids)
+        .exclude(pk__in=exclude)
+        .annotate(shared=Count("reports"))
+        .order_by("-shared", "-createdAt")
+        .first()
+    )
+
+
 def save_clusters_to_db(cluster_data_list: List[Dict]) -> List[IncidentCluster]:
+    """
+    Save a pipeline run. A cluster whose reports already sit in an ACTIVE
+    cluster updates that cluster (the one sharing most of them) instead of
+    adding a copy, so re-running over the same reports is idempotent and a
+    cluster keeps its alert. Returns the newly created clusters.
+    """
+    from reports.models import AlertBroadcast, Notification
+    from reports.hazards import refresh_hazards_near
+    from reports.notifications import bulk_notify
+    from reports.summaries import refresh_summary
+    from reports.suppression import (
+        suppress,
+        suppressing_alert_id,
+        suppression_keys,
+        update_suppressed_alert,
+    )
+
     created_clusters = []
+    saved_clusters = []
 
     for data in cluster_data_list:
-        cluster = IncidentCluster.objects.create(
-            center_latitude=data["center_latitude"],
-            center_longitude=data["center_longitude"],
-            dominant_category=data["dominant_category"],
-            confidence_score=data["confidence_score"],
-            top_keywords=data["top_keywords"],
-            is_alert_triggered=data["confidence_score"] >= 0.7
-            and data["report_count"] >= 3,
+        fields = {
+            "centerLatitude": data["center_latitude"],
+            "centerLongitude": data["center_longitude"],
+            "dominantCategory": data["dominant_category"],
+            "confidenceScore": data["confidence_score"],
+            "topKeywords": data["top_keywords"],
+        }
+        alert_triggered = data["confidence_score"] >= 0.7 and data["point_count"] >= 3
+
+        cluster = matching_active_cluster(
+            data["report_ids"], exclude=[c.pk for c in saved_clusters]
         )
+        if cluster is None:
+            cluster = IncidentCluster.objects.create(isAlertTriggered=alert_triggered, **fields)
+            created_clusters.append(cluster)
+        else:
+            for name, value in fields.items():
+                setattr(cluster, name, value)
+            cluster.isAlertTriggered = cluster.isAlertTriggered or alert_triggered
+            cluster.save(update_fields=[*fields, "isAlertTriggered"])
 
         cluster.reports.set(data["report_ids"])
-        created_clusters.append(cluster)
+        refresh_summary(cluster)
+        saved_clusters.append(cluster)
 
-        if cluster.is_alert_triggered:
-            from reports.models import AlertBroadcast, Notification
+        if alert_triggered:
+            message = f"Auto-alert: {data['dominant_category']} incident detected with {data['severity']} severity."
+            keys = suppression_keys(
+                cluster.centerLatitude, cluster.centerLongitude, cluster.dominantCategory
+            )
+            own_alert = (
+                AlertBroadcast.objects.filter(cluster=cluster)
+                .values_list("pk", "triggerType")
+                .first()
+            )
+            if own_alert is not None and own_alert[1] != "AUTO":
+                # Already broadcast by an admin; leave their alert alone
+                continue
+            alert_id = own_alert[0] if own_alert else suppressing_alert_id(keys)
+            if alert_id is not None and update_suppressed_alert(
+                alert_id, keys, cluster, data["severity"], message
+            ):
+                # Same incident as a live alert: updated, not re-broadcast
+                continue
 
             alert = AlertBroadcast.objects.create(
                 cluster=cluster,
-                message=f"Auto-alert: {data['dominant_category']} incident detected with {data['severity']} severity.",
+                message=message,
                 severity=data["severity"],
-                trigger_type="AUTO",
-                broadcasted_by=None,
+                triggerType="AUTO",
+                broadcastedBy=None,
             )
-
-            for report in cluster.reports.all():
-                Notification.objects.create(
-                    recipient=report.user,
-                    notification_type="AUTO_ALERT",
-                    title=f"Alert: {data['dominant_category'].replace('_', ' ').title()}",
+            suppress(keys[0], alert)
+
+            title = f"Alert: {data['dominant_category'].replace('_', ' ').title()}"
+            bulk_notify([
+                Notification(
+                    recipient_id=report.user_id,
+                    notificationType="AUTO_ALERT",
+                    title=title,
                     message=alert.message,
-                    incident_report=report,
+                    incidentReport=report,
                 )
+                for report in cluster.reports.only("id", "user")
+            ])
 
+    refresh_hazards_near(saved_clusters)
     return created_clusters
+
+
+def plan_windows(rows, now, min_hours=None, max_hours=None, budget=None):
+    """
+    Choose each region's clustering window from its recent report rate.
+
+    ``rows`` are (id, latitude, longitude, createdAt) newest first, covering
+    at least ``max_hours``. A region's window is the span holding its newest
+    ``budget`` reports, clamped to [min_hours, max_hours]: a storm shrinks
+    it, a quiet spell stretches it. If even ``min_hours`` holds more than
+    ``budget`` reports, only the newest ``budget`` are kept, so every
+    pipeline run is bounded.
+
+    ``margin`` holds the neighbours' selected reports within
+    REGION_MARGIN_KM of the region, so an incident straddling the edge is
+    seen whole from either side; run_clustering keeps a cluster only in the
+    region holding its centre.
+
+    Returns {region: {"windowHours", "available", "truncated", "ids", "margin"}}.
+    """
+    min_hours = min_hours or settings.CLUSTER_WINDOW_MIN_HOURS
+    max_hours = max_hours or settings.CLUSTER_WINDOW_MAX_HOURS
+    budget = budget or settings.CLUSTER_MAX_REPORTS_PER_REGION
+
+    by_region = defaultdict(list)
+    located = {}
+    for pk, lat, lon, created in rows:
+        if created >= now - timedelta(hours=max_hours):
+            by_region[region_for(lat, lon)].append((pk, created))
+            located[pk] = (lat, lon)
+
+    plan = {}
+    for region, items in by_region.items():
+        if len(items) <= budget:
+            window = max_hours
+        else:
+            # Age of the budget-th newest report
+            window = max(min_hours, (now - items[budget - 1][1]).total_seconds() / 3600)
+        cutoff = now - timedelta(hours=window)
+        in_window = [pk for pk, created in items if created >= cutoff]
+        plan[region] = {
+            "windowHours": round(window, 2),
+            "available": len(in_window),
+            "truncated": len(in_window) > budget,
+            "ids": in_window[:budget],
+            "margin": [],
+        }
+
+    for region, entry in plan.items():
+        for pk in entry["ids"]:
+            lat, lon = located[pk]
+            south, west, north, east = bbox_around(lat, lon, lat, lon, REGION_MARGIN_KM)
+            # The margin is far smaller than a region, so corners suffice
+            near = {region_for(a, b) for a in (south, north) for b in (west, east)}
+            for other in near - {region}:
+                if other in plan:
+                    plan[other]["margin"].append(pk)
+    return plan
+
+
+def plan_recent_reports(window_hours=None, bbox=None, now=None):
+    """plan_windows() over the open reports, optionally inside ``bbox``."""
+    now = now or timezone.now()
+    max_hours = window_hours or settings.CLUSTER_WINDOW_MAX_HOURS
+
+    qs = IncidentReport.objects.filter(
+        createdAt__gte=now - timedelta(hours=max_hours),
+        status__in=["PENDING", "VERIFIED", "AUTO_ALERTED"],
+    )
+    if bbox is not None:
+        south, west, north, east = bbox
+        qs = qs.filter(latitude__range=(south, north), longitude__range=(west, east))
+    rows = qs.order_by("-createdAt").values_list("id", "latitude", "longitude", "createdAt")
+    return plan_windows(rows, now, min_hours=window_hours, max_hours=window_hours)
+
+
+def run_clustering(window_hours=None, bbox=None, reason="") -> Dict[str, Any]:
+    """
+    Cluster recent open reports region by region and save the result.
+    ``bbox`` (south, west, north, east) limits the run to one area;
+    ``window_hours`` fixes the window instead of choosing it per region
+    (plan_windows). Each run is recorded as a ClusteringRun, and member
+    reports get their membership strength as confidenceScore (0 for the
+    other reports the run considered).
+    """
+    from reports.models import ClusteringRun
+
+    started = time.monotonic()
+    plan = plan_recent_reports(window_hours, bbox)
+
+    regions = []
+    scored = []
+    created_ids = []
+    considered = []
+    clustered_total = 0
+    for region, entry in sorted(plan.items()):
+        ids = entry.pop("ids")
+        margin = entry.pop("margin")
+        stats = {
+            "region": region,
+            **entry,
+            "reportCount": len(ids),
+            "clustersCreated": 0,
+            "noiseCount": len(ids),
+        }
+        regions.append(stats)
+        considered += ids
+        if not ids or len(ids) + len(margin) < MIN_CLUSTER_REPORTS:
+            continue
+
+        reports = list(
+            IncidentReport.objects.filter(pk__in=ids + margin).select_related("user")
+        )
+        found = run_clustering_pipeline(reports)
+        # A cluster reaching into the margin is the neighbour's if its centre is
+        clusters = [
+            c for c in found
+            if region_for(c["center_latitude"], c["center_longitude"]) == region
+        ]
+        created = save_clusters_to_db(clusters)
+        scored += clusters
+        own = set(ids)
+        clustered = sum(1 for c in found for pk in c["report_ids"] if pk in own)
+        stats.update(clustersCreated=len(created), noiseCount=len(ids) - clustered)
+        created_ids += [str(c.id) for c in created]
+        clustered_total += len(ids)
+
+    save_membership_scores(scored, considered)
+    ClusteringRun.objects.create(
+        reason=reason[:200],
+        bbox=list(bbox) if bbox is not None else None,
+        regions=regions,
+        reportCount=sum(r["reportCount"] for r in regions),
+        clustersCreated=len(created_ids),
+        durationMs=int((time.monotonic() - started) * 1000),
+    )
+
+    if not clustered_total:
+        return {
+            "skipped": True,
+            "reason": f"no region with {MIN_CLUSTER_REPORTS}+ recent reports",
+            "regions": regions,
+        }
+    return {
+        "skipped": False,
+        "clusters_created": created_ids,
+        "noise_count": sum(r["noiseCount"] for r in regions),
+        "regions": regions,
+    }
+
+
+def cluster_recent_reports(reason, bbox=None):
+    """run_clustering() for request/commit hooks: logs instead of raising."""
+    try:
+        result = run_clustering(bbox=bbox, reason=reason)
+    except Exception as exc:
+        # Never crash the HTTP request because clustering failed
+        logger.exception("Clustering failed after %s: %s", reason, exc)
+        return None
+
+    if result.get("skipped"):
+        logger.info("Clustering skipped: %s", result.get("reason"))
+    else:
+        logger.info(
+            "Clustering done — %d cluster(s) created, %d noise points.",
+            len(result.get("clusters_created", [])),
+            result.get("noise_count", 0),
+        )
+    return result
@@ -0,0 +1,197 @@
+"""
+Maintained report counters:
+
+    ReportDailyCount    (day, status, category)           — all-time totals
+    ReportHourlyRollup  (hour, status, category, region)  — time series
+
+    insert              → record_report_created()
+    bulk insert         → record_reports_created()
+    status change       → record_report_moved()
+    bulk status change  → record_reports_moved()
+    delete              → record_report_deleted()
+
+The IncidentReport signals in reports.signals call these for every .save()
+and .delete(); code that changes status with QuerySet.update() must call
+record_reports_moved() itself. reconcile_report_counts() rebuilds both
+tables from scratch if they ever drift.
+"""
+
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from reports.geo import region_for
+from reports.models import IncidentReport, ReportDailyCount, ReportHourlyRollup
+
+
+def _bump(model, key, delta):
+    if not delta:
+        return
+    with transaction.atomic():
+        if model.objects.filter(**key).update(count=F("count") + delta):
+            return
+        try:
+            with transaction.atomic():
+                model.objects.create(count=delta, **key)
+        except IntegrityError:
+            # Lost the race to create the row — it exists now
+            model.objects.filter(**key).update(count=F("count") + delta)
+
+
+def report_day(report):
+    return timezone.localdate(report.createdAt)
+
+
+def report_hour(created_at):
+    """Start of the local hour — keeps Kathmandu's :45 offset day-aligned."""
+    return timezone.localtime(created_at).replace(minute=0, second=0, microsecond=0)
+
+
+def _apply(report, status, category, delta):
+    _bump(
+        ReportDailyCount,
+        {"day": report_day(report), "status": status, "category": category},
+        delta,
+    )
+    _bump(
+        ReportHourlyRollup,
+        {
+            "hour": report_hour(report.createdAt),
+            "status": status,
+            "category": category,
+            "region": region_for(report.latitude, report.longitude),
+        },
+        delta,
+    )
+
+
+def record_report_created(report):
+    with transaction.atomic():
+        _apply(report, report.status, report.category, 1)
+
+
+def _bump_many(reports_and_deltas):
+    """Apply (report, status, category, delta) tuples with one bump per key."""
+    daily = Counter()
+    hourly = Counter()
+    for report, status, category, delta in reports_and_deltas:
+        daily[(report_day(report), status, category)] += delta
+        hourly[
+            (
+                report_hour(report.createdAt),
+                status,
+                category,
+                region_for(report.latitude, report.longitude),
+            )
+        ] += delta
+
+    with transaction.atomic():
+        for (day, status, category), n in daily.items():
+            _bump(ReportDailyCount, {"day": day, "status": status, "category": category}, n)
+        for (hour, status, category, region), n in hourly.items():
+            _bump(
+                ReportHourlyRollup,
+                {"hour": hour, "status": status, "category": category, "region": region},
+                n,
+            )
+
+
+def record_reports_created(reports):
+    """record_report_created() for a bulk_create batch — one bump per key."""
+    _bump_many((report, report.status, report.category, 1) for report in reports)
+
+
+def record_reports_moved(moves):
+    """
+    record_report_moved() for a QuerySet.update() batch. ``moves`` is
+    (report, old_status, old_category) with ``report`` holding the new values.
+    """
+    changes = []
+    for report, old_status, old_category in moves:
+        old_category = old_category or report.category
+        if (old_status, old_category) == (report.status, report.category):
+            continue
+        changes.append((report, old_status, old_category, -1))
+        changes.append((report, report.status, report.category, 1))
+    _bump_many(changes)
+
+
+def record_report_deleted(report):
+    with transaction.atomic():
+        _apply(report, report.status, report.category, -1)
+
+
+def record_report_moved(report, old_status, old_category=None):
+    old_category = old_category or report.category
+    if (old_status, old_category) == (report.status, report.category):
+        return
+    with transaction.atomic():
+        _apply(report, old_status, old_category, -1)
+        _apply(report, report.status, report.category, 1)
+
+
+def status_totals():
+    rows = dict(
+        ReportDailyCount.objects.values_list("status").annotate(n=Sum("count"))
+    )
+    return {code: rows.get(code) or 0 for code, _ in IncidentReport.STATUS_CHOICES}
+
+
+def category_totals():
+    """[{"category", "count"}] ordered by count, categories with no reports left out."""
+    return [
+        row
+        for row in ReportDailyCount.objects.values("category")
+        .annotate(count=Sum("count"))
+        .order_by("-count")
+        if row["count"]
+    ]
+
+
+def reconcile_report_counts():
+    """Rebuild ReportDailyCount and ReportHourlyRollup. Returns rows written."""
+    tz = timezone.get_current_timezone()
+    daily = (
+        IncidentReport.objects.annotate(day=TruncDate("createdAt", tzinfo=tz))
+        .values("day", "status", "category")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+
+    # Region keys are computed in Python, so the hourly table is built from a
+    # streamed pass over the five columns it needs.
+    hourly = Counter(
+        (report_hour(created_at), status, category, region_for(lat, lon))
+        for created_at, status, category, lat, lon in IncidentReport.objects.values_list(
+            "createdAt", "status", "category", "latitude", "longitude"
+        ).order_by().iterator(chunk_size=2000)
+    )
+
+    with transaction.atomic():
+        ReportDailyCount.objects.all().delete()
+        ReportHourlyRollup.objects.all().delete()
+        created = ReportDailyCount.objects.bulk_create(
+            [
+                ReportDailyCount(
+                    day=row["day"],
+                    status=row["status"],
+                    category=row["category"],
+                    count=row["n"],
+                )
+                for row in daily
+            ],
+            batch_size=1000,
+        )
+        created += ReportHourlyRollup.objects.bulk_create(
+            [
+                ReportHourlyRollup(
+                    hour=hour, status=status, category=category, region=region, count=n
+                )
+                for (hour, status, category, region), n in hourly.items()
+            ],
+            batch_size=1000,
+        )
+    return len(created)
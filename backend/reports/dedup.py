@@ -0,0 +1,89 @@
+"""
+Near-duplicate collapsing ahead of clustering.
+
+Each report gets a 64-bit SimHash of its description when it is saved
+(IncidentReport.descriptionSimhash). Before the TF-IDF/DBSCAN stages,
+reports are bucketed by (user, small geo cell, one 16-bit band of the
+signature); within a bucket, pairs whose signatures differ in at most
+DEDUP_MAX_HAMMING bits are merged. With 4 bands and a threshold of 3, any
+such pair shares at least one band, so no candidate pair is missed.
+
+Each group becomes one point for clustering, so a user resubmitting the
+same text from the same spot counts once as evidence and costs n² once.
+"""
+
+import hashlib
+from collections import Counter, defaultdict
+
+from reports.geo import region_for
+from reports.search import tokenize
+
+SIMHASH_BITS = 64
+DEDUP_BANDS = 4
+DEDUP_MAX_HAMMING = 3
+DEDUP_CELL_DEGREES = 0.01   # ~1 km
+
+_BAND_BITS = SIMHASH_BITS // DEDUP_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_SIGN_BIT = 1 << (SIMHASH_BITS - 1)
+
+
+def _feature_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(text):
+    """Signed 64-bit SimHash of ``text`` (fits a BigIntegerField)."""
+    totals = [0] * SIMHASH_BITS
+    for token, weight in Counter(tokenize(text)).items():
+        h = _feature_hash(token)
+        for bit in range(SIMHASH_BITS):
+            totals[bit] += weight if h >> bit & 1 else -weight
+
+    value = sum(1 << bit for bit, total in enumerate(totals) if total > 0)
+    return value - (1 << SIMHASH_BITS) if value & _SIGN_BIT else value
+
+
+def hamming(a, b):
+    return ((a ^ b) & ((1 << SIMHASH_BITS) - 1)).bit_count()
+
+
+def _signature(report):
+    if report.descriptionSimhash is not None:
+        return report.descriptionSimhash
+    # Rows saved before signatures existed
+    return simhash(report.description)
+
+
+def collapse_near_duplicates(reports):
+    """
+    Group near-duplicate reports. Returns a list of groups, each a list of
+    indexes into ``reports`` with the earliest-listed report first.
+    """
+    n = len(reports)
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    signatures = [_signature(r) for r in reports]
+    buckets = defaultdict(list)
+    for i, report in enumerate(reports):
+        cell = region_for(report.latitude, report.longitude, DEDUP_CELL_DEGREES)
+        for band in range(DEDUP_BANDS):
+            part = signatures[i] >> (band * _BAND_BITS) & _BAND_MASK
+            buckets[(report.user_id, cell, band, part)].append(i)
+
+    for members in buckets.values():
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                if find(i) != find(j) and hamming(signatures[i], signatures[j]) <= DEDUP_MAX_HAMMING:
+                    parent[max(find(i), find(j))] = min(find(i), find(j))
+
+    groups = defaultdict(list)
+    for i in range(n):
+        groups[find(i)].append(i)
+    return [groups[root] for root in sorted(groups)]
@@ -0,0 +1,258 @@
+"""
+Server-Sent Events fan-out for notifications and alerts.
+
+New Notification / AlertBroadcast rows are published here once their
+transaction commits; the SSE view in reports.views subscribes per connection.
+
+    publish_notification() / publish_alert()
+        → transaction.on_commit → get_broker().publish(event)
+        → every Subscription whose user matches (alerts go to everyone)
+
+Event ids are the row timestamp in microseconds, so a reconnecting client's
+Last-Event-ID can be replayed straight from the database (see replay_events).
+
+Browsers' EventSource cannot send an Authorization header, so clients first
+POST notifications/stream-ticket and connect with ``?ticket=``: a random,
+single-use value good for settings.REPORTS_EVENT_TICKET_SECONDS. Access
+tokens never appear in URLs or access logs.
+
+Backends (settings.REPORTS_EVENT_BROKER):
+    reports.events.InProcessBroker — single process, no extra services
+    reports.events.RedisBroker     — Redis pub/sub relay for multi-worker /
+                                     multi-node deployments
+"""
+
+import asyncio
+import json
+import logging
+import secrets
+import threading
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 15
+REPLAY_LIMIT = 200
+SUBSCRIPTION_QUEUE_SIZE = 100
+
+
+def event_id_for(dt):
+    return str(int(dt.timestamp() * 1_000_000))
+
+
+def parse_event_id(value):
+    """Last-Event-ID → aware datetime, or None if missing/garbage."""
+    try:
+        micros = int(value)
+    except (TypeError, ValueError):
+        return None
+    return datetime.fromtimestamp(micros / 1_000_000, tz=dt_timezone.utc)
+
+
+def format_sse(event):
+    data = json.dumps(event["data"], cls=DjangoJSONEncoder)
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+
+
+def notification_event(notification):
+    from reports.serializers import NotificationSerializer
+
+    return {
+        "id": event_id_for(notification.createdAt),
+        "event": "notification",
+        "recipient": str(notification.recipient_id),
+        "data": NotificationSerializer(notification).data,
+    }
+
+
+def alert_event(alert):
+    from reports.serializers import AlertBroadcastSerializer
+
+    return {
+        "id": event_id_for(alert.broadcastTime),
+        "event": "alert",
+        "recipient": None,  # alerts are visible to every signed-in user
+        "data": AlertBroadcastSerializer(alert).data,
+    }
+
+
+class Subscription:
+    """One connected client. Created and consumed on the event loop."""
+
+    def __init__(self, broker, user_id):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBSCRIPTION_QUEUE_SIZE)
+
+    def wants(self, event):
+        return event["recipient"] is None or event["recipient"] == self.user_id
+
+    def offer(self, event):
+        # Runs on self.loop. A slow client drops events rather than growing
+        # without bound; it can catch up by reconnecting with Last-Event-ID.
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("SSE queue full for user %s, dropping %s", self.user_id, event["id"])
+
+    async def get(self, timeout):
+        """Next event, or None if ``timeout`` seconds pass with nothing new."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    """Delivers events to subscribers living in this process only."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = set()
+
+    def subscribe(self, user_id):
+        subscription = Subscription(self, str(user_id))
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event):
+        self.deliver(event)
+
+    def deliver(self, event):
+        # publish() is called from sync views running in worker threads, so
+        # hand each event to the subscriber's own loop.
+        with self._lock:
+            targets = [s for s in self._subscriptions if s.wants(event)]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # loop already closed — connection is going away
+                self.unsubscribe(subscription)
+
+
+class RedisBroker(InProcessBroker):
+    """
+    Publishes through a Redis channel; a listener thread in every process
+    relays what it hears to that process's local subscribers.
+    """
+
+    def __init__(self):
+        super().__init__()
+        import redis
+
+        self._client = redis.Redis.from_url(settings.REPORTS_EVENT_REDIS_URL)
+        self._channel = settings.REPORTS_EVENT_CHANNEL
+        self._listener = None
+
+    def subscribe(self, user_id):
+        self._ensure_listener()
+        return super().subscribe(user_id)
+
+    def publish(self, event):
+        self._client.publish(self._channel, json.dumps(event, cls=DjangoJSONEncoder))
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._listener = threading.Thread(
+                target=self._listen, name="sse-redis-listener", daemon=True
+            )
+            self._listener.start()
+
+    def _listen(self):
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self._channel)
+        for message in pubsub.listen():
+            try:
+                self.deliver(json.loads(message["data"]))
+            except Exception:
+                logger.exception("Bad SSE event on %s", self._channel)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.REPORTS_EVENT_BROKER)()
+    return _broker
+
+
+def _ticket_key(ticket):
+    return f"events:ticket:{ticket}"
+
+
+def issue_stream_ticket(user):
+    """A fresh single-use ticket that opens one event stream as ``user``."""
+    ticket = secrets.token_urlsafe(32)
+    cache.set(_ticket_key(ticket), user.pk, settings.REPORTS_EVENT_TICKET_SECONDS)
+    return ticket
+
+
+def redeem_stream_ticket(ticket):
+    """User id the ticket was issued to, or None. A ticket redeems once."""
+    key = _ticket_key(ticket)
+    user_id = cache.get(key)
+    # delete() reports whether this caller removed it, so two racing
+    # redemptions cannot both succeed
+    if user_id is None or not cache.delete(key):
+        return None
+    return user_id
+
+
+def _publish_on_commit(event):
+    def send():
+        try:
+            get_broker().publish(event)
+        except Exception:
+            # Never fail the write because the push channel is down —
+            # clients recover the event via Last-Event-ID replay.
+            logger.exception("Failed to publish SSE event %s", event["id"])
+
+    transaction.on_commit(send)
+
+
+def publish_notification(notification):
+    _publish_on_commit(notification_event(notification))
+
+
+def publish_alert(alert):
+    _publish_on_commit(alert_event(alert))
+
+
+def replay_events(user, since, limit=REPLAY_LIMIT):
+    """Events the user missed after ``since``, oldest first."""
+    from reports.models import AlertBroadcast, Notification
+
+    notifications = Notification.objects.filter(
+        recipient=user, createdAt__gt=since
+    ).order_by("createdAt")[:limit]
+    alerts = AlertBroadcast.objects.select_related(
+        "cluster", "broadcastedBy"
+    ).filter(broadcastTime__gt=since).order_by("broadcastTime")[:limit]
+
+    events = [notification_event(n) for n in notifications]
+    events += [alert_event(a) for a in alerts]
+    events.sort(key=lambda e: int(e["id"]))
+    return events[:limit]
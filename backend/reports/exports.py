@@ -0,0 +1,181 @@
+"""
+Streaming CSV / GeoJSON exports for analysts.
+
+Rows are read with .values_list(...).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+(a server-side cursor on Postgres) and encoded one at a time into a
+StreamingHttpResponse, so worker memory stays flat however many rows match.
+Under ASGI the response gets stream_async(...) instead: Django would
+otherwise drain a sync iterator into memory before sending anything.
+
+    reports   IncidentReport   point = (latitude, longitude)
+    clusters  IncidentCluster  point = cluster centre
+    alerts    AlertBroadcast   point = its cluster's centre
+"""
+
+import csv
+import json
+from datetime import datetime, time, timedelta
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from reports.models import AlertBroadcast, IncidentCluster, IncidentReport
+
+EXPORT_CHUNK_SIZE = 2000
+# Encoded rows pulled per thread hop by stream_async()
+ASYNC_BATCH_ROWS = 500
+FORMATS = ("csv", "geojson")
+# Spreadsheets run cells starting with these as formulas; such text cells
+# are exported with a leading ' so they open as plain text
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# name → (queryset, date field, category field, [(column, lookup)], lat column, lon column)
+DATASETS = {
+    "reports": (
+        lambda: IncidentReport.objects.all(),
+        "createdAt",
+        "category",
+        [
+            ("id", "id"),
+            ("createdAt", "createdAt"),
+            ("category", "category"),
+            ("status", "status"),
+            ("description", "description"),
+            ("latitude", "latitude"),
+            ("longitude", "longitude"),
+            ("confidenceScore", "confidenceScore"),
+            ("userId", "user_id"),
+        ],
+        "latitude",
+        "longitude",
+    ),
+    "clusters": (
+        lambda: IncidentCluster.objects.all(),
+        "createdAt",
+        "dominantCategory",
+        [
+            ("id", "id"),
+            ("createdAt", "createdAt"),
+            ("dominantCategory", "dominantCategory"),
+            ("confidenceScore", "confidenceScore"),
+            ("isAlertTriggered", "isAlertTriggered"),
+            ("state", "state"),
+            ("reportCount", "reportCount"),
+            ("topKeywords", "topKeywords"),
+            ("centerLatitude", "centerLatitude"),
+            ("centerLongitude", "centerLongitude"),
+        ],
+        "centerLatitude",
+        "centerLongitude",
+    ),
+    "alerts": (
+        lambda: AlertBroadcast.objects.all(),
+        "broadcastTime",
+        "cluster__dominantCategory",
+        [
+            ("id", "id"),
+            ("broadcastTime", "broadcastTime"),
+            ("severity", "severity"),
+            ("triggerType", "triggerType"),
+            ("message", "message"),
+            ("clusterId", "cluster_id"),
+            ("dominantCategory", "cluster__dominantCategory"),
+            ("centerLatitude", "cluster__centerLatitude"),
+            ("centerLongitude", "cluster__centerLongitude"),
+        ],
+        "centerLatitude",
+        "centerLongitude",
+    ),
+}
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+
+
+def export_rows(dataset, since=None, until=None, category=None):
+    """
+    (column names, row iterator) for ``dataset``. ``since``/``until`` are
+    local dates, both inclusive.
+    """
+    queryset, date_field, category_field, columns, _, _ = DATASETS[dataset]
+    qs = queryset()
+    if since:
+        qs = qs.filter(**{f"{date_field}__gte": _day_start(since)})
+    if until:
+        qs = qs.filter(**{f"{date_field}__lt": _day_start(until + timedelta(days=1))})
+    if category:
+        qs = qs.filter(**{category_field: category})
+
+    names = [name for name, _ in columns]
+    rows = (
+        qs.order_by(date_field, "pk")
+        .values_list(*[lookup for _, lookup in columns])
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    return names, rows
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(names, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(names)
+    for row in rows:
+        yield writer.writerow([_csv_value(v) for v in row])
+
+
+def stream_geojson(dataset, names, rows):
+    lat_name, lon_name = DATASETS[dataset][4], DATASETS[dataset][5]
+    yield '{"type":"FeatureCollection","features":['
+    first = True
+    for row in rows:
+        properties = dict(zip(names, row))
+        lat = properties.pop(lat_name)
+        lon = properties.pop(lon_name)
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat]}
+            if lat is not None and lon is not None
+            else None,
+            "properties": properties,
+        }
+        yield ("" if first else ",") + json.dumps(feature, cls=DjangoJSONEncoder)
+        first = False
+    yield "]}"
+
+
+def _take(iterator, count):
+    return "".join(islice(iterator, count))
+
+
+async def stream_async(chunks, batch_rows=ASYNC_BATCH_ROWS):
+    """
+    Async wrapper around a stream_csv()/stream_geojson() generator. Each
+    batch is produced in the sync thread (thread_sensitive, so the DB cursor
+    stays on one connection) and yielded as soon as it is ready.
+    """
+    iterator = iter(chunks)
+    take = sync_to_async(_take, thread_sensitive=True)
+    while True:
+        data = await take(iterator, batch_rows)
+        if not data:
+            return
+        yield data
@@ -0,0 +1,40 @@
+"""
+Geographic helpers shared by rollups, aggregation and proximity queries.
+"""
+
+import math
+
+import numpy as np
+from django.conf import settings
+
+
+def region_for(latitude, longitude, size=None):
+    """
+    Key of the grid cell containing (latitude, longitude), e.g. "27.5:85.0".
+    Cells are ``size`` degrees square (settings.REPORTS_REGION_CELL_DEGREES).
+    """
+    size = size or settings.REPORTS_REGION_CELL_DEGREES
+    lat = math.floor(latitude / size) * size
+    lon = math.floor(longitude / size) * size
+    return f"{lat:g}:{lon:g}"
+
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.32
+
+
+def haversine_km_array(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; arguments broadcast like NumPy arrays."""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(d_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def bbox_around(south, west, north, east, km):
+    """(south, west, north, east) grown by ``km`` on every side."""
+    d_lat = km / KM_PER_DEGREE
+    widest = max(abs(south), abs(north)) + d_lat
+    d_lon = km / (KM_PER_DEGREE * max(math.cos(math.radians(min(widest, 89.0))), 0.01))
+    return south - d_lat, west - d_lon, north + d_lat, east + d_lon
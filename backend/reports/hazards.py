@@ -0,0 +1,177 @@
+"""
+Live hazard overlay for destinations.
+
+Each Destination carries a precomputed hazardScore (0–1) and the active
+clusters within settings.DESTINATION_HAZARD_RADIUS_KM (hazardClusters), so
+the destination list and detail read them straight off the row.
+
+    hazardScore = 1 − Π (1 − confidence × (1 − distance / radius))
+
+over the incidents in range: one close, confident cluster scores near 1,
+several weak or distant ones add up without exceeding it. Clusters are
+first grouped per incident — same dominant category, centres chained within
+clustering.GEO_RADIUS_KM — and only the strongest of each group counts, so
+overlapping clusters of one landslide neither inflate the score nor repeat
+in hazardClusters.
+
+The overlay is refreshed for the destinations near each batch of new
+clusters (save_clusters_to_db), in full after expired clusters are swept
+(manage.py expire_clusters), and for a destination when it is saved. The
+destinations near a point are found through a grid index over their
+coordinates, cached until a destination changes.
+"""
+
+from collections import defaultdict
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from sklearn.neighbors import BallTree
+
+from destinations.models import Destination
+from reports.clustering import GEO_RADIUS_KM
+from reports.geo import (
+    EARTH_RADIUS_KM,
+    KM_PER_DEGREE,
+    bbox_around,
+    haversine_km_array,
+    region_for,
+)
+from reports.lifecycle import active_clusters
+
+INDEX_CACHE_KEY = "destinations:hazard_index"
+
+
+def _cell_degrees():
+    return settings.DESTINATION_HAZARD_RADIUS_KM / KM_PER_DEGREE
+
+
+def destination_index():
+    """{grid cell: [(id, lat, lon), ...]} over all destinations, cached."""
+    index = cache.get(INDEX_CACHE_KEY)
+    if index is None:
+        size = _cell_degrees()
+        index = defaultdict(list)
+        for pk, lat, lon in Destination.objects.values_list("id", "latitude", "longitude"):
+            index[region_for(lat, lon, size)].append((pk, lat, lon))
+        index = dict(index)
+        cache.set(INDEX_CACHE_KEY, index, None)
+    return index
+
+
+def invalidate_destination_index():
+    cache.delete(INDEX_CACHE_KEY)
+
+
+def destinations_near(points):
+    """Ids of destinations within the hazard radius of any (lat, lon) point."""
+    index = destination_index()
+    size = _cell_degrees()
+    radius = settings.DESTINATION_HAZARD_RADIUS_KM
+    found = set()
+    for lat, lon in points:
+        south, west, north, east = bbox_around(lat, lon, lat, lon, radius)
+        # Cells are `size` degrees tall; longitude spans can cover several
+        for cell_lat in np.arange(south, north + size, size):
+            for cell_lon in np.arange(west, east + size, size):
+                for pk, d_lat, d_lon in index.get(region_for(cell_lat, cell_lon, size), ()):
+                    if pk not in found and haversine_km_array(lat, lon, d_lat, d_lon) <= radius:
+                        found.add(pk)
+    return found
+
+
+def _incidents(c_lat, c_lon, categories):
+    """Incident label per cluster: same category, centres within GEO_RADIUS_KM."""
+    categories = np.asarray(categories)
+    points = np.radians(np.column_stack([c_lat, c_lon]))
+    neighbours = BallTree(points, metric="haversine").query_radius(
+        points, r=GEO_RADIUS_KM / EARTH_RADIUS_KM
+    )
+    rows = np.repeat(np.arange(len(neighbours)), [len(n) for n in neighbours])
+    cols = np.concatenate(neighbours)
+    same = categories[rows] == categories[cols]
+    graph = csr_matrix(
+        (np.ones(same.sum()), (rows[same], cols[same])), shape=(len(c_lat), len(c_lat))
+    )
+    return connected_components(graph, directed=False)[1]
+
+
+def refresh_destination_hazards(destination_ids=None):
+    """
+    Recompute the overlay for ``destination_ids`` (all destinations when
+    None). Returns the number of destinations written.
+    """
+    qs = Destination.objects.only("id", "latitude", "longitude")
+    if destination_ids is not None:
+        if not destination_ids:
+            return 0
+        qs = qs.filter(pk__in=destination_ids)
+    destinations = list(qs)
+    if not destinations:
+        return 0
+
+    radius = settings.DESTINATION_HAZARD_RADIUS_KM
+    d_lat = np.array([d.latitude for d in destinations], dtype=np.float64)
+    d_lon = np.array([d.longitude for d in destinations], dtype=np.float64)
+    south, west, north, east = bbox_around(d_lat.min(), d_lon.min(), d_lat.max(), d_lon.max(), radius)
+    clusters = list(
+        active_clusters()
+        .filter(
+            centerLatitude__range=(south, north),
+            centerLongitude__range=(west, east),
+        )
+        .values_list("id", "centerLatitude", "centerLongitude", "confidenceScore", "dominantCategory")
+        .order_by()
+    )
+
+    now = timezone.now()
+    if clusters:
+        c_lat = np.array([c[1] for c in clusters], dtype=np.float64)
+        c_lon = np.array([c[2] for c in clusters], dtype=np.float64)
+        confidence = np.clip(np.array([c[3] for c in clusters], dtype=np.float64), 0.0, 1.0)
+        incident = _incidents(c_lat, c_lon, [c[4] for c in clusters])
+        # destinations × clusters
+        distance = haversine_km_array(d_lat[:, None], d_lon[:, None], c_lat[None, :], c_lon[None, :])
+        weight = np.where(distance <= radius, confidence * (1 - distance / radius), 0.0)
+        # destinations × incidents: the strongest cluster of each
+        strongest = np.zeros((len(destinations), incident.max() + 1))
+        np.maximum.at(strongest.T, incident, weight.T)
+        scores = 1 - np.prod(1 - strongest, axis=1)
+    else:
+        distance = weight = np.empty((len(destinations), 0))
+        incident = np.empty(0, dtype=int)
+        scores = np.zeros(len(destinations))
+
+    for i, destination in enumerate(destinations):
+        near = np.flatnonzero(distance[i] <= radius)
+        # One entry per incident: its strongest cluster, then by distance
+        near = near[np.lexsort((distance[i, near], -weight[i, near]))]
+        picked = {}
+        for j in near:
+            picked.setdefault(incident[j], j)
+        near = sorted(picked.values(), key=lambda j: distance[i, j])
+        destination.hazardScore = round(float(scores[i]), 4)
+        destination.hazardClusters = [
+            {
+                "id": str(clusters[j][0]),
+                "dominantCategory": clusters[j][4],
+                "confidenceScore": clusters[j][3],
+                "distanceKm": round(float(distance[i, j]), 2),
+            }
+            for j in near
+        ]
+        destination.hazardUpdatedAt = now
+
+    Destination.objects.bulk_update(
+        destinations, ["hazardScore", "hazardClusters", "hazardUpdatedAt"], batch_size=500
+    )
+    return len(destinations)
+
+
+def refresh_hazards_near(clusters):
+    """Refresh the destinations within range of newly saved or deleted ``clusters``."""
+    points = [(c.centerLatitude, c.centerLongitude) for c in clusters]
+    return refresh_destination_hazards(destinations_near(points)) if points else 0
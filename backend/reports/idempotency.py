@@ -0,0 +1,177 @@
+"""
+Idempotency-Key support for create endpoints.
+
+A client that may retry (flaky mountain connections) sends the same
+``Idempotency-Key`` header with every attempt. The first attempt reserves
+the key in IdempotencyKey, runs the view and stores the 2xx response; later
+attempts within IDEMPOTENCY_KEY_TTL_SECONDS get that response back with
+``Idempotent-Replayed: true`` and the view never runs.
+
+    cache hit                 → replay, no DB work
+    row with stored response  → replay and re-warm the cache
+    row still in flight       → 409 (until its lease runs out)
+    same key, other request   → 422
+    view fails / non-2xx      → reservation dropped, client may retry
+
+An in-flight reservation only holds the key for
+IDEMPOTENCY_IN_FLIGHT_SECONDS; once the response is stored it lives for the
+full TTL. A worker that dies mid-request therefore blocks retries for the
+lease, not the replay window.
+
+Keys are scoped per user. Expired rows are removed by
+`manage.py purge_idempotency_keys`.
+"""
+
+import functools
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from reports.models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+def _cache_key(user_id, key):
+    return f"idempotency:{user_id}:{hashlib.sha256(key.encode()).hexdigest()}"
+
+
+def request_fingerprint(request):
+    """Hash of method, path, form/JSON fields and uploaded file names/sizes."""
+    if hasattr(request.data, "lists"):
+        data = {k: v for k, v in request.data.lists() if k not in request.FILES}
+    else:
+        data = request.data
+    files = {
+        name: [(f.name, f.size) for f in request.FILES.getlist(name)]
+        for name in request.FILES
+    }
+    payload = json.dumps(
+        [request.method, request.path, data, files],
+        sort_keys=True,
+        cls=DjangoJSONEncoder,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _replay(stored, fingerprint):
+    if stored["hash"] != fingerprint:
+        return Response(
+            {"detail": f"{HEADER} was already used for a different request."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return Response(stored["body"], status=stored["status"], headers={REPLAYED_HEADER: "true"})
+
+
+def _reserve(user, key, fingerprint, now):
+    """
+    Insert the in-flight row, leased for IDEMPOTENCY_IN_FLIGHT_SECONDS.
+    Returns (row, created); when not created, row is the existing live row.
+    """
+    lease_ends = now + timedelta(seconds=settings.IDEMPOTENCY_IN_FLIGHT_SECONDS)
+    for _ in range(2):
+        try:
+            with transaction.atomic():
+                row = IdempotencyKey.objects.create(
+                    user=user, key=key, requestHash=fingerprint, expiresAt=lease_ends
+                )
+            return row, True
+        except IntegrityError:
+            row = IdempotencyKey.objects.filter(user=user, key=key).first()
+            if row is not None and row.expiresAt > now:
+                return row, False
+            # Expired (or a lapsed lease) but not purged yet: drop it and try once more
+            IdempotencyKey.objects.filter(user=user, key=key, expiresAt__lte=now).delete()
+    return IdempotencyKey.objects.filter(user=user, key=key).first(), False
+
+
+def idempotent(view_method):
+    """Decorator for APIView.post() honouring the Idempotency-Key header."""
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key or not request.user.is_authenticated:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"detail": f"{HEADER} must be at most {MAX_KEY_LENGTH} characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fingerprint = request_fingerprint(request)
+        cache_key = _cache_key(request.user.pk, key)
+        stored = cache.get(cache_key)
+        if stored is not None:
+            return _replay(stored, fingerprint)
+
+        now = timezone.now()
+        row, created = _reserve(request.user, key, fingerprint, now)
+        if not created:
+            # row is None only if another retry took the key over and lost
+            # it again in between; that client can simply retry too
+            if row is None or row.statusCode is None:
+                return Response(
+                    {"detail": f"A request with this {HEADER} is still in progress."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            stored = {"hash": row.requestHash, "status": row.statusCode, "body": row.responseBody}
+            ttl = int((row.expiresAt - now).total_seconds())
+            if ttl > 0:
+                cache.set(cache_key, stored, ttl)
+            return _replay(stored, fingerprint)
+
+        # By pk: if the lease lapsed and a retry took the key over, this
+        # request must not overwrite or drop the newer reservation
+        reservation = IdempotencyKey.objects.filter(pk=row.pk)
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except Exception:
+            reservation.delete()
+            raise
+
+        if not 200 <= response.status_code < 300:
+            reservation.delete()
+            return response
+
+        body = json.loads(json.dumps(response.data, cls=DjangoJSONEncoder))
+        stored = reservation.update(
+            statusCode=response.status_code,
+            responseBody=body,
+            expiresAt=timezone.now() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS),
+        )
+        if stored:
+            cache.set(
+                cache_key,
+                {"hash": fingerprint, "status": response.status_code, "body": body},
+                settings.IDEMPOTENCY_KEY_TTL_SECONDS,
+            )
+        return response
+
+    return wrapper
+
+
+def purge_expired_keys(batch_size=1000, now=None):
+    """Delete expired IdempotencyKey rows in pk batches. Returns rows deleted."""
+    now = now or timezone.now()
+    total = 0
+    while True:
+        pks = list(
+            IdempotencyKey.objects.filter(expiresAt__lte=now)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return total
+        total += IdempotencyKey.objects.filter(pk__in=pks).delete()[0]
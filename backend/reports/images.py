@@ -0,0 +1,139 @@
+"""
+Report image pipeline.
+
+Uploads are stored as-is and the report starts with imageStatus=PENDING
+(NONE when it has no image, and the worker never sees it). The
+`process_report_images` worker then, per report:
+
+    open original → apply EXIF orientation → drop EXIF (GPS, device, ...)
+    → WebP renditions per settings.REPORT_IMAGE_RENDITIONS, largest first,
+      each downscaled from the previous one
+    → store under content-hash names, swap `image` for the "full" rendition,
+      delete the original upload
+
+Identical photos hash to the same files, so re-uploads and retries never
+write a rendition twice.
+"""
+
+import hashlib
+import logging
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps
+
+from reports.models import IncidentReport
+
+logger = logging.getLogger(__name__)
+
+RENDITION_DIR = "incident_images/renditions/"
+FULL_DIR = "incident_images/"
+
+
+def _load(field, max_edge):
+    field.open("rb")
+    try:
+        image = Image.open(field)
+        # Lets the JPEG decoder scale down by 1/2..1/8 while decoding
+        image.draft("RGB", (max_edge, max_edge))
+        image = ImageOps.exif_transpose(image)
+        image.load()
+    finally:
+        field.close()
+
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    image.info = {}
+    return image
+
+
+def _encode(image):
+    buf = BytesIO()
+    image.save(
+        buf,
+        "WEBP",
+        quality=settings.REPORT_IMAGE_WEBP_QUALITY,
+        method=4,
+        exif=b"",
+    )
+    return buf.getvalue()
+
+
+def _store(storage, directory, label, data):
+    digest = hashlib.sha256(data).hexdigest()[:32]
+    name = f"{directory}{digest}_{label}.webp"
+    if not storage.exists(name):
+        name = storage.save(name, ContentFile(data))
+    return name
+
+
+def render_report_image(report):
+    """Write the renditions for ``report.image``. Returns {label: storage name}."""
+    storage = report.image.storage
+    sizes = sorted(
+        settings.REPORT_IMAGE_RENDITIONS.items(), key=lambda item: item[1], reverse=True
+    )
+
+    current = _load(report.image, sizes[0][1])
+    names = {}
+    for label, edge in sizes:
+        current = current.copy()
+        current.thumbnail((edge, edge), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        directory = FULL_DIR if label == "full" else RENDITION_DIR
+        names[label] = _store(storage, directory, label, _encode(current))
+    return names
+
+
+def process_report_image(report):
+    """Render one report's image and record the result. Returns True on success."""
+    if not report.image:
+        IncidentReport.objects.filter(pk=report.pk).update(imageStatus="NONE")
+        return False
+
+    original = report.image.name
+    try:
+        names = render_report_image(report)
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        logger.warning("Image pipeline: report %s failed: %s", report.pk, exc)
+        IncidentReport.objects.filter(pk=report.pk).update(imageStatus="FAILED")
+        return False
+
+    # QuerySet.update: no post_save, so clustering/counters/search stay quiet
+    IncidentReport.objects.filter(pk=report.pk).update(
+        image=names["full"],
+        imageMedium=names["medium"],
+        imageThumbnail=names["thumbnail"],
+        imageStatus="READY",
+    )
+    if original != names["full"]:
+        storage = report.image.storage
+        transaction.on_commit(lambda: storage.delete(original))
+    return True
+
+
+def process_pending_images(batch_size=None):
+    """
+    Process one batch of PENDING report images. Returns (ready, failed).
+
+    Rows are locked with SKIP LOCKED so several workers can run side by side.
+    """
+    batch_size = batch_size or settings.REPORT_IMAGE_BATCH_SIZE
+    ready = failed = 0
+
+    with transaction.atomic():
+        batch = list(
+            IncidentReport.objects.select_for_update(skip_locked=True)
+            .filter(imageStatus="PENDING")
+            .exclude(image="")
+            .only("id", "image")
+            .order_by("createdAt")[:batch_size]
+        )
+        for report in batch:
+            if process_report_image(report):
+                ready += 1
+            else:
+                failed += 1
+
+    return ready, failed
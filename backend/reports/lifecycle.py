@@ -0,0 +1,49 @@
+"""
+Cluster lifecycle.
+
+A cluster is ACTIVE for settings.CLUSTER_ACTIVE_HOURS after it forms
+(IncidentCluster.expiresAt, set on first save). `manage.py expire_clusters`
+flips overdue rows to EXPIRED; until it runs, active_clusters() also hides
+them by expiresAt, so lists never show a stale incident.
+
+List endpoints and the overview read active_clusters(), which the partial
+index on state='ACTIVE' serves without touching historical rows.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from reports.models import IncidentCluster
+
+
+def cluster_expiry(start=None):
+    return (start or timezone.now()) + timedelta(hours=settings.CLUSTER_ACTIVE_HOURS)
+
+
+def active_clusters(now=None):
+    now = now or timezone.now()
+    return IncidentCluster.objects.filter(
+        Q(expiresAt__isnull=True) | Q(expiresAt__gt=now), state="ACTIVE"
+    )
+
+
+def expire_clusters(now=None):
+    """Move overdue ACTIVE clusters to EXPIRED. Returns the number moved."""
+    now = now or timezone.now()
+    return IncidentCluster.objects.filter(state="ACTIVE", expiresAt__lte=now).update(
+        state="EXPIRED"
+    )
+
+
+def refresh_report_counts(cluster_ids):
+    """Recount members and drop the (now stale) summary of each cluster."""
+    for cluster_id in cluster_ids:
+        IncidentCluster.objects.filter(pk=cluster_id).update(
+            reportCount=IncidentCluster.reports.through.objects.filter(
+                incidentcluster_id=cluster_id
+            ).count(),
+            summary={},
+        )
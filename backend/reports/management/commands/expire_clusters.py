@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+from reports.hazards import refresh_destination_hazards
+from reports.lifecycle import expire_clusters
+from reports.stats import invalidate_report_stats
+from reports.suppression import purge_expired_suppressions
+
+
+class Command(BaseCommand):
+    help = (
+        'Move clusters past their expiresAt out of the active set, refresh the '
+        'destination hazard overlay and drop expired alert suppressions'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep sweeping instead of exiting after one pass'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=60.0,
+            help='Seconds between sweeps (with --loop)'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            expired = expire_clusters()
+            if expired:
+                invalidate_report_stats()
+            # Full pass: also drops clusters that aged out before this sweep
+            refresh_destination_hazards()
+            purged = purge_expired_suppressions()
+            self.stdout.write(f'Expired {expired} cluster(s), {purged} alert suppression(s)')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
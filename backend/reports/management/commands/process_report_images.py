@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from reports.images import process_pending_images
+
+
+class Command(BaseCommand):
+    help = 'Strip EXIF from uploaded report images and write WebP thumbnail/medium renditions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling for new uploads instead of exiting when none are pending'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep between polls when nothing is pending (with --loop)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Reports claimed per batch (default: REPORT_IMAGE_BATCH_SIZE)'
+        )
+
+    def handle(self, *args, **options):
+        total_ready = total_failed = 0
+
+        while True:
+            ready, failed = process_pending_images(options['batch_size'])
+            total_ready += ready
+            total_failed += failed
+
+            if ready or failed:
+                self.stdout.write(f"Processed {ready}, failed {failed}")
+                continue
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Done — {total_ready} processed, {total_failed} failed'
+        ))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from reports.idempotency import purge_expired_keys
+
+
+class Command(BaseCommand):
+    help = 'Delete Idempotency-Key records past their replay window'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_keys(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired keys'))
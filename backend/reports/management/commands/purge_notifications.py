@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+from reports.retention import (
+    ARCHIVE_JSONL,
+    ARCHIVE_NONE,
+    ARCHIVE_TABLE,
+    purge_notifications,
+)
+
+
+class Command(BaseCommand):
+    help = 'Archive and delete notifications past their retention TTL'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--archive',
+            choices=[ARCHIVE_TABLE, ARCHIVE_JSONL, ARCHIVE_NONE],
+            default=ARCHIVE_TABLE,
+            help='Where expired rows go before deletion (default: table)'
+        )
+        parser.add_argument(
+            '--output',
+            help='Path of the .jsonl.gz file (required with --archive jsonl)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows archived and deleted per transaction'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count expired rows'
+        )
+
+    def handle(self, *args, **options):
+        if options['archive'] == ARCHIVE_JSONL and not options['output']:
+            raise CommandError('--output is required with --archive jsonl')
+
+        def progress(rows, elapsed):
+            if options['verbosity'] > 1:
+                self.stdout.write(f"  {rows} rows ({rows / max(elapsed, 1e-6):.0f} rows/s)")
+
+        result = purge_notifications(
+            archive=options['archive'],
+            jsonl_path=options['output'],
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+            on_batch=progress,
+        )
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f"{result['rows']} notifications would be purged"))
+            return
+
+        rate = result['rows'] / result['seconds'] if result['seconds'] else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Purged {result['rows']} notifications in {result['batches']} batches, "
+            f"{result['seconds']:.2f}s ({rate:.0f} rows/s)"
+        ))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from reports.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the report full-text search index (searchVector on Postgres, ReportSearchTerm elsewhere)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = rebuild_search_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total} reports'))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from reports.counters import reconcile_report_counts
+from reports.stats import invalidate_report_stats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the per-day status/category report counters from IncidentReport'
+
+    def handle(self, *args, **options):
+        rows = reconcile_report_counts()
+        invalidate_report_stats()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rows} counter rows'))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from reports.notifications import reconcile_unread_counts
+
+
+class Command(BaseCommand):
+    help = 'Rebuild per-user unread notification counters from the Notification table'
+
+    def handle(self, *args, **options):
+        counts = reconcile_unread_counts()
+        total = sum(counts.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'Reconciled {len(counts)} counters ({total} unread notifications)'
+        ))
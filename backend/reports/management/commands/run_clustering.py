@@ -1,8 +1,8 @@
+import time
+
 from django.core.management.base import BaseCommand
-from django.utils import timezone
-from datetime import timedelta
 from reports.models import IncidentReport
-from reports.clustering import run_clustering_pipeline, save_clusters_to_db
+from reports.clustering import plan_recent_reports, run_clustering, run_clustering_pipeline
 
 
 class Command(BaseCommand):
@@ -12,36 +12,58 @@ class Command(BaseCommand):
         parser.add_argument(
             '--window',
             type=int,
-            default=3,
-            help='Time window in hours'
+            default=None,
+            help='Fixed time window in hours (default: chosen per region)'
         )
         parser.add_argument(
             '--dry-run',
             action='store_true',
             help='Show results without saving'
         )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep clustering instead of exiting after one pass'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=300.0,
+            help='Seconds between passes (with --loop)'
+        )
 
     def handle(self, *args, **options):
+        # Spiking regions are clustered as reports arrive (reports.spikes);
+        # this periodic pass picks up incidents that build slowly
+        while True:
+            self.run_once(options)
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+    def run_once(self, options):
         window_hours = options['window']
-        cutoff = timezone.now() - timedelta(hours=window_hours)
-        
-        reports = IncidentReport.objects.filter(
-            created_at__gte=cutoff,
-            status__in=['PENDING', 'VERIFIED', 'AUTO_ALERTED']
-        ).select_related('user')
-        
-        if not reports.exists():
+
+        if not options['dry_run']:
+            result = run_clustering(window_hours, reason='manage.py run_clustering')
+            for r in result['regions']:
+                self.stdout.write(
+                    f"Region {r['region']}: {r['reportCount']} reports over {r['windowHours']}h"
+                    + (f" (newest of {r['available']})" if r['truncated'] else '')
+                )
+            if result['skipped']:
+                self.stdout.write(self.style.WARNING(result['reason']))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"Created {len(result['clusters_created'])} clusters"))
+            return
+
+        plan = plan_recent_reports(window_hours)
+        if not plan:
             self.stdout.write(self.style.WARNING('No reports found'))
             return
-        
-        self.stdout.write(f"Processing {reports.count()} reports...")
-        
-        clusters = run_clustering_pipeline(reports)
-        
-        if options['dry_run']:
-            for c in clusters:
+
+        for region, entry in sorted(plan.items()):
+            self.stdout.write(f"Region {region}: processing {len(entry['ids'])} reports over {entry['windowHours']}h...")
+            reports = IncidentReport.objects.filter(pk__in=entry['ids']).select_related('user')
+            for c in run_clustering_pipeline(reports):
                 self.stdout.write(f"Cluster: {c['dominant_category']} at ({c['center_latitude']:.4f}, {c['center_longitude']:.4f}) - {c['report_count']} reports")
-            return
-        
-        created = save_clusters_to_db(clusters)
-        self.stdout.write(self.style.SUCCESS(f'Created {len(created)} clusters'))
\ No newline at end of file
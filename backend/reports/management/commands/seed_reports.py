@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
 from reports.models import IncidentReport, IncidentCluster, AlertBroadcast, Notification
 from accounts.models import User
+from reports.counters import reconcile_report_counts
+from reports.search import rebuild_search_index
 
 
 class Command(BaseCommand):
@@ -53,14 +55,17 @@ class Command(BaseCommand):
             IncidentReport(user=U["guide.pemba@gmail.com"],  description="Tourist injured Everest Base Camp altitude sickness medical evacuation helicopter",  category="MEDICAL",   latitude=27.9881, longitude=86.9250, status="PENDING"),
             IncidentReport(user=U["sita.thapa@gmail.com"],   description="Wild leopard spotted Chitwan village forest department wildlife danger warning",     category="WILDLIFE",  latitude=27.5291, longitude=84.3542, status="PENDING"),
         ])
+        # bulk_create skips the counter and search-index signals
+        reconcile_report_counts()
+        rebuild_search_index()
         self.stdout.write(f'✅ Created 12 reports — PENDING: {IncidentReport.objects.filter(status="PENDING").count()}')
 
         from reports.clustering import run_clustering
-        result = run_clustering()
+        result = run_clustering(reason='manage.py seed_reports')
 
         self.stdout.write(f'Clusters : {len(result.get("clusters_created", []))}')
         self.stdout.write(f'Noise    : {result.get("noise_count")}')
-        for c in result.get('clusters_created', []):
-            self.stdout.write(f'  [{c["category"]}] {c["report_count"]} reports | {c["severity"]}')
+        for c in IncidentCluster.objects.filter(pk__in=result.get('clusters_created', [])):
+            self.stdout.write(f'  [{c.dominantCategory}] {c.reportCount} reports | {c.confidenceScore}')
         self.stdout.write(f'DB clusters : {IncidentCluster.objects.count()}')
         self.stdout.write(f'DB alerts   : {AlertBroadcast.objects.count()}')
@@ -0,0 +1,172 @@
+"""
+Pre-aggregated map grid for the admin and tourist safety maps.
+
+The viewport bbox is split into square tiles of 360 / 2**zoom degrees; each
+tile is split into REPORTS_MAP_CELLS_PER_TILE² cells and aggregated with
+np.histogram2d over coordinate arrays cached for the current time bucket:
+
+    reports  → count + centroid per cell (REJECTED excluded)
+    clusters → count per cell
+
+Tiles are cached per (tile, zoom, time bucket, filters), so panning only
+computes the tiles that scrolled into view. Time buckets are
+REPORTS_MAP_CACHE_SECONDS long; data is at most that stale.
+"""
+
+import math
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from reports.models import IncidentCluster, IncidentReport
+
+MAX_ZOOM = 18
+
+CATEGORY_CODES = {
+    code: i for i, (code, _) in enumerate(IncidentReport.CATEGORY_CHOICES)
+}
+
+
+def time_bucket(now=None):
+    now = now or timezone.now()
+    return int(now.timestamp() // settings.REPORTS_MAP_CACHE_SECONDS)
+
+
+def _bucket_start(bucket):
+    return bucket * settings.REPORTS_MAP_CACHE_SECONDS
+
+
+def _cached_arrays(key, rows):
+    """lat, lon, createdAt epoch and category code arrays, cached for one bucket."""
+    arrays = cache.get(key)
+    if arrays is None:
+        rows = list(rows)
+        arrays = {
+            "lat": np.array([r[0] for r in rows], dtype=np.float64),
+            "lon": np.array([r[1] for r in rows], dtype=np.float64),
+            "ts": np.array([r[2].timestamp() for r in rows], dtype=np.float64),
+            "cat": np.array([CATEGORY_CODES.get(r[3], -1) for r in rows], dtype=np.int8),
+        }
+        cache.set(key, arrays, settings.REPORTS_MAP_CACHE_SECONDS)
+    return arrays
+
+
+def _report_arrays(bucket):
+    since = timezone.now() - timedelta(hours=settings.REPORTS_MAP_MAX_HOURS)
+    return _cached_arrays(
+        f"reports:map:report_arrays:{bucket}",
+        IncidentReport.objects.exclude(status="REJECTED")
+        .filter(createdAt__gte=since)
+        .values_list("latitude", "longitude", "createdAt", "category")
+        .order_by(),
+    )
+
+
+def _cluster_arrays(bucket):
+    since = timezone.now() - timedelta(hours=settings.REPORTS_MAP_MAX_HOURS)
+    return _cached_arrays(
+        f"reports:map:cluster_arrays:{bucket}",
+        IncidentCluster.objects.filter(createdAt__gte=since)
+        .values_list("centerLatitude", "centerLongitude", "createdAt", "dominantCategory")
+        .order_by(),
+    )
+
+
+def tile_degrees(zoom):
+    return 360.0 / (2 ** zoom)
+
+
+def tile_range(west, south, east, north, zoom):
+    """Inclusive tile bounds (x0, x1, y0, y1) of the bbox."""
+    size = tile_degrees(zoom)
+    x0 = math.floor((west + 180) / size)
+    x1 = math.floor((min(east, 179.999999) + 180) / size)
+    y0 = math.floor((south + 90) / size)
+    y1 = math.floor((min(north, 89.999999) + 90) / size)
+    return x0, x1, y0, y1
+
+
+def tile_count(west, south, east, north, zoom):
+    """Number of tiles tiles_for_bbox() would return, without building them."""
+    x0, x1, y0, y1 = tile_range(west, south, east, north, zoom)
+    return max(0, x1 - x0 + 1) * max(0, y1 - y0 + 1)
+
+
+def tiles_for_bbox(west, south, east, north, zoom):
+    """(x, y) of every tile intersecting the bbox."""
+    x0, x1, y0, y1 = tile_range(west, south, east, north, zoom)
+    return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+
+def _select(arrays, bounds, since_ts, category):
+    south, west, north, east = bounds
+    mask = (
+        (arrays["lat"] >= south) & (arrays["lat"] < north)
+        & (arrays["lon"] >= west) & (arrays["lon"] < east)
+        & (arrays["ts"] >= since_ts)
+    )
+    if category is not None:
+        mask &= arrays["cat"] == CATEGORY_CODES.get(category, -2)
+    return arrays["lat"][mask], arrays["lon"][mask]
+
+
+def _aggregate_tile(x, y, zoom, bucket, hours, category, report_arrays, cluster_arrays):
+    size = tile_degrees(zoom)
+    south, west = y * size - 90, x * size - 180
+    bounds = (south, west, south + size, west + size)
+    cells = settings.REPORTS_MAP_CELLS_PER_TILE
+    grid = [[bounds[0], bounds[2]], [bounds[1], bounds[3]]]
+    since_ts = _bucket_start(bucket) - hours * 3600
+
+    lat, lon = _select(report_arrays, bounds, since_ts, category)
+    counts, lat_edges, lon_edges = np.histogram2d(lat, lon, bins=cells, range=grid)
+    lat_sums, _, _ = np.histogram2d(lat, lon, bins=cells, range=grid, weights=lat)
+    lon_sums, _, _ = np.histogram2d(lat, lon, bins=cells, range=grid, weights=lon)
+
+    c_lat, c_lon = _select(cluster_arrays, bounds, since_ts, category)
+    cluster_counts, _, _ = np.histogram2d(c_lat, c_lon, bins=cells, range=grid)
+
+    result = []
+    for i, j in zip(*np.nonzero(counts + cluster_counts)):
+        n = int(counts[i, j])
+        cell_south, cell_north = lat_edges[i], lat_edges[i + 1]
+        cell_west, cell_east = lon_edges[j], lon_edges[j + 1]
+        result.append(
+            {
+                "latitude": float(lat_sums[i, j] / n) if n else float((cell_south + cell_north) / 2),
+                "longitude": float(lon_sums[i, j] / n) if n else float((cell_west + cell_east) / 2),
+                "reports": n,
+                "clusters": int(cluster_counts[i, j]),
+                "bounds": [float(cell_south), float(cell_west), float(cell_north), float(cell_east)],
+            }
+        )
+    return result
+
+
+def map_grid(west, south, east, north, zoom, hours, category=None):
+    """Aggregated cells for every tile in the bbox. Returns a list of cell dicts."""
+    bucket = time_bucket()
+    keys = {
+        (x, y): f"reports:map:tile:{zoom}:{x}:{y}:{bucket}:{hours}:{category or '*'}"
+        for x, y in tiles_for_bbox(west, south, east, north, zoom)
+    }
+    cached = cache.get_many(keys.values())
+
+    missing = [tile for tile, key in keys.items() if key not in cached]
+    if missing:
+        # Arrays are only fetched when some tile actually needs computing
+        report_arrays = _report_arrays(bucket)
+        cluster_arrays = _cluster_arrays(bucket)
+        fresh = {
+            keys[(x, y)]: _aggregate_tile(
+                x, y, zoom, bucket, hours, category, report_arrays, cluster_arrays
+            )
+            for x, y in missing
+        }
+        cache.set_many(fresh, settings.REPORTS_MAP_CACHE_SECONDS)
+        cached.update(fresh)
+
+    return [cell for key in keys.values() for cell in cached[key]]
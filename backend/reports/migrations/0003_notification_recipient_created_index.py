@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0002_alter_incidentreport_image'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'createdAt'], name='notif_recipient_created_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0004_unreadnotificationcounter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('notificationType', models.CharField(choices=[('NEW_INCIDENT', 'New Incident Reported'), ('CLUSTER_FORMED', 'Cluster Formed - Review Needed'), ('ALERT_BROADCAST', 'Alert Broadcasted'), ('REPORT_VERIFIED', 'Your Report Was Verified'), ('REPORT_REJECTED', 'Your Report Was Rejected'), ('AUTO_ALERT', 'Auto Alert Triggered')], max_length=50)),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField()),
+                ('incidentReportId', models.UUIDField(blank=True, null=True)),
+                ('isRead', models.BooleanField(default=False)),
+                ('createdAt', models.DateTimeField()),
+                ('archivedAt', models.DateTimeField(auto_now_add=True)),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archivedNotifications', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0005_archivednotification'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incidentreport',
+            index=models.Index(fields=['createdAt', 'id'], name='report_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='incidentreport',
+            index=models.Index(fields=['status', 'createdAt'], name='report_status_created_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:39
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def backfill_counts(apps, schema_editor):
+    IncidentReport = apps.get_model('reports', 'IncidentReport')
+    ReportDailyCount = apps.get_model('reports', 'ReportDailyCount')
+    rows = (
+        IncidentReport.objects.annotate(day=TruncDate('createdAt', tzinfo=timezone.get_current_timezone()))
+        .values('day', 'status', 'category')
+        .annotate(n=Count('id'))
+        .order_by()
+    )
+    ReportDailyCount.objects.bulk_create(
+        [
+            ReportDailyCount(day=r['day'], status=r['status'], category=r['category'], count=r['n'])
+            for r in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0006_incidentreport_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('VERIFIED', 'Verified'), ('REJECTED', 'Rejected'), ('AUTO_ALERTED', 'Auto Alerted')], max_length=20)),
+                ('category', models.CharField(choices=[('WEATHER', 'Weather'), ('LANDSLIDE', 'Landslide'), ('FLOOD', 'Flood'), ('ROAD_BLOCK', 'Road Block'), ('MEDICAL', 'Medical Emergency'), ('WILDLIFE', 'Wildlife'), ('OTHER', 'Other')], max_length=100)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'status', 'category'), name='report_daily_count_key')],
+            },
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:41
+
+import math
+from collections import Counter
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_rollup(apps, schema_editor):
+    IncidentReport = apps.get_model('reports', 'IncidentReport')
+    ReportHourlyRollup = apps.get_model('reports', 'ReportHourlyRollup')
+    size = settings.REPORTS_REGION_CELL_DEGREES
+
+    def region(lat, lon):
+        return f"{math.floor(lat / size) * size:g}:{math.floor(lon / size) * size:g}"
+
+    counts = Counter(
+        (
+            timezone.localtime(created_at).replace(minute=0, second=0, microsecond=0),
+            status,
+            category,
+            region(lat, lon),
+        )
+        for created_at, status, category, lat, lon in IncidentReport.objects.values_list(
+            'createdAt', 'status', 'category', 'latitude', 'longitude'
+        ).iterator()
+    )
+    ReportHourlyRollup.objects.bulk_create(
+        [
+            ReportHourlyRollup(hour=h, status=s, category=c, region=r, count=n)
+            for (h, s, c, r), n in counts.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0007_reportdailycount'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportHourlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('VERIFIED', 'Verified'), ('REJECTED', 'Rejected'), ('AUTO_ALERTED', 'Auto Alerted')], max_length=20)),
+                ('category', models.CharField(choices=[('WEATHER', 'Weather'), ('LANDSLIDE', 'Landslide'), ('FLOOD', 'Flood'), ('ROAD_BLOCK', 'Road Block'), ('MEDICAL', 'Medical Emergency'), ('WILDLIFE', 'Wildlife'), ('OTHER', 'Other')], max_length=100)),
+                ('region', models.CharField(max_length=32)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('hour', 'status', 'category', 'region'), name='report_hourly_rollup_key')],
+            },
+        ),
+        migrations.RunPython(backfill_rollup, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:42
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+POSTGRES_FORWARD = [
+    '''CREATE INDEX report_search_vector_gin
+           ON reports_incidentreport USING gin ("searchVector")''',
+    '''CREATE TRIGGER report_search_vector_update
+           BEFORE INSERT OR UPDATE OF description ON reports_incidentreport
+           FOR EACH ROW EXECUTE FUNCTION
+           tsvector_update_trigger('searchVector', 'pg_catalog.english', 'description')''',
+    '''UPDATE reports_incidentreport
+           SET "searchVector" = to_tsvector('pg_catalog.english', coalesce(description, ''))''',
+]
+
+POSTGRES_BACKWARD = [
+    'DROP TRIGGER IF EXISTS report_search_vector_update ON reports_incidentreport',
+    'DROP INDEX IF EXISTS report_search_vector_gin',
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0008_reporthourlyrollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentreport',
+            name='searchVector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='ReportSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('report', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='searchTerms', to='reports.incidentreport')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'report'], name='report_search_term_idx')],
+            },
+        ),
+        migrations.RunPython(
+            _run_on_postgres(POSTGRES_FORWARD),
+            _run_on_postgres(POSTGRES_BACKWARD),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0009_report_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentreport',
+            name='imageMedium',
+            field=models.ImageField(blank=True, upload_to='incident_images/renditions/'),
+        ),
+        migrations.AddField(
+            model_name='incidentreport',
+            name='imageStatus',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('READY', 'Ready'), ('FAILED', 'Failed')], default='PENDING', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='incidentreport',
+            name='imageThumbnail',
+            field=models.ImageField(blank=True, upload_to='incident_images/renditions/'),
+        ),
+        migrations.AddIndex(
+            model_name='incidentreport',
+            index=models.Index(fields=['imageStatus', 'createdAt'], name='report_image_status_idx'),
+        ),
+    ]
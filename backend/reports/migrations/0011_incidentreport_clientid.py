@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0010_report_image_renditions'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentreport',
+            name='clientId',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='incidentreport',
+            constraint=models.UniqueConstraint(fields=('user', 'clientId'), name='report_client_id_key'),
+        ),
+    ]
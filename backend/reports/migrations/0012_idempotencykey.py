@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0011_incidentreport_clientid'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255)),
+                ('requestHash', models.CharField(max_length=64)),
+                ('statusCode', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('responseBody', models.JSONField(blank=True, null=True)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('expiresAt', models.DateTimeField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='idempotencyKeys', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['expiresAt'], name='idempotency_expires_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'key'), name='idempotency_key_unique')],
+            },
+        ),
+    ]
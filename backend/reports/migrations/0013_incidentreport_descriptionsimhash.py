@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0012_idempotencykey'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentreport',
+            name='descriptionSimhash',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:55
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def backfill_lifecycle(apps, schema_editor):
+    IncidentCluster = apps.get_model('reports', 'IncidentCluster')
+    lifetime = timedelta(hours=settings.CLUSTER_ACTIVE_HOURS)
+    now = timezone.now()
+
+    clusters = list(IncidentCluster.objects.annotate(n=Count('reports')))
+    for cluster in clusters:
+        cluster.reportCount = cluster.n
+        cluster.expiresAt = cluster.createdAt + lifetime
+        cluster.state = 'ACTIVE' if cluster.expiresAt > now else 'EXPIRED'
+    IncidentCluster.objects.bulk_update(
+        clusters, ['reportCount', 'expiresAt', 'state'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0013_incidentreport_descriptionsimhash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentcluster',
+            name='expiresAt',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='incidentcluster',
+            name='reportCount',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='incidentcluster',
+            name='state',
+            field=models.CharField(choices=[('ACTIVE', 'Active'), ('EXPIRED', 'Expired')], default='ACTIVE', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='incidentcluster',
+            index=models.Index(condition=models.Q(('state', 'ACTIVE')), fields=['-createdAt'], name='cluster_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='incidentcluster',
+            index=models.Index(condition=models.Q(('state', 'ACTIVE')), fields=['expiresAt'], name='cluster_active_expiry_idx'),
+        ),
+        migrations.RunPython(backfill_lifecycle, migrations.RunPython.noop),
+    ]
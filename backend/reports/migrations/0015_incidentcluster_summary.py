@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0014_cluster_lifecycle'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentcluster',
+            name='summary',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0015_incidentcluster_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AlertSuppression',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=120, unique=True)),
+                ('detections', models.PositiveIntegerField(default=1)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('expiresAt', models.DateTimeField()),
+                ('alert', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='suppressions', to='reports.alertbroadcast')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['expiresAt'], name='alert_suppression_expires_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-19 13:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0016_alertsuppression'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incidentreport',
+            index=models.Index(fields=['latitude', 'longitude'], name='report_lat_lon_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-19 13:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0017_report_lat_lon_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incidentcluster',
+            index=models.Index(fields=['centerLatitude', 'centerLongitude'], name='cluster_center_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-19 13:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0018_cluster_center_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClusteringRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reason', models.CharField(blank=True, max_length=200)),
+                ('bbox', models.JSONField(blank=True, null=True)),
+                ('regions', models.JSONField(blank=True, default=list)),
+                ('reportCount', models.PositiveIntegerField(default=0)),
+                ('clustersCreated', models.PositiveIntegerField(default=0)),
+                ('durationMs', models.PositiveIntegerField(default=0)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-createdAt'],
+            },
+        ),
+    ]
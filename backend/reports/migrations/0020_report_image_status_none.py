@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-19 13:21
+
+from django.db import migrations, models
+
+
+def mark_reports_without_image(apps, schema_editor):
+    IncidentReport = apps.get_model('reports', 'IncidentReport')
+    IncidentReport.objects.filter(image='').exclude(imageStatus='READY').update(imageStatus='NONE')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0019_clusteringrun'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='incidentreport',
+            name='imageStatus',
+            field=models.CharField(choices=[('NONE', 'No image'), ('PENDING', 'Pending'), ('READY', 'Ready'), ('FAILED', 'Failed')], default='PENDING', max_length=10),
+        ),
+        migrations.RunPython(mark_reports_without_image, migrations.RunPython.noop),
+    ]
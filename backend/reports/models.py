@@ -1,4 +1,5 @@
 from django.db import models
+from django.contrib.postgres.search import SearchVectorField
 from accounts.models import User
 import uuid
 
@@ -23,16 +24,34 @@ class IncidentReport(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='incidentReports')
 
+    # Generated on the device; lets offline uploads be retried without duplicates
+    clientId = models.UUIDField(null=True, blank=True)
+
     description = models.TextField()
+    # 64-bit SimHash of description, set on save (reports.dedup)
+    descriptionSimhash = models.BigIntegerField(null=True, blank=True, editable=False)
     category = models.CharField(max_length=100, choices=CATEGORY_CHOICES, default='OTHER')
     image = models.ImageField(
         upload_to='incident_images/'
     )
 
+    # WebP renditions written by `manage.py process_report_images`
+    # (reports.images); `image` is swapped for an EXIF-free copy at the same time.
+    # Reports saved without an image are NONE and never queued.
+    IMAGE_STATUS_CHOICES = (
+        ('NONE', 'No image'),
+        ('PENDING', 'Pending'),
+        ('READY', 'Ready'),
+        ('FAILED', 'Failed'),
+    )
+    imageStatus = models.CharField(max_length=10, choices=IMAGE_STATUS_CHOICES, default='PENDING')
+    imageMedium = models.ImageField(upload_to='incident_images/renditions/', blank=True)
+    imageThumbnail = models.ImageField(upload_to='incident_images/renditions/', blank=True)
+
     latitude = models.FloatField()
     longitude = models.FloatField()
 
-    confidenceScore = models.FloatField(default=0.0)  # assigned by DBSCAN
+    confidenceScore = models.FloatField(default=0.0)  # cluster membership strength, set by each clustering run
 
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
     verifiedBy = models.ForeignKey(
@@ -46,10 +65,85 @@ class IncidentReport(models.Model):
 
     createdAt = models.DateTimeField(auto_now_add=True)
 
+    # Postgres only: filled by a DB trigger and GIN-indexed (migration 0009).
+    # Stays NULL elsewhere — see reports.search for the fallback index.
+    searchVector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['createdAt', 'id'], name='report_created_idx'),
+            models.Index(fields=['status', 'createdAt'], name='report_status_created_idx'),
+            models.Index(fields=['imageStatus', 'createdAt'], name='report_image_status_idx'),
+            models.Index(fields=['latitude', 'longitude'], name='report_lat_lon_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'clientId'], name='report_client_id_key'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # (status, category) as stored — lets the counter signal see transitions
+        instance._counted_as = (
+            instance.__dict__.get('status'),
+            instance.__dict__.get('category'),
+        )
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'description' in update_fields:
+            from reports.dedup import simhash
+            self.descriptionSimhash = simhash(self.description)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'descriptionSimhash'}
+        if self._state.adding and not self.image and self.imageStatus == 'PENDING':
+            self.imageStatus = 'NONE'
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.category} by {self.user.email} at ({self.latitude}, {self.longitude})"
 
 
+class ReportDailyCount(models.Model):
+    """
+    Maintained count of reports per (day, status, category), day in
+    settings.TIME_ZONE. Kept in step by reports.counters; rebuild with
+    `manage.py reconcile_report_counts`.
+    """
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=IncidentReport.STATUS_CHOICES)
+    category = models.CharField(max_length=100, choices=IncidentReport.CATEGORY_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'status', 'category'], name='report_daily_count_key'),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.status}/{self.category}: {self.count}"
+
+
+class ReportSearchTerm(models.Model):
+    """
+    Inverted index row: one (term, report) pair with its term frequency.
+    Used for report search on databases without full-text search (SQLite
+    test runs); Postgres uses IncidentReport.searchVector instead.
+    """
+    term = models.CharField(max_length=64)
+    report = models.ForeignKey(IncidentReport, on_delete=models.CASCADE, related_name='searchTerms')
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['term', 'report'], name='report_search_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.term} → {self.report_id}"
+
+
 class IncidentCluster(models.Model):
     """
     Created by DBSCAN when 3+ reports cluster together.
@@ -71,8 +165,44 @@ class IncidentCluster(models.Model):
 
     isAlertTriggered = models.BooleanField(default=False)
 
+    # Lifecycle: ACTIVE until expiresAt, then flipped to EXPIRED by
+    # `manage.py expire_clusters`. Lists only read the ACTIVE partial index.
+    STATE_CHOICES = (
+        ('ACTIVE', 'Active'),
+        ('EXPIRED', 'Expired'),
+    )
+    state = models.CharField(max_length=10, choices=STATE_CHOICES, default='ACTIVE')
+    expiresAt = models.DateTimeField(null=True, blank=True)
+
+    # Denormalized len(reports); kept by the m2m_changed signal
+    reportCount = models.PositiveIntegerField(default=0)
+
+    # Detail-view summary (reports.summaries); {} means rebuild on next read
+    summary = models.JSONField(default=dict, blank=True)
+
     createdAt = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['-createdAt'],
+                name='cluster_active_idx',
+                condition=models.Q(state='ACTIVE'),
+            ),
+            models.Index(
+                fields=['expiresAt'],
+                name='cluster_active_expiry_idx',
+                condition=models.Q(state='ACTIVE'),
+            ),
+            models.Index(fields=['centerLatitude', 'centerLongitude'], name='cluster_center_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.expiresAt is None:
+            from reports.lifecycle import cluster_expiry
+            self.expiresAt = cluster_expiry()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Cluster ({self.centerLatitude:.4f}, {self.centerLongitude:.4f}) - {self.confidenceScore:.2f} confidence"
 
@@ -140,8 +270,149 @@ class Notification(models.Model):
     isRead = models.BooleanField(default=False)
     createdAt = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        ordering = ['-createdAt']
+        indexes = [
+            models.Index(fields=['recipient', 'createdAt'], name='notif_recipient_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.notificationType} → {self.recipient.email}"
+
+class UnreadNotificationCounter(models.Model):
+    """
+    Denormalized per-user unread count so inbox polls don't COUNT(*).
+    Maintained by reports.notifications; missing rows are rebuilt lazily.
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='unreadNotificationCounter',
+    )
+    unread = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread} unread"
+
+
+class ReportHourlyRollup(models.Model):
+    """
+    Reports per local hour × status × category × region (a coarse lat/lon
+    cell, see reports.geo.region_for). Feeds the overview time series;
+    maintained alongside ReportDailyCount by reports.counters.
+    """
+    hour = models.DateTimeField()
+    status = models.CharField(max_length=20, choices=IncidentReport.STATUS_CHOICES)
+    category = models.CharField(max_length=100, choices=IncidentReport.CATEGORY_CHOICES)
+    region = models.CharField(max_length=32)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['hour', 'status', 'category', 'region'],
+                name='report_hourly_rollup_key',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.hour:%Y-%m-%d %H:00} {self.region} {self.status}/{self.category}: {self.count}"
+
+
+class ArchivedNotification(models.Model):
+    """
+    Cold copy of Notification rows removed by the retention purge
+    (manage.py purge_notifications). Never read by the API.
+    """
+    id = models.UUIDField(primary_key=True, editable=False)
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archivedNotifications')
+
+    notificationType = models.CharField(max_length=50, choices=Notification.NOTIFICATION_TYPE)
+    title = models.CharField(max_length=255)
+    message = models.TextField()
+    incidentReportId = models.UUIDField(null=True, blank=True)
+
+    isRead = models.BooleanField(default=False)
+    createdAt = models.DateTimeField()
+    archivedAt = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"[archived] {self.notificationType} → {self.recipient_id}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Stored outcome of a create request sent with an Idempotency-Key header,
+    so retries replay the first response instead of creating again. Cached
+    for the same TTL; see reports.idempotency.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='idempotencyKeys')
+    key = models.CharField(max_length=255)
+    requestHash = models.CharField(max_length=64)
+
+    # NULL while the first request is still being processed
+    statusCode = models.PositiveSmallIntegerField(null=True, blank=True)
+    responseBody = models.JSONField(null=True, blank=True)
+
+    createdAt = models.DateTimeField(auto_now_add=True)
+    expiresAt = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='idempotency_key_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['expiresAt'], name='idempotency_expires_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.key} ({self.user_id})"
+
+
+class AlertSuppression(models.Model):
+    """
+    Marks an AUTO alert as covering a (geo cell, category, time bucket) so
+    repeat detections of the same incident update it instead of raising and
+    fanning out a new one. Mirrored in the cache; see reports.suppression.
+    """
+    key = models.CharField(max_length=120, unique=True)
+    alert = models.ForeignKey(AlertBroadcast, on_delete=models.CASCADE, related_name='suppressions')
+    detections = models.PositiveIntegerField(default=1)
+
+    createdAt = models.DateTimeField(auto_now_add=True)
+    expiresAt = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['expiresAt'], name='alert_suppression_expires_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.key} → {self.alert_id}"
+
+
+class ClusteringRun(models.Model):
+    """
+    Telemetry for one clustering run: what triggered it and, per region, the
+    window the pipeline chose and how many reports it clustered. See
+    reports.clustering.run_clustering.
+    """
+    reason = models.CharField(max_length=200, blank=True)
+    # (south, west, north, east) for a regional run, null for a full pass
+    bbox = models.JSONField(null=True, blank=True)
+
+    # [{"region", "windowHours", "available", "reportCount", "truncated",
+    #   "clustersCreated", "noiseCount"}, ...]
+    regions = models.JSONField(default=list, blank=True)
+    reportCount = models.PositiveIntegerField(default=0)
+    clustersCreated = models.PositiveIntegerField(default=0)
+    durationMs = models.PositiveIntegerField(default=0)
+
+    createdAt = models.DateTimeField(auto_now_add=True)
+
     class Meta:
         ordering = ['-createdAt']
 
     def __str__(self):
-        return f"{self.notificationType} → {self.recipient.email}"
\ No newline at end of file
+        return f"Clustering run {self.createdAt:%Y-%m-%d %H:%M} ({self.reason or 'manual'})"
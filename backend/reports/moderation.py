@@ -0,0 +1,84 @@
+"""
+Bulk moderation: verify or reject many reports in one request.
+
+The selected rows are locked, changed with a single UPDATE ... WHERE id IN,
+and their authors notified through bulk_notify(). Reports already in the
+target state are left alone and reported as "unchanged".
+"""
+
+from django.db import transaction
+
+from reports.counters import record_reports_moved
+from reports.models import IncidentReport, Notification
+from reports.notifications import bulk_notify
+from reports.stats import invalidate_report_stats
+
+ACTIONS = {
+    "verify": "VERIFIED",
+    "reject": "REJECTED",
+}
+
+
+def _notification_for(report, new_status, reason):
+    if new_status == "VERIFIED":
+        return Notification(
+            recipient_id=report.user_id,
+            notificationType="REPORT_VERIFIED",
+            title="Report Verified",
+            message="Your incident report has been verified by an admin.",
+            incidentReport_id=report.pk,
+        )
+    return Notification(
+        recipient_id=report.user_id,
+        notificationType="REPORT_REJECTED",
+        title="Report Rejected",
+        message=f"Your incident report was rejected. Reason: {reason or 'N/A'}",
+        incidentReport_id=report.pk,
+    )
+
+
+def moderate_reports(admin, report_ids, action, reason=""):
+    """
+    Apply ``action`` ("verify" or "reject") to ``report_ids``.
+
+    Returns one {"id", "result"} per distinct id, in input order, where
+    result is "updated", "unchanged" or "not_found".
+    """
+    new_status = ACTIONS[action]
+    report_ids = list(dict.fromkeys(report_ids))
+
+    with transaction.atomic():
+        reports = list(
+            IncidentReport.objects.select_for_update()
+            .filter(pk__in=report_ids)
+            .only("id", "user", "status", "category", "createdAt", "latitude", "longitude")
+        )
+        changed = [r for r in reports if r.status != new_status]
+
+        if changed:
+            fields = {"status": new_status, "verifiedBy": admin}
+            if new_status == "REJECTED":
+                fields["rejectionReason"] = reason
+            IncidentReport.objects.filter(pk__in=[r.pk for r in changed]).update(**fields)
+
+            moves = []
+            for report in changed:
+                moves.append((report, report.status, report.category))
+                report.status = new_status
+            record_reports_moved(moves)
+
+            bulk_notify([_notification_for(r, new_status, reason) for r in changed])
+            transaction.on_commit(invalidate_report_stats)
+
+    found = {r.pk for r in reports}
+    updated = {r.pk for r in changed}
+    results = []
+    for pk in report_ids:
+        if pk in updated:
+            result = "updated"
+        elif pk in found:
+            result = "unchanged"
+        else:
+            result = "not_found"
+        results.append({"id": str(pk), "result": result})
+    return results
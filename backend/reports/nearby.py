@@ -0,0 +1,69 @@
+"""
+"Near me" queries: ?near=<lat>,<lon>&radius=<km>.
+
+Rows inside the bounding box of the circle are read as (pk, lat, lon) —
+the box is a range scan on the lat/lon indexes — then refined with an
+exact haversine in NumPy and sorted by distance. Only the requested page
+is loaded as full objects, one query, in distance order.
+"""
+
+import numpy as np
+from django.conf import settings
+
+from reports.geo import bbox_around, haversine_km_array
+
+
+def parse_near(params):
+    """
+    (lat, lon, radius km) from query params, None without ``near``. Raises
+    ValueError on malformed or out-of-range values.
+    """
+    near = params.get("near")
+    if not near:
+        return None
+    lat, lon = (float(v) for v in near.split(","))
+    radius = float(params.get("radius", settings.REPORTS_NEARBY_DEFAULT_RADIUS_KM))
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("near is out of range")
+    if not 0 < radius <= settings.REPORTS_NEARBY_MAX_RADIUS_KM:
+        raise ValueError("radius is out of range")
+    return lat, lon, radius
+
+
+def nearest(qs, lat_field, lon_field, lat, lon, radius_km):
+    """[(pk, distance km), ...] for rows of ``qs`` within the radius, nearest first."""
+    south, west, north, east = bbox_around(lat, lon, lat, lon, radius_km)
+    rows = list(
+        qs.filter(
+            **{
+                f"{lat_field}__range": (south, north),
+                f"{lon_field}__range": (west, east),
+            }
+        )
+        .values_list("pk", lat_field, lon_field)
+        .order_by()
+    )
+    if not rows:
+        return []
+
+    distance = haversine_km_array(
+        lat,
+        lon,
+        np.array([r[1] for r in rows], dtype=np.float64),
+        np.array([r[2] for r in rows], dtype=np.float64),
+    )
+    keep = np.flatnonzero(distance <= radius_km)
+    keep = keep[np.argsort(distance[keep], kind="stable")]
+    return [(rows[i][0], float(distance[i])) for i in keep]
+
+
+def load_in_order(qs, pairs):
+    """The objects for a page of nearest() pairs, in order, with .distanceKm set."""
+    objects = qs.in_bulk([pk for pk, _ in pairs])
+    page = []
+    for pk, distance in pairs:
+        obj = objects.get(pk)
+        if obj is not None:
+            obj.distanceKm = round(distance, 3)
+            page.append(obj)
+    return page
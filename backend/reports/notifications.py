@@ -0,0 +1,116 @@
+"""
+Notification helpers shared by views, clustering and management commands.
+
+Every path that creates or reads notifications goes through here so the
+per-user UnreadNotificationCounter stays in step with the Notification table:
+
+    single create        → post_save signal → increment_unread() + SSE push
+    fan-out              → bulk_notify()    → increment_unread() + SSE push
+    mark one read        → decrement_unread()
+    mark all read        → mark_all_read() (counter row locked)
+    delete / cascade     → post_delete signal → decrement_unread()
+    counter row missing  → reconcile_unread_counts() rebuilds it from the DB
+"""
+
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+
+from accounts.models import User
+from reports.events import publish_notification
+from reports.models import Notification, UnreadNotificationCounter
+
+
+def increment_unread(recipient_ids):
+    """Add one per occurrence of each recipient id in ``recipient_ids``."""
+    by_amount = defaultdict(list)
+    for user_id, n in Counter(recipient_ids).items():
+        by_amount[n].append(user_id)
+
+    for n, user_ids in by_amount.items():
+        UnreadNotificationCounter.objects.filter(user_id__in=user_ids).update(
+            unread=F("unread") + n
+        )
+
+
+def decrement_unread(user_id, n=1):
+    if n <= 0:
+        return
+    UnreadNotificationCounter.objects.filter(user_id=user_id).update(
+        unread=Greatest(F("unread") - n, Value(0))
+    )
+
+
+def mark_all_read(user_id):
+    """
+    Mark the user's notifications read and reset their counter. The counter
+    row stays locked until commit, so a notification created meanwhile
+    either is marked read here or increments the counter afterwards.
+    Returns the number of notifications marked.
+    """
+    with transaction.atomic():
+        list(UnreadNotificationCounter.objects.select_for_update().filter(user_id=user_id))
+        updated = Notification.objects.filter(recipient_id=user_id, isRead=False).update(
+            isRead=True
+        )
+        UnreadNotificationCounter.objects.filter(user_id=user_id).update(
+            unread=Notification.objects.filter(recipient_id=user_id, isRead=False).count()
+        )
+    return updated
+
+
+def reconcile_unread_counts(user_ids=None):
+    """
+    Recompute counters from the Notification table.
+
+    ``user_ids=None`` rebuilds every user. Returns {user_id: unread}.
+    """
+    unread = Notification.objects.filter(isRead=False)
+    if user_ids is None:
+        user_ids = list(User.objects.values_list("pk", flat=True))
+    else:
+        unread = unread.filter(recipient_id__in=user_ids)
+
+    counts = dict(
+        unread.order_by().values_list("recipient").annotate(n=Count("id"))
+    )
+    rows = [
+        UnreadNotificationCounter(user_id=uid, unread=counts.get(uid, 0))
+        for uid in user_ids
+    ]
+    UnreadNotificationCounter.objects.bulk_create(
+        rows,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=["unread"],
+    )
+    return {row.user_id: row.unread for row in rows}
+
+
+def unread_count(user):
+    """O(1) read of the user's unread counter, seeding it on first use."""
+    unread = (
+        UnreadNotificationCounter.objects.filter(user=user)
+        .values_list("unread", flat=True)
+        .first()
+    )
+    if unread is None:
+        unread = reconcile_unread_counts([user.pk])[user.pk]
+    return unread
+
+
+def bulk_notify(notifications, batch_size=500):
+    """
+    Insert many Notification rows at once and bump their recipients' counters.
+
+    bulk_create skips post_save, so fan-outs must come through here.
+    """
+    with transaction.atomic():
+        created = Notification.objects.bulk_create(notifications, batch_size=batch_size)
+        increment_unread(n.recipient_id for n in created if not n.isRead)
+        for notification in created:
+            publish_notification(notification)
+    return created
@@ -0,0 +1,37 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+
+
+class NotificationCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the notification inbox.
+
+    Pages are sliced on (createdAt, id) so fetching page N costs the same
+    as page 1 and no COUNT(*) is issued. Backed by the
+    (recipient, createdAt) index on Notification.
+    """
+    ordering = ("-createdAt", "-id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class ReportCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the admin report list, newest first on
+    (createdAt, id). Page size defaults to settings.REPORTS_PAGE_SIZE and can
+    be overridden per request with ``?page_size=``.
+    """
+    ordering = ("-createdAt", "-id")
+    page_size = settings.REPORTS_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.REPORTS_MAX_PAGE_SIZE
+
+
+class NearbyPagination(LimitOffsetPagination):
+    """
+    Offset pages over a distance-sorted list (reports.nearby). The list is
+    already cut to the search radius, so offsets stay small.
+    """
+    default_limit = settings.REPORTS_NEARBY_PAGE_SIZE
+    max_limit = settings.REPORTS_MAX_PAGE_SIZE
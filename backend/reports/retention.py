@@ -0,0 +1,133 @@
+"""
+Notification retention: archive then delete expired rows in small batches.
+
+A row expires when it is older than its type's TTL
+(settings.NOTIFICATION_RETENTION_DAYS) and has been read, or older than
+TTL + NOTIFICATION_UNREAD_GRACE_DAYS regardless of read state.
+
+Rows are walked in primary-key order, batch_size at a time; each batch is
+archived and deleted in its own short transaction so the purge never holds
+long locks on the live table.
+"""
+
+import gzip
+import json
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from reports.models import ArchivedNotification, Notification
+from reports.notifications import reconcile_unread_counts
+
+ARCHIVE_TABLE = "table"
+ARCHIVE_JSONL = "jsonl"
+ARCHIVE_NONE = "none"
+
+
+def expired_notifications(now=None):
+    now = now or timezone.now()
+    grace = timedelta(days=settings.NOTIFICATION_UNREAD_GRACE_DAYS)
+
+    expired = Q(pk__in=[])
+    for notification_type, days in settings.NOTIFICATION_RETENTION_DAYS.items():
+        cutoff = now - timedelta(days=days)
+        expired |= Q(notificationType=notification_type, isRead=True, createdAt__lt=cutoff)
+        expired |= Q(notificationType=notification_type, createdAt__lt=cutoff - grace)
+    return Notification.objects.filter(expired)
+
+
+def _archive_to_table(rows):
+    ArchivedNotification.objects.bulk_create(
+        [
+            ArchivedNotification(
+                id=n.pk,
+                recipient_id=n.recipient_id,
+                notificationType=n.notificationType,
+                title=n.title,
+                message=n.message,
+                incidentReportId=n.incidentReport_id,
+                isRead=n.isRead,
+                createdAt=n.createdAt,
+            )
+            for n in rows
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def _archive_to_jsonl(rows, path):
+    with gzip.open(path, "at", encoding="utf-8") as fh:
+        for n in rows:
+            fh.write(
+                json.dumps(
+                    {
+                        "id": n.pk,
+                        "recipient": n.recipient_id,
+                        "notificationType": n.notificationType,
+                        "title": n.title,
+                        "message": n.message,
+                        "incidentReport": n.incidentReport_id,
+                        "isRead": n.isRead,
+                        "createdAt": n.createdAt,
+                    },
+                    cls=DjangoJSONEncoder,
+                )
+                + "\n"
+            )
+
+
+def purge_notifications(
+    archive=ARCHIVE_TABLE,
+    jsonl_path=None,
+    batch_size=1000,
+    now=None,
+    dry_run=False,
+    on_batch=None,
+):
+    """
+    Archive and delete expired notifications.
+
+    Returns {"rows", "batches", "seconds"}. ``on_batch(rows_so_far, elapsed)``
+    is called after each batch for progress reporting.
+    """
+    if archive == ARCHIVE_JSONL and not jsonl_path:
+        raise ValueError("jsonl_path is required when archive='jsonl'.")
+
+    expired = expired_notifications(now).order_by("pk")
+    started = time.monotonic()
+    total = batches = 0
+
+    if dry_run:
+        return {"rows": expired.count(), "batches": 0, "seconds": 0.0}
+
+    last_pk = None
+    while True:
+        batch = expired if last_pk is None else expired.filter(pk__gt=last_pk)
+        rows = list(batch[:batch_size])
+        if not rows:
+            break
+        last_pk = rows[-1].pk
+
+        if archive == ARCHIVE_JSONL:
+            _archive_to_jsonl(rows, jsonl_path)
+
+        with transaction.atomic():
+            if archive == ARCHIVE_TABLE:
+                _archive_to_table(rows)
+            Notification.objects.filter(pk__in=[n.pk for n in rows]).delete()
+
+        unread_owners = {n.recipient_id for n in rows if not n.isRead}
+        if unread_owners:
+            reconcile_unread_counts(list(unread_owners))
+
+        total += len(rows)
+        batches += 1
+        if on_batch:
+            on_batch(total, time.monotonic() - started)
+
+    return {"rows": total, "batches": batches, "seconds": time.monotonic() - started}
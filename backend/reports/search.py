@@ -0,0 +1,163 @@
+"""
+Full-text search over IncidentReport.description.
+
+    Postgres  → searchVector tsvector column, kept current by a DB trigger and
+                GIN-indexed (migration 0009); ranked with ts_rank.
+    elsewhere → ReportSearchTerm inverted index, written by the post_save
+                signal in reports.signals; ranked by summed term frequency.
+
+Both backends treat every query token as a prefix and require all tokens to
+match, so "landsl blo" finds "landslide blocked the road". Call
+filter_reports() to narrow a queryset without changing its ordering (the
+cursor-paginated list) and rank_reports() to order by relevance.
+"""
+
+import re
+from collections import Counter
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, Max, OuterRef, Q, Subquery, Sum, When
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from reports.models import IncidentReport, ReportSearchTerm
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+MAX_TERM_LENGTH = 64
+MAX_QUERY_TOKENS = 8
+SEARCH_CONFIG = "english"
+
+
+def tokenize(text):
+    return [
+        token[:MAX_TERM_LENGTH]
+        for token in TOKEN_RE.findall((text or "").lower())
+        if len(token) > 1 and token not in ENGLISH_STOP_WORDS
+    ]
+
+
+def _query_tokens(q):
+    # Dedupe while keeping order; the cap bounds the number of joins/ORs
+    return list(dict.fromkeys(tokenize(q)))[:MAX_QUERY_TOKENS]
+
+
+def _uses_postgres():
+    return connection.vendor == "postgresql"
+
+
+# ── Postgres ────────────────────────────────────────────────────────────────
+
+def _tsquery(tokens):
+    # Tokens are [a-z0-9]+ only, so they are safe to splice into a raw tsquery
+    return SearchQuery(
+        " & ".join(f"{token}:*" for token in tokens),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+# ── Inverted index fallback ─────────────────────────────────────────────────
+
+def _matching_terms(tokens):
+    """(report, score) rows for reports that contain every token as a prefix."""
+    any_token = Q()
+    for token in tokens:
+        any_token |= Q(term__startswith=token)
+
+    rows = ReportSearchTerm.objects.filter(any_token).values("report")
+    hits = {
+        f"hit_{i}": Max(
+            Case(When(term__startswith=token, then=1), default=0, output_field=IntegerField())
+        )
+        for i, token in enumerate(tokens)
+    }
+    return (
+        rows.annotate(score=Sum("weight"), **hits)
+        .filter(**{name: 1 for name in hits})
+        .order_by()
+    )
+
+
+def index_report(report):
+    """Replace the report's ReportSearchTerm rows. No-op on Postgres."""
+    return index_reports([report])
+
+
+def index_reports(reports):
+    """index_report() for many reports in one delete + one insert."""
+    if _uses_postgres():
+        return 0
+    rows = [
+        ReportSearchTerm(report_id=report.pk, term=term, weight=min(n, 32767))
+        for report in reports
+        for term, n in Counter(tokenize(report.description)).items()
+    ]
+    with transaction.atomic():
+        ReportSearchTerm.objects.filter(report_id__in=[r.pk for r in reports]).delete()
+        ReportSearchTerm.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def rebuild_search_index(batch_size=1000):
+    """
+    Re-index every report. On Postgres this refreshes searchVector (normally
+    the trigger's job); elsewhere it rebuilds ReportSearchTerm. Returns the
+    number of reports processed.
+    """
+    if _uses_postgres():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'UPDATE reports_incidentreport SET "searchVector" = '
+                "to_tsvector('pg_catalog.english', coalesce(description, ''))"
+            )
+            return cursor.rowcount
+
+    total = 0
+    reports = IncidentReport.objects.only("id", "description").order_by("pk")
+    with transaction.atomic():
+        ReportSearchTerm.objects.all().delete()
+        batch = []
+        for report in reports.iterator(chunk_size=batch_size):
+            batch.extend(
+                ReportSearchTerm(report_id=report.pk, term=term, weight=min(n, 32767))
+                for term, n in Counter(tokenize(report.description)).items()
+            )
+            total += 1
+            if len(batch) >= batch_size:
+                ReportSearchTerm.objects.bulk_create(batch)
+                batch = []
+        ReportSearchTerm.objects.bulk_create(batch)
+    return total
+
+
+# ── Public API ──────────────────────────────────────────────────────────────
+
+def filter_reports(queryset, q):
+    """Reports in ``queryset`` matching every token of ``q``; order untouched."""
+    tokens = _query_tokens(q)
+    if not tokens:
+        return queryset.none()
+    if _uses_postgres():
+        return queryset.filter(searchVector=_tsquery(tokens))
+    return queryset.filter(pk__in=_matching_terms(tokens).values("report"))
+
+
+def rank_reports(queryset, q):
+    """filter_reports() plus a ``rank`` annotation, best match first."""
+    tokens = _query_tokens(q)
+    if not tokens:
+        return queryset.none()
+    if _uses_postgres():
+        query = _tsquery(tokens)
+        return (
+            queryset.filter(searchVector=query)
+            .annotate(rank=SearchRank("searchVector", query))
+            .order_by("-rank", "-createdAt")
+        )
+
+    scores = _matching_terms(tokens).filter(report=OuterRef("pk")).values("score")[:1]
+    return (
+        queryset.filter(pk__in=_matching_terms(tokens).values("report"))
+        .annotate(rank=Subquery(scores))
+        .order_by("-rank", "-createdAt")
+    )
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from reports.models import IncidentReport, IncidentCluster, AlertBroadcast, Notification
 
@@ -39,6 +40,8 @@ class IncidentReportReadSerializer(serializers.ModelSerializer):
     authorRole      = serializers.SerializerMethodField()
     confidenceScore = serializers.FloatField(read_only=True)
     createdAt       = serializers.DateTimeField(read_only=True)
+    imageMedium     = serializers.SerializerMethodField()
+    imageThumbnail  = serializers.SerializerMethodField()
 
     class Meta:
         model = IncidentReport
@@ -47,6 +50,8 @@ class IncidentReportReadSerializer(serializers.ModelSerializer):
             "description",
             "category",
             "image",
+            "imageMedium",
+            "imageThumbnail",
             "latitude",
             "longitude",
             "confidenceScore",
@@ -68,10 +73,24 @@ class IncidentReportReadSerializer(serializers.ModelSerializer):
     def get_authorRole(self, obj):
         return getattr(obj.user, "role", "USER")
 
+    # Renditions are written by the image worker; until then fall back to
+    # the original upload so clients always get a usable URL.
+    def _image_url(self, field):
+        if not field:
+            return None
+        request = self.context.get("request")
+        return request.build_absolute_uri(field.url) if request else field.url
+
+    def get_imageMedium(self, obj):
+        return self._image_url(obj.imageMedium or obj.image)
+
+    def get_imageThumbnail(self, obj):
+        return self._image_url(obj.imageThumbnail or obj.image)
+
 
 class IncidentClusterSerializer(serializers.ModelSerializer):
     status           = serializers.SerializerMethodField()
-    reportCount      = serializers.SerializerMethodField()
+    reportCount      = serializers.IntegerField(read_only=True)
     centerLatitude   = serializers.FloatField(read_only=True)
     centerLongitude  = serializers.FloatField(read_only=True)
     topKeywords      = serializers.ListField(read_only=True)
@@ -92,21 +111,40 @@ class IncidentClusterSerializer(serializers.ModelSerializer):
             "confidenceScore",
             "isAlertTriggered",
             "status",
+            "state",
+            "expiresAt",
             "createdAt",
         ]
 
     def get_status(self, obj):
         return "Verified" if obj.isAlertTriggered else "Possible"
 
-    def get_reportCount(self, obj):
-        return getattr(obj, "_report_count", None) or obj.reports.count()
-
 
 class IncidentClusterDetailSerializer(IncidentClusterSerializer):
-    reports = IncidentReportReadSerializer(many=True, read_only=True)
+    """
+    Cluster plus its precomputed summary and a few sample reports. The full
+    member list is paginated separately (clusters/<id>/reports).
+    """
+    summary       = serializers.SerializerMethodField()
+    sampleReports = serializers.SerializerMethodField()
 
     class Meta(IncidentClusterSerializer.Meta):
-        fields = IncidentClusterSerializer.Meta.fields + ["reports"]
+        fields = IncidentClusterSerializer.Meta.fields + ["summary", "sampleReports"]
+
+    def get_summary(self, obj):
+        from reports.summaries import ensure_summary
+        return ensure_summary(obj)
+
+    def get_sampleReports(self, obj):
+        from reports.summaries import ensure_summary
+        ids = ensure_summary(obj)["sampleReportIds"]
+        by_id = {
+            str(r.pk): r
+            for r in IncidentReport.objects.filter(pk__in=ids).select_related("user")
+        }
+        return IncidentReportReadSerializer(
+            [by_id[i] for i in ids if i in by_id], many=True, context=self.context
+        ).data
 
 
 class AlertBroadcastSerializer(serializers.ModelSerializer):
@@ -138,10 +176,11 @@ class AlertBroadcastSerializer(serializers.ModelSerializer):
 
 
 class NotificationSerializer(serializers.ModelSerializer):
+    """Slim inbox row — the related report is referenced by id only."""
     notificationType = serializers.CharField(read_only=True)
     isRead           = serializers.BooleanField(read_only=True)
     createdAt        = serializers.DateTimeField(read_only=True)
-    incidentReport   = IncidentReportReadSerializer(read_only=True)
+    incidentReportId = serializers.UUIDField(source="incidentReport_id", read_only=True)
 
     class Meta:
         model = Notification
@@ -152,5 +191,62 @@ class NotificationSerializer(serializers.ModelSerializer):
             "message",
             "isRead",
             "createdAt",
-            "incidentReport",
-        ]
\ No newline at end of file
+            "incidentReportId",
+        ]
+
+
+class NotificationExpandedSerializer(NotificationSerializer):
+    """Inbox row with the full report nested (``?expand=report``)."""
+    incidentReport = IncidentReportReadSerializer(read_only=True)
+
+    class Meta(NotificationSerializer.Meta):
+        fields = NotificationSerializer.Meta.fields + ["incidentReport"]
+
+
+class RouteSafetySerializer(serializers.Serializer):
+    """Either ``path`` ([[lat, lon], ...]) or ``destinations`` (slugs), in route order."""
+    path = serializers.ListField(
+        child=serializers.ListField(child=serializers.FloatField(), min_length=2, max_length=2),
+        required=False,
+        min_length=1,
+        max_length=settings.REPORTS_ROUTE_MAX_POINTS,
+    )
+    destinations = serializers.ListField(
+        child=serializers.SlugField(),
+        required=False,
+        min_length=1,
+        max_length=settings.REPORTS_ROUTE_MAX_POINTS,
+    )
+    radiusKm = serializers.FloatField(
+        required=False,
+        default=settings.REPORTS_ROUTE_DEFAULT_RADIUS_KM,
+        min_value=0.1,
+        max_value=settings.REPORTS_ROUTE_MAX_RADIUS_KM,
+    )
+    hours = serializers.IntegerField(
+        required=False,
+        default=settings.REPORTS_MAP_DEFAULT_HOURS,
+        min_value=1,
+        max_value=settings.REPORTS_MAP_MAX_HOURS,
+    )
+
+    def validate_path(self, value):
+        for lat, lon in value:
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                raise serializers.ValidationError("Coordinates are out of range.")
+        return value
+
+    def validate(self, attrs):
+        if ("path" in attrs) == ("destinations" in attrs):
+            raise serializers.ValidationError("Provide exactly one of path or destinations.")
+        return attrs
+
+
+class BulkModerationSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        min_length=1,
+        max_length=settings.REPORTS_MODERATION_MAX_IDS,
+    )
+    action = serializers.ChoiceField(choices=["verify", "reject"])
+    reason = serializers.CharField(required=False, allow_blank=True, default="")
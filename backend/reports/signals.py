@@ -1,9 +1,9 @@
 # incidents/signals.py
 """
-post_save on IncidentReport → run_clustering()
+post_save on IncidentReport → spike detector → regional run_clustering()
 
 The signal fires every time a new IncidentReport row is inserted.
-Only NEW reports trigger clustering (created=True guard).
+Only NEW reports are counted (created=True guard).
 
 For high-volume production, swap the direct call for a Celery task:
     from incidents.tasks import run_clustering_task
@@ -11,9 +11,12 @@ For high-volume production, swap the direct call for a Celery task:
 """
 
 import logging
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
 from django.dispatch import receiver
 
+from reports.spikes import observe_reports, possible_incident
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,31 +25,154 @@ def trigger_clustering_on_new_report(sender, instance, created, **kwargs):
     """
     Only runs on INSERT (created=True).
     Status updates (e.g. admin VERIFIED/REJECTED) do NOT re-trigger clustering.
+
+    The report feeds the spike detector; clustering runs here only when its
+    region spikes (see cluster_spiking_region). `run_clustering --loop`
+    covers the rest.
     """
     if not created:
         return
 
+    observe_reports([instance])
+
+
+@receiver(possible_incident)
+def cluster_spiking_region(sender, cell, category, bbox, fast, slow, **kwargs):
     logger.info(
-        'IncidentReport %s created by user %s — triggering clustering.',
-        instance.id,
-        instance.user_id,
+        'Possible %s incident in cell %s (%.1f recent vs %.1f baseline) — clustering region.',
+        category,
+        cell,
+        fast,
+        slow,
     )
 
-    try:
-        from reports.clustering import run_clustering
-        result = run_clustering()
-
-        if result.get('skipped'):
-            logger.info('Clustering skipped: %s', result.get('reason'))
-        else:
-            logger.info(
-                'Clustering done — %d cluster(s) created, %d noise points.',
-                len(result.get('clusters_created', [])),
-                result.get('noise_count', 0),
-            )
-
-    except Exception as exc:
-        # Never crash the HTTP request because clustering failed
-        logger.exception(
-            'Clustering failed after IncidentReport %s: %s', instance.id, exc
-        )
\ No newline at end of file
+    from reports.clustering import cluster_recent_reports
+    transaction.on_commit(
+        lambda: cluster_recent_reports(f'{category} spike in {cell}', bbox=bbox)
+    )
+
+
+@receiver(post_save, sender='reports.Notification')
+def bump_unread_counter_on_new_notification(sender, instance, created, **kwargs):
+    """
+    Keeps UnreadNotificationCounter in step with single-row creates.
+    bulk_create bypasses this — fan-outs use reports.notifications.bulk_notify.
+    """
+    if not created or instance.isRead:
+        return
+
+    from reports.notifications import increment_unread
+    increment_unread([instance.recipient_id])
+
+
+@receiver(post_save, sender='reports.Notification')
+def push_new_notification(sender, instance, created, **kwargs):
+    if not created:
+        return
+
+    from reports.events import publish_notification
+    publish_notification(instance)
+
+
+@receiver(post_save, sender='reports.AlertBroadcast')
+def push_new_alert(sender, instance, created, **kwargs):
+    if not created:
+        return
+
+    from reports.events import publish_alert
+    publish_alert(instance)
+
+
+@receiver(post_save, sender='reports.IncidentReport')
+@receiver(post_delete, sender='reports.IncidentReport')
+def invalidate_report_stats_on_change(sender, instance, **kwargs):
+    from reports.stats import invalidate_report_stats
+    transaction.on_commit(invalidate_report_stats)
+
+
+@receiver(post_save, sender='reports.IncidentReport')
+def maintain_report_counters_on_save(sender, instance, created, **kwargs):
+    from reports.counters import record_report_created, record_report_moved
+
+    if created:
+        record_report_created(instance)
+    else:
+        old_status, old_category = getattr(instance, '_counted_as', (None, None))
+        if old_status is not None:
+            record_report_moved(instance, old_status, old_category)
+    instance._counted_as = (instance.status, instance.category)
+
+
+@receiver(post_delete, sender='reports.IncidentReport')
+def maintain_report_counters_on_delete(sender, instance, **kwargs):
+    from reports.counters import record_report_deleted
+    record_report_deleted(instance)
+
+
+@receiver(post_save, sender='reports.IncidentReport')
+def index_report_for_search(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Keeps the ReportSearchTerm fallback index current. Postgres maintains
+    searchVector with a trigger, so index_report() returns straight away there.
+    """
+    if not created and update_fields is not None and 'description' not in update_fields:
+        return
+
+    from reports.search import index_report
+    index_report(instance)
+
+
+@receiver(m2m_changed, sender='reports.IncidentCluster_reports')
+def maintain_cluster_report_count(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keeps IncidentCluster.reportCount equal to its number of reports."""
+    if reverse and action == 'pre_clear':
+        # report.cluster.clear(): remember which clusters lose the report
+        instance._cleared_cluster_ids = list(instance.cluster.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    from reports.lifecycle import refresh_report_counts
+    if not reverse:
+        refresh_report_counts([instance.pk])
+    elif action == 'post_clear':
+        refresh_report_counts(getattr(instance, '_cleared_cluster_ids', []))
+    else:
+        refresh_report_counts(pk_set or [])
+
+
+@receiver(pre_delete, sender='reports.IncidentReport')
+def remember_report_clusters(sender, instance, **kwargs):
+    # The cascade removes the m2m rows without m2m_changed
+    instance._cleared_cluster_ids = list(instance.cluster.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender='reports.IncidentReport')
+def refresh_cluster_counts_on_report_delete(sender, instance, **kwargs):
+    cluster_ids = getattr(instance, '_cleared_cluster_ids', None)
+    if cluster_ids:
+        from reports.lifecycle import refresh_report_counts
+        refresh_report_counts(cluster_ids)
+
+
+@receiver(post_save, sender='destinations.Destination')
+def refresh_destination_hazard_overlay(sender, instance, **kwargs):
+    from reports.hazards import invalidate_destination_index, refresh_destination_hazards
+    invalidate_destination_index()
+    refresh_destination_hazards([instance.pk])
+
+
+@receiver(post_delete, sender='destinations.Destination')
+def drop_destination_from_hazard_index(sender, instance, **kwargs):
+    from reports.hazards import invalidate_destination_index
+    invalidate_destination_index()
+
+
+@receiver(post_delete, sender='reports.Notification')
+def drop_unread_counter_on_notification_delete(sender, instance, **kwargs):
+    """Single deletes and cascades (e.g. the recipient's account) alike."""
+    if instance.isRead:
+        return
+
+    from reports.notifications import decrement_unread
+    decrement_unread(instance.recipient_id)
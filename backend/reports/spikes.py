@@ -0,0 +1,94 @@
+"""
+Streaming spike detection ahead of clustering.
+
+Every new report updates two exponentially decayed counts for its
+(geo cell, category) in the cache — one constant-time read and write:
+
+    fast  decays with REPORTS_SPIKE_FAST_MINUTES   ≈ reports in the last while
+    slow  decays with REPORTS_SPIKE_SLOW_HOURS     ≈ the cell's usual level
+
+When the fast rate reaches REPORTS_SPIKE_MIN_REPORTS and is
+REPORTS_SPIKE_RATIO times the slow rate, `possible_incident` is sent (at
+most once per cell and category per REPORTS_SPIKE_COOLDOWN_SECONDS). The
+receiver in reports.signals clusters just that region; the periodic
+`manage.py run_clustering --loop` pass covers everything else.
+
+Concurrent inserts can race on the read-modify-write and lose an update;
+the detector only needs the rate to be about right.
+"""
+
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.dispatch import Signal
+from django.utils import timezone
+
+from reports.geo import region_for
+
+# kwargs: cell, category, bbox (south, west, north, east), fast, slow
+possible_incident = Signal()
+
+
+def _state_key(cell, category):
+    return f"reports:spike:{cell}:{category}"
+
+
+def _cell_bbox(cell):
+    """The cell and its neighbours, as (south, west, north, east)."""
+    size = settings.REPORTS_SPIKE_CELL_DEGREES
+    lat, lon = (float(v) for v in cell.split(":"))
+    return lat - size, lon - size, lat + 2 * size, lon + 2 * size
+
+
+def observe(latitude, longitude, category, at=None):
+    """
+    Count one report. Returns the possible_incident kwargs if this report
+    tipped its cell into a spike, else None.
+    """
+    now = (at or timezone.now()).timestamp()
+    cell = region_for(latitude, longitude, settings.REPORTS_SPIKE_CELL_DEGREES)
+    key = _state_key(cell, category)
+    fast_tau = settings.REPORTS_SPIKE_FAST_MINUTES * 60
+    slow_tau = settings.REPORTS_SPIKE_SLOW_HOURS * 3600
+
+    fast, slow, last = cache.get(key) or (0.0, 0.0, now)
+    elapsed = max(0.0, now - last)
+    fast = fast * math.exp(-elapsed / fast_tau) + 1
+    slow = slow * math.exp(-elapsed / slow_tau) + 1
+    cache.set(key, (fast, slow, now), 4 * slow_tau)
+
+    if fast < settings.REPORTS_SPIKE_MIN_REPORTS:
+        return None
+    if fast / fast_tau < settings.REPORTS_SPIKE_RATIO * slow / slow_tau:
+        return None
+    if not cache.add(f"{key}:fired", True, settings.REPORTS_SPIKE_COOLDOWN_SECONDS):
+        return None
+    return {"cell": cell, "category": category, "bbox": _cell_bbox(cell), "fast": fast, "slow": slow}
+
+
+def observe_reports(reports):
+    """observe() each report and send possible_incident for every spike."""
+    for report in reports:
+        spike = observe(report.latitude, report.longitude, report.category, report.createdAt)
+        if spike:
+            possible_incident.send(sender=type(report), **spike)
+
+
+def reports_bbox(reports):
+    """
+    One (south, west, north, east) covering the spike region (cell and
+    neighbours) of every report — what their possible_incident runs would
+    have clustered between them.
+    """
+    size = settings.REPORTS_SPIKE_CELL_DEGREES
+    cells = [
+        _cell_bbox(region_for(report.latitude, report.longitude, size))
+        for report in reports
+    ]
+    return (
+        min(c[0] for c in cells),
+        min(c[1] for c in cells),
+        max(c[2] for c in cells),
+        max(c[3] for c in cells),
+    )
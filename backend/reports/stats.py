@@ -0,0 +1,88 @@
+"""
+Cached report aggregates for the admin console.
+
+Totals are summed from the maintained ReportDailyCount table and the
+overview time series from ReportHourlyRollup (reports.counters) rather than
+aggregating every report. Results are kept in the configured cache and
+dropped whenever a report is created, re-statused or deleted (see
+reports.signals), so the rollups and the cache never disagree for long.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from reports.counters import category_totals, status_totals
+from reports.lifecycle import active_clusters
+from reports.models import AlertBroadcast, ReportHourlyRollup
+
+STATUS_COUNTS_CACHE_KEY = "reports:status_counts"
+OVERVIEW_CACHE_KEY = "reports:overview"
+
+
+def report_status_counts():
+    counts = cache.get(STATUS_COUNTS_CACHE_KEY)
+    if counts is None:
+        counts = status_totals()
+        cache.set(STATUS_COUNTS_CACHE_KEY, counts, settings.REPORTS_STATS_CACHE_SECONDS)
+    return counts
+
+
+def daily_report_counts(first_day):
+    """{local date: reports} from ``first_day`` to today, one aggregate query."""
+    tz = timezone.get_current_timezone()
+    since = timezone.make_aware(datetime.combine(first_day, time.min), tz)
+    return dict(
+        ReportHourlyRollup.objects.filter(hour__gte=since)
+        .annotate(day=TruncDate("hour", tzinfo=tz))
+        .values_list("day")
+        .annotate(n=Sum("count"))
+        .order_by()
+    )
+
+
+def build_reports_overview():
+    today = timezone.localdate()
+    per_day = daily_report_counts(today - timedelta(days=13))
+
+    this_w = sum(per_day.get(today - timedelta(days=i), 0) for i in range(7))
+    last_w = sum(per_day.get(today - timedelta(days=i), 0) for i in range(7, 14))
+    weekly_change = (
+        round(((this_w - last_w) / last_w) * 100, 1) if last_w > 0 else 0
+    )
+
+    weekly_data = []
+    for i in range(6, -1, -1):
+        day = today - timedelta(days=i)
+        weekly_data.append({"day": day.strftime("%a"), "count": per_day.get(day, 0)})
+
+    status_map = report_status_counts()
+
+    return {
+        "total_reports": sum(status_map.values()),
+        "pending_count": status_map.get("PENDING", 0),
+        "verified_count": status_map.get("VERIFIED", 0),
+        "rejected_count": status_map.get("REJECTED", 0),
+        "auto_alerted_count": status_map.get("AUTO_ALERTED", 0),
+        "active_clusters": active_clusters().count(),
+        "alerts_sent": AlertBroadcast.objects.count(),
+        "weekly_change": weekly_change,
+        "weekly_data": weekly_data,
+        "by_category": category_totals(),
+    }
+
+
+def reports_overview():
+    overview = cache.get(OVERVIEW_CACHE_KEY)
+    if overview is None:
+        overview = build_reports_overview()
+        cache.set(OVERVIEW_CACHE_KEY, overview, settings.REPORTS_OVERVIEW_CACHE_SECONDS)
+    return overview
+
+
+def invalidate_report_stats():
+    cache.delete_many([STATUS_COUNTS_CACHE_KEY, OVERVIEW_CACHE_KEY])
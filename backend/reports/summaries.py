@@ -0,0 +1,68 @@
+"""
+Precomputed cluster summaries for the admin detail view.
+
+IncidentCluster.summary holds everything the detail page shows up front,
+so opening a cluster costs one row plus a handful of sample reports no
+matter how many members it has:
+
+    {
+        "roleCounts":  {"GUIDE": 2, "TOURIST": 9},
+        "firstReportAt": ..., "lastReportAt": ...,
+        "keywords":    [...],
+        "sampleReportIds": [...]   # members closest to the centroid
+    }
+
+It is written when the cluster is saved and cleared whenever its membership
+changes (reports.lifecycle.refresh_report_counts); ensure_summary() rebuilds
+an empty one on read.
+"""
+
+from collections import Counter
+
+import numpy as np
+
+from reports.models import IncidentCluster, IncidentReport
+
+SAMPLE_SIZE = 5
+
+
+def build_summary(cluster):
+    rows = list(
+        IncidentReport.objects.filter(cluster=cluster)
+        .values_list("id", "latitude", "longitude", "createdAt", "user__role")
+        .order_by()
+    )
+    if not rows:
+        return {
+            "roleCounts": {},
+            "firstReportAt": None,
+            "lastReportAt": None,
+            "keywords": list(cluster.topKeywords or []),
+            "sampleReportIds": [],
+        }
+
+    coords = np.array([(r[1], r[2]) for r in rows], dtype=np.float64)
+    centre = np.array([cluster.centerLatitude, cluster.centerLongitude])
+    # Small areas: scaling longitude by cos(lat) is enough to rank by distance
+    scale = np.array([1.0, np.cos(np.radians(cluster.centerLatitude))])
+    distance = np.linalg.norm((coords - centre) * scale, axis=1)
+    nearest = np.argsort(distance, kind="stable")[:SAMPLE_SIZE]
+
+    created = [r[3] for r in rows]
+    return {
+        "roleCounts": dict(Counter(r[4] or "TOURIST" for r in rows)),
+        "firstReportAt": min(created).isoformat(),
+        "lastReportAt": max(created).isoformat(),
+        "keywords": list(cluster.topKeywords or []),
+        "sampleReportIds": [str(rows[i][0]) for i in nearest],
+    }
+
+
+def refresh_summary(cluster):
+    cluster.summary = build_summary(cluster)
+    IncidentCluster.objects.filter(pk=cluster.pk).update(summary=cluster.summary)
+    return cluster.summary
+
+
+def ensure_summary(cluster):
+    return cluster.summary or refresh_summary(cluster)
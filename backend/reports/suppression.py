@@ -0,0 +1,105 @@
+"""
+Suppression of repeat AUTO alerts.
+
+Clustering re-runs on every new report, so one landslide keeps producing
+fresh clusters that cross the alert threshold. Each AUTO alert claims the
+key (geo cell, dominant category, time bucket) for
+settings.ALERT_SUPPRESSION_SECONDS; a later detection that maps to a live
+key updates that alert — it moves to the newest cluster and keeps the
+higher severity — and nobody is notified again. The cluster it leaves drops
+isAlertTriggered, so every flagged cluster has its alert.
+
+Keys live in the cache for the fast path and in AlertSuppression so they
+survive a cache flush. Lookups also check the previous bucket, so an
+incident straddling a bucket boundary is not alerted twice.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+
+from reports.geo import region_for
+from reports.models import AlertBroadcast, AlertSuppression, IncidentCluster
+
+SEVERITY_RANK = {code: i for i, (code, _) in enumerate(AlertBroadcast.SEVERITY_CHOICES)}
+
+
+def _cache_key(key):
+    return f"alerts:suppress:{key}"
+
+
+def suppression_keys(latitude, longitude, category, now=None):
+    """Keys for the current and previous time bucket, current first."""
+    now = now or timezone.now()
+    cell = region_for(latitude, longitude, settings.ALERT_SUPPRESSION_CELL_DEGREES)
+    bucket = int(now.timestamp() // settings.ALERT_SUPPRESSION_SECONDS)
+    return [f"{cell}:{category}:{b}" for b in (bucket, bucket - 1)]
+
+
+def suppressing_alert_id(keys, now=None):
+    """Id of the alert holding any of ``keys``, or None."""
+    now = now or timezone.now()
+    cached = cache.get_many([_cache_key(k) for k in keys])
+    for key in keys:
+        if _cache_key(key) in cached:
+            return cached[_cache_key(key)]
+
+    row = (
+        AlertSuppression.objects.filter(key__in=keys, expiresAt__gt=now)
+        .order_by("-createdAt")
+        .values_list("key", "alert_id", "expiresAt")
+        .first()
+    )
+    if row is None:
+        return None
+    key, alert_id, expires_at = row
+    cache.set(_cache_key(key), alert_id, max(1, int((expires_at - now).total_seconds())))
+    return alert_id
+
+
+def suppress(key, alert, now=None):
+    """Let ``alert`` hold ``key`` for the suppression window."""
+    now = now or timezone.now()
+    AlertSuppression.objects.update_or_create(
+        key=key,
+        defaults={
+            "alert": alert,
+            "detections": 1,
+            "expiresAt": now + timedelta(seconds=settings.ALERT_SUPPRESSION_SECONDS),
+        },
+    )
+    cache.set(_cache_key(key), alert.pk, settings.ALERT_SUPPRESSION_SECONDS)
+
+
+def update_suppressed_alert(alert_id, keys, cluster, severity, message):
+    """
+    Fold a repeat detection into the existing alert. Returns the alert, or
+    None if it has since been deleted (the caller then raises a new one).
+    """
+    alert = AlertBroadcast.objects.filter(pk=alert_id).first()
+    if alert is None:
+        cache.delete_many([_cache_key(k) for k in keys])
+        return None
+
+    if alert.cluster_id != cluster.pk:
+        IncidentCluster.objects.filter(pk=alert.cluster_id).update(isAlertTriggered=False)
+        alert.cluster = cluster
+    if SEVERITY_RANK.get(severity, 0) > SEVERITY_RANK.get(alert.severity, 0):
+        alert.severity = severity
+        alert.message = message
+    alert.save(update_fields=["cluster", "severity", "message"])
+    AlertSuppression.objects.filter(key__in=keys, alert=alert).update(
+        detections=F("detections") + 1
+    )
+    return alert
+
+
+def purge_expired_suppressions(now=None):
+    """Delete expired suppression rows. Returns the number deleted."""
+    deleted, _ = AlertSuppression.objects.filter(
+        expiresAt__lte=now or timezone.now()
+    ).delete()
+    return deleted
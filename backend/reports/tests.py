@@ -0,0 +1,1027 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from reports.events import issue_stream_ticket, redeem_stream_ticket
+from reports.models import Notification, UnreadNotificationCounter
+from reports.notifications import bulk_notify, unread_count
+
+
+def make_user(name="tourist"):
+    return User.objects.create_user(
+        email=f"{name}@example.com", username=name, password="pass", fullName=name.title()
+    )
+
+
+def make_admin():
+    return User.objects.create_user(
+        email="admin@example.com", username="admin", password="pass", fullName="Admin", role="ADMIN"
+    )
+
+
+def make_destination(name="Ghandruk", latitude=28.37, longitude=83.80):
+    from destinations.models import Destination
+    return Destination.objects.create(
+        name=name, slug=name.lower(), description="Village trek", latitude=latitude, longitude=longitude,
+        averageCost=1, difficulty="Easy", bestSeason="Autumn", duration="2 days",
+        crowdLevel="Low", internetAvailability="Good",
+    )
+
+
+def notify(user, title="Alert"):
+    return Notification.objects.create(
+        recipient=user, notificationType="NEW_INCIDENT", title=title, message="m"
+    )
+
+
+class UnreadCounterTests(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        unread_count(self.user)  # seed the counter row
+
+    def counter(self):
+        return UnreadNotificationCounter.objects.get(user=self.user).unread
+
+    def test_create_and_bulk_notify_increment(self):
+        notify(self.user)
+        bulk_notify([
+            Notification(recipient=self.user, notificationType="NEW_INCIDENT", title=t, message="m")
+            for t in ("a", "b")
+        ])
+        self.assertEqual(self.counter(), 3)
+
+    def test_mark_one_read_decrements_once(self):
+        notification = notify(self.user)
+        notify(self.user)
+        url = f"/api/v1/reports/notifications/{notification.pk}"
+        self.client.patch(url, {}, format="json")
+        self.client.patch(url, {}, format="json")
+        self.assertEqual(self.counter(), 1)
+
+    def test_mark_all_read_resets(self):
+        for _ in range(3):
+            notify(self.user)
+        response = self.client.post("/api/v1/reports/notifications/read-all")
+        self.assertEqual(response.json(), {"marked_read": 3})
+        self.assertEqual(self.counter(), 0)
+        notify(self.user)
+        self.assertEqual(self.counter(), 1)
+
+    def test_delete_decrements_unread_only(self):
+        unread = notify(self.user)
+        read = notify(self.user)
+        Notification.objects.filter(pk=read.pk).update(isRead=True)
+        read.refresh_from_db()
+        self.assertEqual(self.counter(), 2)
+
+        read.delete()
+        self.assertEqual(self.counter(), 2)
+        self.client.delete(f"/api/v1/reports/notifications/{unread.pk}")
+        self.assertEqual(self.counter(), 1)
+
+    def test_queryset_delete_decrements(self):
+        for _ in range(3):
+            notify(self.user)
+        Notification.objects.filter(recipient=self.user).delete()
+        self.assertEqual(self.counter(), 0)
+
+
+class StreamTicketTests(TestCase):
+    def test_ticket_redeems_once(self):
+        user = make_user()
+        ticket = issue_stream_ticket(user)
+        self.assertEqual(redeem_stream_ticket(ticket), user.pk)
+        self.assertIsNone(redeem_stream_ticket(ticket))
+        self.assertIsNone(redeem_stream_ticket("made-up"))
+
+    def test_ticket_endpoint_requires_auth(self):
+        client = APIClient()
+        url = "/api/v1/reports/notifications/stream-ticket"
+        self.assertEqual(client.post(url).status_code, 401)
+        client.force_authenticate(make_user())
+        self.assertIn("ticket", client.post(url).json())
+
+
+class ImageStatusTests(TestCase):
+    def test_report_without_image_is_not_queued(self):
+        from reports.images import process_pending_images
+        from reports.models import IncidentReport
+
+        report = IncidentReport.objects.create(
+            user=make_user(), category="LANDSLIDE", description="Road blocked by debris",
+            latitude=27.7, longitude=85.3,
+        )
+        self.assertEqual(report.imageStatus, "NONE")
+        IncidentReport.objects.filter(pk=report.pk).update(imageStatus="PENDING")
+        self.assertEqual(process_pending_images(), (0, 0))
+
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+def photo(name="photo.jpg"):
+    buffer = BytesIO()
+    Image.new("RGB", (8, 8)).save(buffer, "JPEG")
+    return SimpleUploadedFile(name, buffer.getvalue(), "image/jpeg")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class IdempotencyTests(TestCase):
+    url = "/api/v1/reports/"
+    body = {"category": "LANDSLIDE", "description": "Road blocked by debris", "latitude": 27.7, "longitude": 85.3}
+
+    def setUp(self):
+        self.user = make_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def post(self, key="retry-1", **overrides):
+        return self.client.post(
+            self.url,
+            {**self.body, "image": photo(), **overrides},
+            format="multipart",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_retry_replays_the_first_response(self):
+        from django.core.cache import cache
+        from reports.models import IncidentReport
+
+        first = self.post()
+        self.assertEqual(first.status_code, 201)
+        cache.clear()  # replay from the stored row, not just the cache
+        second = self.post()
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(IncidentReport.objects.count(), 1)
+
+    def test_key_reused_for_other_request(self):
+        self.post()
+        self.assertEqual(self.post(description="Bridge washed out").status_code, 422)
+
+    def test_duplicate_while_in_flight_conflicts(self):
+        from django.utils import timezone
+        from reports.idempotency import _reserve
+
+        now = timezone.now()
+        row, created = _reserve(self.user, "retry-1", "hash", now)
+        self.assertTrue(created)
+        # A concurrent duplicate loses the insert and sees the live reservation
+        self.assertEqual(_reserve(self.user, "retry-1", "hash", now), (row, False))
+        self.assertEqual(self.post().status_code, 409)
+
+    def test_abandoned_reservation_is_reclaimed_after_lease(self):
+        from datetime import timedelta
+        from django.conf import settings
+        from django.utils import timezone
+        from reports.idempotency import _reserve
+        from reports.models import IdempotencyKey
+
+        lease = timedelta(seconds=settings.IDEMPOTENCY_IN_FLIGHT_SECONDS)
+        _reserve(self.user, "retry-1", "hash", timezone.now() - lease * 2)
+        response = self.post()
+        self.assertEqual(response.status_code, 201)
+        row = IdempotencyKey.objects.get(user=self.user, key="retry-1")
+        self.assertEqual(row.statusCode, 201)
+        self.assertGreater(row.expiresAt, timezone.now() + lease)
+
+
+class MapGridTests(TestCase):
+    def test_tile_count_matches_tiles(self):
+        from reports.mapgrid import tile_count, tiles_for_bbox
+
+        for bbox in [(80.0, 26.0, 88.2, 30.5, 6), (85.3, 27.7, 85.3, 27.7, 12), (-180, -90, 180, 90, 2)]:
+            self.assertEqual(tile_count(*bbox), len(tiles_for_bbox(*bbox)))
+
+    def test_huge_viewport_rejected(self):
+        client = APIClient()
+        client.force_authenticate(make_user())
+        response = client.get(
+            "/api/v1/reports/map", {"bbox": "-180,-90,180,90", "zoom": 12}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("zoom out", response.json()["detail"])
+
+
+class ExportTests(TestCase):
+    def test_asgi_export_streams_async(self):
+        from asgiref.sync import async_to_sync
+        from django.test import AsyncClient
+        from rest_framework_simplejwt.tokens import AccessToken
+        from reports.models import IncidentReport
+
+        admin = make_admin()
+        IncidentReport.objects.bulk_create([
+            IncidentReport(user=admin, description=f"Flooded trail {i}", latitude=27.7, longitude=85.3, image="x.jpg")
+            for i in range(3)
+        ])
+
+        async def fetch():
+            response = await AsyncClient().get(
+                "/api/v1/reports/export/reports.csv",
+                headers={"Authorization": f"Bearer {AccessToken.for_user(admin)}"},
+            )
+            self.assertTrue(response.is_async)
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        body = async_to_sync(fetch)().decode()
+        self.assertEqual(len(body.strip().splitlines()), 4)
+
+    def test_filtered_rows_and_formula_cells(self):
+        import csv
+        import json
+        from datetime import timedelta
+        from django.utils import timezone
+        from reports.models import IncidentReport
+
+        client = APIClient()
+        client.force_authenticate(make_admin())
+        user = make_user()
+
+        def report(description, category="LANDSLIDE"):
+            return IncidentReport.objects.create(
+                user=user, description=description, category=category, latitude=27.7, longitude=85.3
+            )
+
+        formula = report('=HYPERLINK("http://evil.example","Road blocked")')
+        report("Trail flooded near the bridge", category="FLOOD")
+        old = report("Old landslide on the trail")
+        IncidentReport.objects.filter(pk=old.pk).update(createdAt=timezone.now() - timedelta(days=10))
+        params = {"category": "landslide", "since": (timezone.localdate() - timedelta(days=1)).isoformat()}
+
+        def fetch(fmt):
+            response = client.get(f"/api/v1/reports/export/reports.{fmt}", params)
+            self.assertEqual(response.status_code, 200)
+            return b"".join(response.streaming_content).decode()
+
+        header, *rows = csv.reader(fetch("csv").splitlines())
+        self.assertEqual([row[header.index("id")] for row in rows], [str(formula.pk)])
+        self.assertEqual(rows[0][header.index("description")], "'" + formula.description)
+
+        features = json.loads(fetch("geojson"))["features"]
+        self.assertEqual([f["properties"]["id"] for f in features], [str(formula.pk)])
+        self.assertEqual(features[0]["properties"]["description"], formula.description)
+        self.assertEqual(features[0]["geometry"]["coordinates"], [85.3, 27.7])
+
+
+class HazardOverlayTests(TestCase):
+    def test_duplicate_clusters_count_once(self):
+        from reports.hazards import refresh_destination_hazards
+        from reports.models import IncidentCluster
+
+        destination = make_destination()
+
+        def cluster(lat, lon, category="LANDSLIDE"):
+            return IncidentCluster.objects.create(
+                centerLatitude=lat, centerLongitude=lon, dominantCategory=category, confidenceScore=0.8
+            )
+
+        cluster(28.40, 83.80)
+        refresh_destination_hazards([destination.pk])
+        destination.refresh_from_db()
+        single = destination.hazardScore
+
+        # Re-detections of the same landslide
+        cluster(28.401, 83.80)
+        cluster(28.402, 83.801)
+        refresh_destination_hazards([destination.pk])
+        destination.refresh_from_db()
+        self.assertAlmostEqual(destination.hazardScore, single, places=2)
+        self.assertEqual(len(destination.hazardClusters), 1)
+
+        # A different incident still adds up
+        cluster(28.40, 83.80, category="FLOOD")
+        refresh_destination_hazards([destination.pk])
+        destination.refresh_from_db()
+        self.assertGreater(destination.hazardScore, single)
+        self.assertEqual(len(destination.hazardClusters), 2)
+
+    def test_deleting_a_cluster_refreshes_nearby_destinations(self):
+        from reports.hazards import refresh_destination_hazards
+        from reports.models import IncidentCluster
+
+        destination = make_destination()
+        cluster = IncidentCluster.objects.create(
+            centerLatitude=28.40, centerLongitude=83.80, dominantCategory="LANDSLIDE", confidenceScore=0.8
+        )
+        refresh_destination_hazards([destination.pk])
+
+        client = APIClient()
+        client.force_authenticate(make_admin())
+        self.assertEqual(client.delete(f"/api/v1/reports/clusters/{cluster.pk}").status_code, 204)
+        destination.refresh_from_db()
+        self.assertEqual((destination.hazardScore, destination.hazardClusters), (0, []))
+
+
+class RouteSafetyTests(TestCase):
+    @override_settings(REPORTS_ROUTE_MAX_CANDIDATES=2)
+    def test_candidate_reports_are_capped(self):
+        from reports.models import IncidentReport
+        from reports.routes import route_hazards
+
+        user = make_user()
+        IncidentReport.objects.bulk_create([
+            IncidentReport(user=user, description=f"Rockfall on trail {i}", latitude=28.0, longitude=84.0 + i / 100, image="x.jpg")
+            for i in range(3)
+        ])
+        hazards, _, truncated = route_hazards([(28.0, 83.9), (28.0, 84.2)], radius_km=5, hours=24)
+        self.assertEqual(len(hazards), 2)
+        self.assertTrue(truncated)
+
+
+class SaveClustersTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from reports.models import IncidentReport
+
+        cache.clear()
+        user = make_user()
+        self.reports = IncidentReport.objects.bulk_create([
+            IncidentReport(user=user, description=f"Landslide blocks the trail {i}", latitude=27.7, longitude=85.3, image="x.jpg")
+            for i in range(4)
+        ])
+
+    def data(self, report_ids, severity="HIGH", confidence=0.8):
+        return {
+            "center_latitude": 27.7, "center_longitude": 85.3, "dominant_category": "LANDSLIDE",
+            "confidence_score": confidence, "top_keywords": ["landslide"], "point_count": len(report_ids),
+            "report_ids": report_ids, "severity": severity,
+        }
+
+    def test_rerun_updates_the_active_cluster(self):
+        from reports.clustering import save_clusters_to_db
+        from reports.models import AlertBroadcast, IncidentCluster
+
+        ids = [r.pk for r in self.reports]
+        cluster = save_clusters_to_db([self.data(ids[:3], confidence=0.3)])[0]
+        self.assertFalse(AlertBroadcast.objects.exists())
+
+        # The next pass sees one more report and crosses the alert threshold
+        self.assertEqual(save_clusters_to_db([self.data(ids)]), [])
+        self.assertEqual(save_clusters_to_db([self.data(ids, severity="CRITICAL")]), [])
+        self.assertEqual(IncidentCluster.objects.count(), 1)
+        cluster.refresh_from_db()
+        self.assertEqual(cluster.reportCount, 4)
+        self.assertTrue(cluster.isAlertTriggered)
+        alert = AlertBroadcast.objects.get()
+        self.assertEqual((alert.cluster_id, alert.severity), (cluster.pk, "CRITICAL"))
+
+
+class ClusteringWindowTests(TestCase):
+    def test_plan_windows_budget_and_margin(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from reports.clustering import plan_windows
+
+        now = timezone.now()
+        storm = [(f"s{i}", 27.7, 85.3, now - timedelta(minutes=i)) for i in range(100)]
+        # Straddling the 85.5° region edge
+        edge = [(f"e{i}", 27.7, 85.49 + i * 0.01, now - timedelta(minutes=i)) for i in range(3)]
+        rows = sorted(storm + edge, key=lambda r: r[3], reverse=True)
+        plan = plan_windows(rows, now, min_hours=1, max_hours=6, budget=50)
+
+        west, east = plan["27.5:85"], plan["27.5:85.5"]
+        self.assertEqual(len(west["ids"]), 50)
+        self.assertAlmostEqual(west["windowHours"], 49 / 60, delta=0.3)
+        self.assertEqual((east["windowHours"], sorted(east["ids"])), (6, ["e1", "e2"]))
+        self.assertEqual(east["margin"], ["e0"])
+        self.assertEqual(sorted(west["margin"]), ["e1", "e2"])
+
+    def test_edge_incident_clustered_once(self):
+        from reports.clustering import run_clustering
+        from reports.models import IncidentCluster, IncidentReport
+
+        texts = [
+            "flood water rising near river bank", "river flood water rising fast bank",
+            "flood water rising river overflow bank", "heavy flood river water rising bank road",
+            "flood river bank water",
+        ]
+        # Alternating either side of the 85.5° region edge
+        IncidentReport.objects.bulk_create([
+            IncidentReport(
+                user=make_user(f"trekker{i}"), description=text, category="FLOOD", image="x.jpg",
+                latitude=27.7, longitude=85.499 + (i % 2) * 0.002,
+            )
+            for i, text in enumerate(texts)
+        ])
+        run_clustering(reason="test")
+        self.assertEqual(IncidentCluster.objects.count(), 1)
+        cluster = IncidentCluster.objects.get()
+        self.assertEqual(cluster.reportCount, 4)
+        self.assertEqual(len({r.longitude > 85.5 for r in cluster.reports.all()}), 2)
+
+
+class MembershipScoreTests(TestCase):
+    def test_membership_strength(self):
+        import numpy as np
+        from reports.clustering import membership_strength
+
+        cos_sim = np.array([
+            [1.0, 0.9, 0.9, 0.1],
+            [0.9, 1.0, 0.9, 0.1],
+            [0.9, 0.9, 1.0, 0.5],
+            [0.1, 0.1, 0.5, 1.0],
+        ])
+        in_reach = 1.0 - cos_sim <= 0.82
+        is_core = np.array([True, True, True, False])
+        strength = membership_strength([0, 1, 2, 3], cos_sim, in_reach, is_core)
+
+        self.assertEqual(strength.shape, (4,))
+        self.assertTrue(((strength >= 0) & (strength <= 1)).all())
+        # The border point scores lowest; a tight core pair beats the bridge point
+        self.assertEqual(strength.argmin(), 3)
+        self.assertGreater(strength[0], strength[3])
+        self.assertAlmostEqual(strength[0], 0.5 * (0.9 + 0.9 + 0.1) / 3 + 0.3 * 2 / 3 + 0.2, places=4)
+
+    def test_scores_reset_for_reports_leaving_a_cluster(self):
+        from reports.clustering import save_membership_scores
+        from reports.models import IncidentReport
+
+        user = make_user()
+        kept, dropped, other = IncidentReport.objects.bulk_create([
+            IncidentReport(user=user, description=f"Flooded bridge {i}", latitude=27.7, longitude=85.3,
+                           image="x.jpg", confidenceScore=0.6)
+            for i in range(3)
+        ])
+        written = save_membership_scores(
+            [{"report_ids": [kept.pk], "membership": [0.8]}], [kept.pk, dropped.pk]
+        )
+        self.assertEqual(written, 2)
+        scores = dict(IncidentReport.objects.values_list("pk", "confidenceScore"))
+        self.assertEqual((scores[kept.pk], scores[dropped.pk], scores[other.pk]), (0.8, 0.0, 0.6))
+
+
+class SpikeDetectorTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+    @override_settings(
+        REPORTS_SPIKE_MIN_REPORTS=3, REPORTS_SPIKE_RATIO=2.5, REPORTS_SPIKE_COOLDOWN_SECONDS=300
+    )
+    def test_burst_fires_once_per_cooldown(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from reports.spikes import observe
+
+        start = timezone.now()
+        fired = [observe(27.7, 85.3, "FLOOD", start + timedelta(minutes=i)) for i in range(5)]
+        # Decayed, the third report a minute apart is still just under 3
+        self.assertEqual([f is not None for f in fired], [False, False, False, True, False])
+        spike = fired[3]
+        self.assertEqual(spike["category"], "FLOOD")
+        self.assertGreaterEqual(spike["fast"], 3)
+        south, west, north, east = spike["bbox"]
+        self.assertTrue(south < 27.7 < north and west < 85.3 < east)
+
+        # Other categories in the same cell are counted separately
+        self.assertIsNone(observe(27.7, 85.3, "WEATHER", start))
+
+    def test_steady_trickle_never_fires(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from reports.spikes import observe
+
+        start = timezone.now()
+        fired = [observe(27.7, 85.3, "FLOOD", start + timedelta(hours=3 * i)) for i in range(20)]
+        self.assertTrue(all(f is None for f in fired))
+
+
+class NotificationRetentionTests(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        unread_count(self.user)
+
+    def make(self, notification_type, read=False, count=1):
+        rows = [
+            Notification.objects.create(
+                recipient=self.user, notificationType=notification_type, title="t", message="m", isRead=read
+            )
+            for _ in range(count)
+        ]
+        return rows[0] if count == 1 else rows
+
+    def later(self, days):
+        from datetime import timedelta
+        from django.utils import timezone
+
+        return timezone.now() + timedelta(days=days)
+
+    def test_ttl_and_unread_grace(self):
+        from reports.retention import expired_notifications
+
+        read_alert = self.make("AUTO_ALERT", read=True)
+        unread_alert = self.make("AUTO_ALERT")
+        read_incident = self.make("NEW_INCIDENT", read=True)
+
+        self.assertEqual(set(expired_notifications(self.later(10))), {read_alert})
+        # 7-day TTL + 30 days of grace for the unread alert
+        self.assertEqual(
+            set(expired_notifications(self.later(40))), {read_alert, unread_alert, read_incident}
+        )
+
+    def test_purge_walks_batches_and_archives_to_table(self):
+        from reports.models import ArchivedNotification
+        from reports.retention import purge_notifications
+
+        expired = self.make("AUTO_ALERT", read=True, count=5)
+        kept = self.make("REPORT_VERIFIED", read=True)
+        progress = []
+
+        result = purge_notifications(
+            batch_size=2, now=self.later(10), on_batch=lambda rows, _: progress.append(rows)
+        )
+        self.assertEqual((result["rows"], result["batches"]), (5, 3))
+        self.assertEqual(progress, [2, 4, 5])
+        self.assertEqual(list(Notification.objects.all()), [kept])
+        self.assertEqual(
+            set(ArchivedNotification.objects.values_list("id", flat=True)), {n.pk for n in expired}
+        )
+
+    def test_purge_to_gzip_jsonl(self):
+        import gzip
+        import json
+        import os
+        from reports.models import ArchivedNotification
+        from reports.retention import ARCHIVE_JSONL, purge_notifications
+
+        expired = self.make("AUTO_ALERT", read=True, count=3)
+        path = os.path.join(tempfile.mkdtemp(), "notifications.jsonl.gz")
+        self.addCleanup(shutil.rmtree, os.path.dirname(path))
+
+        purge_notifications(archive=ARCHIVE_JSONL, jsonl_path=path, batch_size=2, now=self.later(10))
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            lines = [json.loads(line) for line in fh]
+        self.assertEqual({line["id"] for line in lines}, {str(n.pk) for n in expired})
+        self.assertEqual(lines[0]["notificationType"], "AUTO_ALERT")
+        self.assertFalse(ArchivedNotification.objects.exists())
+        self.assertFalse(Notification.objects.exists())
+
+    def test_dry_run_deletes_nothing(self):
+        from reports.retention import purge_notifications
+
+        self.make("AUTO_ALERT", read=True, count=2)
+        self.assertEqual(purge_notifications(now=self.later(10), dry_run=True)["rows"], 2)
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_unread_counter_reconciled_after_purge(self):
+        from reports.retention import purge_notifications
+
+        self.make("AUTO_ALERT", count=3)
+        self.make("REPORT_VERIFIED", count=2)
+        self.assertEqual(unread_count(self.user), 5)
+
+        purge_notifications(now=self.later(40))
+        self.assertEqual(unread_count(self.user), 2)
+        self.assertEqual(UnreadNotificationCounter.objects.get(user=self.user).unread, 2)
+
+
+class ReportCounterTests(TestCase):
+    def setUp(self):
+        from reports.models import IncidentReport
+
+        self.report = IncidentReport.objects.create(
+            user=make_user(), category="LANDSLIDE", description="Road blocked by debris",
+            latitude=27.7, longitude=85.3,
+        )
+
+    def totals(self):
+        from reports.counters import status_totals
+        return {status: n for status, n in status_totals().items() if n}
+
+    def test_counters_follow_the_report_lifecycle(self):
+        from reports.models import IncidentReport, ReportHourlyRollup
+
+        self.assertEqual(self.totals(), {"PENDING": 1})
+
+        # A fresh load carries the stored status, so the save is seen as a move
+        report = IncidentReport.objects.get(pk=self.report.pk)
+        report.status = "VERIFIED"
+        report.save()
+        self.assertEqual(self.totals(), {"VERIFIED": 1})
+        report.save()
+        self.assertEqual(self.totals(), {"VERIFIED": 1})
+
+        report.delete()
+        self.assertEqual(self.totals(), {})
+        self.assertFalse(ReportHourlyRollup.objects.exclude(count=0).exists())
+
+    def test_reconcile_rebuilds_drifted_tables(self):
+        from reports.counters import reconcile_report_counts
+        from reports.models import IncidentReport, ReportDailyCount
+
+        IncidentReport.objects.filter(pk=self.report.pk).update(status="REJECTED")
+        ReportDailyCount.objects.update(count=7)
+        reconcile_report_counts()
+        self.assertEqual(self.totals(), {"REJECTED": 1})
+
+
+class ReportsOverviewTests(TestCase):
+    def test_days_are_bucketed_in_kathmandu_time(self):
+        from datetime import datetime, time, timedelta
+        from django.core.cache import cache
+        from django.utils import timezone
+        from reports.counters import reconcile_report_counts
+        from reports.models import IncidentReport, ReportDailyCount
+        from reports.stats import build_reports_overview
+
+        cache.clear()
+        midnight = timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+        user = make_user()
+        before, after = IncidentReport.objects.bulk_create([
+            IncidentReport(user=user, description=f"Flooded trail {i}", latitude=27.7, longitude=85.3, image="x.jpg")
+            for i in range(2)
+        ])
+        # 18:10 and 18:20 UTC: the same UTC day, either side of midnight in Nepal (+05:45)
+        IncidentReport.objects.filter(pk=before.pk).update(createdAt=midnight - timedelta(minutes=5))
+        IncidentReport.objects.filter(pk=after.pk).update(createdAt=midnight + timedelta(minutes=5))
+        reconcile_report_counts()
+
+        today = timezone.localdate()
+        self.assertEqual(
+            dict(ReportDailyCount.objects.values_list("day", "count")),
+            {today - timedelta(days=1): 1, today: 1},
+        )
+        weekly = build_reports_overview()["weekly_data"]
+        self.assertEqual([row["count"] for row in weekly[-2:]], [1, 1])
+        self.assertEqual(weekly[-1]["day"], today.strftime("%a"))
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ReportSearchTests(TestCase):
+    def setUp(self):
+        from reports.models import IncidentReport
+
+        self.client = APIClient()
+        self.client.force_authenticate(make_admin())
+        user = make_user()
+
+        def report(description, category="LANDSLIDE", status="PENDING"):
+            return IncidentReport.objects.create(
+                user=user, description=description, category=category, status=status,
+                latitude=27.7, longitude=85.3,
+            )
+
+        self.blocked = report("Landslide blocked the road, second landslide above it")
+        self.risk = report("Landslide risk reported above the village", status="VERIFIED")
+        self.flood = report("Road flooded after heavy rain", category="FLOOD")
+
+    def search(self, **params):
+        response = self.client.get("/api/v1/reports/search", params)
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.json()["results"]]
+
+    def test_prefix_and_semantics_and_ranking(self):
+        ids = lambda *reports: [str(r.pk) for r in reports]
+        # Two occurrences of the term outrank one
+        self.assertEqual(self.search(q="landsl"), ids(self.blocked, self.risk))
+        self.assertEqual(self.search(q="landsl road"), ids(self.blocked))
+        self.assertEqual(self.search(q="landsl", status="verified"), ids(self.risk))
+        self.assertEqual(self.search(q="road", category="flood"), ids(self.flood))
+        self.assertEqual(self.search(q="landsl flood"), [])
+
+    def test_index_follows_edits_and_batch_inserts(self):
+        import json
+        import uuid
+
+        self.flood.description = "Bridge washed away by the river"
+        self.flood.save()
+        self.assertEqual(self.search(q="flooded"), [])
+        self.assertEqual(self.search(q="bridg"), [str(self.flood.pk)])
+
+        uploader = APIClient()
+        uploader.force_authenticate(self.flood.user)
+        item = {"clientId": str(uuid.uuid4()), "description": "Avalanche debris on the pass",
+                "category": "WEATHER", "latitude": 27.7, "longitude": 85.3}
+        response = uploader.post(
+            "/api/v1/reports/batch",
+            {"reports": json.dumps([item]), "image_0": photo()},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.search(q="avalan debr"), [response.json()["results"][0]["id"]])
+
+    def test_admin_only(self):
+        self.client.force_authenticate(make_user("hiker"))
+        self.assertEqual(self.client.get("/api/v1/reports/search", {"q": "road"}).status_code, 403)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ReportBatchTests(TestCase):
+    url = "/api/v1/reports/batch"
+
+    def setUp(self):
+        self.user = make_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def item(self, description="Trail washed out by the river", **fields):
+        import uuid
+        return {"clientId": str(uuid.uuid4()), "description": description, "category": "FLOOD",
+                "latitude": 27.7, "longitude": 85.3, **fields}
+
+    def post(self, items):
+        import json
+        from unittest import mock
+
+        files = {f"image_{i}": photo() for i in range(len(items))}
+        with mock.patch("reports.batch.cluster_recent_reports") as cluster, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url, {"reports": json.dumps(items), **files}, format="multipart"
+            )
+        self.cluster_calls = cluster.call_args_list
+        return response
+
+    def statuses(self, response):
+        return [row["status"] for row in response.json()["results"]]
+
+    def test_inserts_with_counters_index_and_one_clustering_run(self):
+        from reports.counters import status_totals
+        from reports.models import ReportSearchTerm
+
+        far = self.item(latitude=28.2, longitude=83.9)
+        response = self.post([self.item(), self.item(), far])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.statuses(response), ["created"] * 3)
+        self.assertEqual(status_totals()["PENDING"], 3)
+        self.assertEqual(
+            ReportSearchTerm.objects.filter(term="washed").values("report").distinct().count(), 3
+        )
+
+        self.assertEqual(len(self.cluster_calls), 1)
+        south, west, north, east = self.cluster_calls[0].kwargs["bbox"]
+        self.assertTrue(south < 27.7 and north > 28.2 and west < 83.9 and east > 85.3)
+
+    def test_client_ids_dedupe_within_batch_and_against_earlier_uploads(self):
+        from reports.models import IncidentReport
+
+        earlier = self.item()
+        first = self.post([earlier]).json()["results"][0]["id"]
+
+        again = self.item()
+        response = self.post([again, dict(again, description="Same report sent twice"), earlier])
+        self.assertEqual(self.statuses(response), ["created", "duplicate", "duplicate"])
+        ids = [row["id"] for row in response.json()["results"]]
+        self.assertEqual(ids[0], ids[1])
+        self.assertEqual(ids[2], first)
+        self.assertEqual(IncidentReport.objects.count(), 2)
+
+        # Nothing new: 200 and no clustering run
+        response = self.post([earlier])
+        self.assertEqual((response.status_code, self.statuses(response)), (200, ["duplicate"]))
+        self.assertEqual(self.cluster_calls, [])
+
+    def test_concurrent_insert_of_the_same_client_id(self):
+        import uuid
+        from unittest import mock
+        from reports.counters import status_totals
+        from reports.models import IncidentReport
+
+        raced, fresh = self.item(), self.item()
+        real_bulk_create = IncidentReport.objects.bulk_create
+
+        def racing_bulk_create(objs, **kwargs):
+            # Another retry of the same upload commits first
+            self.winner = IncidentReport.objects.create(
+                user=self.user, clientId=uuid.UUID(raced["clientId"]),
+                description="Trail washed out by the river", category="FLOOD",
+                latitude=27.7, longitude=85.3,
+            )
+            return real_bulk_create(objs, **kwargs)
+
+        with mock.patch.object(IncidentReport.objects, "bulk_create", side_effect=racing_bulk_create):
+            response = self.post([raced, fresh])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.statuses(response), ["duplicate", "created"])
+        self.assertEqual(response.json()["results"][0]["id"], str(self.winner.pk))
+        self.assertEqual(len(response.json()["created"]), 1)
+        self.assertEqual(status_totals()["PENDING"], 2)
+
+    def test_item_errors_reject_the_batch(self):
+        from reports.models import IncidentReport
+
+        response = self.post([self.item(), self.item(description="short"), self.item(latitude=95)])
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual(sorted(errors), ["1", "2"])
+        self.assertIn("description", errors["1"])
+        self.assertIn("latitude", errors["2"])
+
+        response = self.post([self.item(clientId="not-a-uuid")])
+        self.assertIn("clientId", response.json()["errors"]["0"])
+        self.assertFalse(IncidentReport.objects.exists())
+
+
+class BulkModerationTests(TestCase):
+    url = "/api/v1/reports/moderate"
+
+    def setUp(self):
+        from reports.models import IncidentReport
+
+        self.client = APIClient()
+        self.client.force_authenticate(make_admin())
+        self.authors = [make_user("asha"), make_user("bikash")]
+        self.pending = [
+            IncidentReport.objects.create(
+                user=author, description="Road blocked by debris", category="LANDSLIDE",
+                latitude=27.7, longitude=85.3,
+            )
+            for author in self.authors
+        ]
+        self.verified = IncidentReport.objects.create(
+            user=self.authors[0], description="Bridge washed out", category="FLOOD",
+            status="VERIFIED", latitude=27.7, longitude=85.3,
+        )
+
+    def test_results_counts_and_notifications(self):
+        import uuid
+        from reports.counters import status_totals
+        from reports.models import IncidentReport
+
+        missing = str(uuid.uuid4())
+        ids = [str(r.pk) for r in self.pending] + [str(self.verified.pk), missing, str(self.pending[0].pk)]
+        response = self.client.post(self.url, {"ids": ids, "action": "verify"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row["result"] for row in response.json()["results"]],
+            ["updated", "updated", "unchanged", "not_found"],
+        )
+
+        self.assertFalse(IncidentReport.objects.exclude(status="VERIFIED").exists())
+        totals = status_totals()
+        self.assertEqual((totals["PENDING"], totals["VERIFIED"]), (0, 3))
+
+        notified = Notification.objects.filter(notificationType="REPORT_VERIFIED")
+        self.assertEqual(
+            sorted(notified.values_list("incidentReport_id", flat=True)),
+            sorted(r.pk for r in self.pending),
+        )
+        self.assertEqual([unread_count(author) for author in self.authors], [1, 1])
+
+    def test_reject_records_reason(self):
+        from reports.counters import status_totals
+
+        self.client.post(
+            self.url, {"ids": [str(self.verified.pk)], "action": "reject", "reason": "Duplicate"},
+            format="json",
+        )
+        self.verified.refresh_from_db()
+        self.assertEqual((self.verified.status, self.verified.rejectionReason), ("REJECTED", "Duplicate"))
+        self.assertEqual(status_totals()["REJECTED"], 1)
+
+    def test_admin_only(self):
+        self.client.force_authenticate(self.authors[0])
+        response = self.client.post(
+            self.url, {"ids": [str(self.pending[0].pk)], "action": "verify"}, format="json"
+        )
+        self.assertEqual(response.status_code, 403)
+        self.pending[0].refresh_from_db()
+        self.assertEqual(self.pending[0].status, "PENDING")
+
+
+class NearDuplicateTests(TestCase):
+    def test_band_lookup_merges_up_to_the_hamming_threshold(self):
+        from types import SimpleNamespace
+        from reports.dedup import DEDUP_MAX_HAMMING, collapse_near_duplicates
+
+        base = 0x0123456789ABCDEF
+
+        def report(*flipped_bits, user_id=1, latitude=27.7):
+            signature = base
+            for bit in flipped_bits:
+                signature ^= 1 << bit
+            return SimpleNamespace(
+                user_id=user_id, latitude=latitude, longitude=85.3,
+                descriptionSimhash=signature, description="",
+            )
+
+        self.assertEqual(DEDUP_MAX_HAMMING, 3)
+        reports = [
+            report(),
+            report(0, 20, 40),                   # 3 bits in 3 bands: only the top band is shared
+            report(1, 2, 3, 4),                  # 4 bits, all in one band: a candidate, too far
+            report(5, 21, 41, 61),               # 4 bits, one per band: never a candidate
+            report(user_id=2),                   # same text from someone else
+            report(latitude=27.8),               # same text from another cell
+        ]
+        self.assertEqual(collapse_near_duplicates(reports), [[0, 1], [2], [3], [4], [5]])
+
+
+class AlertSuppressionTests(TestCase):
+    def test_window_spans_the_previous_bucket_then_expires_and_purges(self):
+        from datetime import datetime, timedelta
+        from datetime import timezone as dt_timezone
+        from django.conf import settings
+        from django.core.cache import cache
+        from django.utils import timezone
+        from reports.models import AlertBroadcast, AlertSuppression, IncidentCluster
+        from reports.suppression import (
+            purge_expired_suppressions, suppress, suppressing_alert_id, suppression_keys,
+        )
+
+        cache.clear()
+        cluster = IncidentCluster.objects.create(
+            centerLatitude=27.7, centerLongitude=85.3, dominantCategory="LANDSLIDE", confidenceScore=0.8
+        )
+        alert = AlertBroadcast.objects.create(cluster=cluster, message="Landslide", triggerType="AUTO")
+        seconds = settings.ALERT_SUPPRESSION_SECONDS
+        window = timedelta(seconds=seconds)
+        # Late in a time bucket, so half a window later is the next one
+        bucket = timezone.now().timestamp() // seconds
+        now = datetime.fromtimestamp((bucket + 0.9) * seconds, tz=dt_timezone.utc)
+
+        keys = suppression_keys(27.7, 85.3, "LANDSLIDE", now)
+        suppress(keys[0], alert, now)
+        self.assertEqual(suppressing_alert_id(keys, now), alert.pk)
+        self.assertIsNone(suppressing_alert_id(suppression_keys(27.7, 85.3, "FLOOD", now), now))
+
+        # Next bucket: found through the previous-bucket key, from the table once the cache is gone
+        cache.clear()
+        later = now + window / 2
+        self.assertNotEqual(suppression_keys(27.7, 85.3, "LANDSLIDE", later)[0], keys[0])
+        self.assertEqual(suppressing_alert_id(suppression_keys(27.7, 85.3, "LANDSLIDE", later), later), alert.pk)
+
+        cache.clear()
+        expired = now + window
+        self.assertIsNone(suppressing_alert_id(keys, expired))
+        self.assertEqual(purge_expired_suppressions(now), 0)
+        self.assertEqual(purge_expired_suppressions(expired), 1)
+        self.assertFalse(AlertSuppression.objects.exists())
+
+
+class NearbyTests(TestCase):
+    def test_radius_and_distance_order(self):
+        from reports.geo import KM_PER_DEGREE
+        from reports.models import IncidentReport
+        from reports.nearby import nearest
+
+        user = make_user()
+        step = 1 / KM_PER_DEGREE  # one km of latitude
+
+        def at(lat, lon):
+            return IncidentReport.objects.create(
+                user=user, description="Road blocked by debris", latitude=lat, longitude=lon
+            )
+
+        far = at(27.7 + 4 * step, 85.3)
+        near = at(27.7 - 1 * step, 85.3)
+        middle = at(27.7 + 3 * step, 85.3)
+        at(27.7 + 6 * step, 85.3)                     # outside the box
+        at(27.7 + 4 * step, 85.3 + 4.5 * step)        # inside the box, outside the circle
+
+        pairs = nearest(IncidentReport.objects.all(), "latitude", "longitude", 27.7, 85.3, 5)
+        self.assertEqual([pk for pk, _ in pairs], [near.pk, middle.pk, far.pk])
+        self.assertEqual([round(km) for _, km in pairs], [1, 3, 4])
+
+
+class ExpireClustersCommandTests(TestCase):
+    def test_sweep_expires_clusters_refreshes_hazards_and_purges(self):
+        from datetime import timedelta
+        from django.core.management import call_command
+        from django.utils import timezone
+        from reports.hazards import refresh_destination_hazards
+        from reports.models import AlertBroadcast, AlertSuppression, IncidentCluster
+
+        destination = make_destination()
+        now = timezone.now()
+
+        def cluster(expires_at, category):
+            return IncidentCluster.objects.create(
+                centerLatitude=28.40, centerLongitude=83.80, dominantCategory=category,
+                confidenceScore=0.8, expiresAt=expires_at,
+            )
+
+        overdue = cluster(now + timedelta(minutes=1), "LANDSLIDE")
+        live = cluster(now + timedelta(hours=1), "FLOOD")
+        alert = AlertBroadcast.objects.create(cluster=live, message="Flood", triggerType="AUTO")
+        AlertSuppression.objects.create(key="old", alert=alert, expiresAt=now - timedelta(minutes=1))
+        AlertSuppression.objects.create(key="live", alert=alert, expiresAt=now + timedelta(hours=1))
+        refresh_destination_hazards([destination.pk])
+        destination.refresh_from_db()
+        self.assertEqual(len(destination.hazardClusters), 2)
+
+        IncidentCluster.objects.filter(pk=overdue.pk).update(expiresAt=now - timedelta(minutes=1))
+        call_command("expire_clusters", stdout=StringIO())
+
+        overdue.refresh_from_db()
+        live.refresh_from_db()
+        self.assertEqual((overdue.state, live.state), ("EXPIRED", "ACTIVE"))
+        destination.refresh_from_db()
+        self.assertEqual([c["id"] for c in destination.hazardClusters], [str(live.pk)])
+        self.assertEqual(list(AlertSuppression.objects.values_list("key", flat=True)), ["live"])
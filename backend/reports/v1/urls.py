@@ -1,18 +1,29 @@
 from django.urls import path
 from reports.views import (
     ReportListCreateView,
+    ReportBatchCreateView,
+    ReportBulkModerateView,
+    ReportSearchView,
+    NearbyReportListView,
     ReportDetailView,
     ReportVerifyView,
     ReportRejectView,
     ReportsOverviewView,
+    MapGridView,
+    RouteSafetyView,
+    ExportView,
     ClusterListView,
     ClusterDetailView,
+    ClusterReportListView,
     ClusterBroadcastView,
     AlertListView,
     AlertDetailView,
     NotificationListView,
     NotificationDetailView,
     MarkAllNotificationsReadView,
+    UnreadNotificationCountView,
+    NotificationStreamView,
+    NotificationStreamTicketView,
     AlertSendToAllView,
 )
 
@@ -21,11 +32,23 @@ app_name = "reports"
 urlpatterns = [
     path("", ReportListCreateView.as_view(), name="report-list-create"),
     path("overview", ReportsOverviewView.as_view(), name="reports-overview"),
+    path("batch", ReportBatchCreateView.as_view(), name="report-batch-create"),
+    path("moderate", ReportBulkModerateView.as_view(), name="report-bulk-moderate"),
+    path("search", ReportSearchView.as_view(), name="report-search"),
+    path("nearby", NearbyReportListView.as_view(), name="report-nearby"),
     path("<uuid:pk>", ReportDetailView.as_view(), name="report-detail"),
     path("<uuid:pk>/verify", ReportVerifyView.as_view(), name="report-verify"),
     path("<uuid:pk>/reject", ReportRejectView.as_view(), name="report-reject"),
+    path("map", MapGridView.as_view(), name="report-map-grid"),
+    path("route-safety", RouteSafetyView.as_view(), name="report-route-safety"),
+    path("export/<str:dataset>.<str:fmt>", ExportView.as_view(), name="export"),
     path("clusters", ClusterListView.as_view(), name="cluster-list"),
     path("clusters/<uuid:pk>", ClusterDetailView.as_view(), name="cluster-detail"),
+    path(
+        "clusters/<uuid:pk>/reports",
+        ClusterReportListView.as_view(),
+        name="cluster-report-list",
+    ),
     path(
         "clusters/<uuid:pk>/broadcast",
         ClusterBroadcastView.as_view(),
@@ -44,6 +67,21 @@ urlpatterns = [
         MarkAllNotificationsReadView.as_view(),
         name="notification-read-all",
     ),
+    path(
+        "notifications/unread-count",
+        UnreadNotificationCountView.as_view(),
+        name="notification-unread-count",
+    ),
+    path(
+        "notifications/stream-ticket",
+        NotificationStreamTicketView.as_view(),
+        name="notification-stream-ticket",
+    ),
+    path(
+        "notifications/stream",
+        NotificationStreamView.as_view(),
+        name="notification-stream",
+    ),
     path(
         "notifications/<uuid:pk>",
         NotificationDetailView.as_view(),
@@ -1,10 +1,19 @@
 from rest_framework import permissions, status
 from rest_framework.response import Response
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.views import APIView
-from django.db.models import Count
+from rest_framework.generics import GenericAPIView
+from datetime import date, timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
-from datetime import timedelta
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from asgiref.sync import sync_to_async
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
 
 from sklearn import cluster
 from globalmitra.permissions import IsAdminUser
@@ -22,11 +31,72 @@ from reports.serializers import (
     IncidentClusterDetailSerializer,
     AlertBroadcastSerializer,
     NotificationSerializer,
+    NotificationExpandedSerializer,
+    BulkModerationSerializer,
+    RouteSafetySerializer,
+)
+from reports.pagination import (
+    NearbyPagination,
+    NotificationCursorPagination,
+    ReportCursorPagination,
+)
+from reports.batch import parse_batch, submit_report_batch
+from reports.hazards import refresh_hazards_near
+from reports.idempotency import idempotent
+from reports.exports import (
+    DATASETS,
+    FORMATS,
+    export_rows,
+    stream_async,
+    stream_csv,
+    stream_geojson,
+)
+from reports.lifecycle import active_clusters
+from reports.mapgrid import MAX_ZOOM, map_grid, tile_count, tile_degrees
+from reports.moderation import moderate_reports
+from reports.nearby import load_in_order, nearest, parse_near
+from reports.routes import route_from_slugs, route_hazards
+from reports.search import filter_reports, rank_reports
+from reports.stats import report_status_counts, reports_overview
+from reports.events import (
+    HEARTBEAT_SECONDS,
+    format_sse,
+    get_broker,
+    issue_stream_ticket,
+    parse_event_id,
+    redeem_stream_ticket,
+    replay_events,
+)
+from reports.notifications import (
+    bulk_notify,
+    decrement_unread,
+    mark_all_read,
+    unread_count,
 )
 
 
-class ReportListCreateView(APIView):
+class ReportListCreateView(GenericAPIView):
     parser_classes = [MultiPartParser, FormParser]
+    pagination_class = ReportCursorPagination
+
+    # Columns IncidentReportReadSerializer actually reads
+    LIST_FIELDS = (
+        "id",
+        "description",
+        "category",
+        "image",
+        "imageMedium",
+        "imageThumbnail",
+        "latitude",
+        "longitude",
+        "confidenceScore",
+        "status",
+        "createdAt",
+        "rejectionReason",
+        "user__email",
+        "user__fullName",
+        "user__role",
+    )
 
     def get_permissions(self):
         if self.request.method == "POST":
@@ -34,35 +104,31 @@ class ReportListCreateView(APIView):
         return [IsAdminUser()]
 
     def get(self, request):
-        qs = IncidentReport.objects.select_related("user").order_by("-createdAt")
+        qs = IncidentReport.objects.select_related("user").only(*self.LIST_FIELDS)
 
+        # Stored codes are upper-case; exact matches keep the indexes usable
         s = request.query_params.get("status")
         if s:
-            qs = qs.filter(status__iexact=s)
+            qs = qs.filter(status=s.upper())
 
         cat = request.query_params.get("category")
         if cat:
-            qs = qs.filter(category__iexact=cat)
+            qs = qs.filter(category=cat.upper())
 
+        # Full-text match; keeps the (createdAt, id) cursor ordering
         search = request.query_params.get("search")
         if search:
-            qs = qs.filter(description__icontains=search)
-
-        status_counts = dict(
-            IncidentReport.objects.values_list("status").annotate(n=Count("id"))
-        )
-        counts = {
-            "PENDING": status_counts.get("PENDING", 0),
-            "VERIFIED": status_counts.get("VERIFIED", 0),
-            "REJECTED": status_counts.get("REJECTED", 0),
-            "AUTO_ALERTED": status_counts.get("AUTO_ALERTED", 0),
-        }
+            qs = filter_reports(qs, search)
 
+        page = self.paginate_queryset(qs)
         serializer = IncidentReportReadSerializer(
-            qs, many=True, context={"request": request}
+            page, many=True, context={"request": request}
         )
-        return Response({"results": serializer.data, "status_counts": counts})
+        response = self.get_paginated_response(serializer.data)
+        response.data["status_counts"] = report_status_counts()
+        return response
 
+    @idempotent
     def post(self, request):
         serializer = IncidentReportCreateSerializer(
             data=request.data, context={"request": request}
@@ -75,6 +141,81 @@ class ReportListCreateView(APIView):
         return Response(read.data, status=status.HTTP_201_CREATED)
 
 
+class ReportBatchCreateView(APIView):
+    """
+    POST /reports/batch
+
+    Submit an offline backlog in one request. Multipart body: ``reports`` is a
+    JSON list of {clientId, description, category, latitude, longitude,
+    image?} and each image is sent as its own part (``image_<index>`` unless
+    the item names one). See reports.batch.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+
+    @idempotent
+    def post(self, request):
+        items = parse_batch(request.data, request.FILES)
+        results, created = submit_report_batch(request.user, items)
+        return Response(
+            {
+                "results": results,
+                "created": IncidentReportReadSerializer(
+                    created, many=True, context={"request": request}
+                ).data,
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class ReportSearchView(APIView):
+    """
+    GET /reports/search?q=&status=&category=&limit=
+
+    Relevance-ranked report search. Every word in ``q`` is matched as a
+    prefix; status/category filters are applied in the same query as the
+    index lookup.
+    """
+    permission_classes = [IsAdminUser]
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    def get(self, request):
+        q = request.query_params.get("q", "").strip()
+        if not q:
+            return Response(
+                {"detail": "q is required."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", self.DEFAULT_LIMIT))
+        except ValueError:
+            return Response(
+                {"detail": "limit must be an integer."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        limit = max(1, min(limit, self.MAX_LIMIT))
+
+        qs = IncidentReport.objects.select_related("user").only(
+            *ReportListCreateView.LIST_FIELDS
+        )
+        s = request.query_params.get("status")
+        if s:
+            qs = qs.filter(status=s.upper())
+        cat = request.query_params.get("category")
+        if cat:
+            qs = qs.filter(category=cat.upper())
+
+        reports = list(rank_reports(qs, q)[:limit])
+        data = IncidentReportReadSerializer(
+            reports, many=True, context={"request": request}
+        ).data
+        for row, report in zip(data, reports):
+            row["rank"] = report.rank
+        return Response({"count": len(data), "results": data})
+
+
 class ReportDetailView(APIView):
     parser_classes = [MultiPartParser, FormParser]
 
@@ -125,7 +266,6 @@ class ReportDetailView(APIView):
 
         report.verifiedBy = request.user
         update_fields.append("verifiedBy")
-        report.save(update_fields=update_fields)
 
         notif_type = (
             "REPORT_VERIFIED" if new_status == "VERIFIED" else "REPORT_REJECTED"
@@ -135,13 +275,15 @@ class ReportDetailView(APIView):
             if new_status == "VERIFIED"
             else f"Your incident report was rejected. Reason: {report.rejectionReason or 'N/A'}"
         )
-        Notification.objects.create(
-            recipient=report.user,
-            notificationType=notif_type,
-            title=f"Report {new_status.title()}",
-            message=notif_msg,
-            incidentReport=report,
-        )
+        with transaction.atomic():
+            report.save(update_fields=update_fields)
+            Notification.objects.create(
+                recipient=report.user,
+                notificationType=notif_type,
+                title=f"Report {new_status.title()}",
+                message=notif_msg,
+                incidentReport=report,
+            )
 
         return Response(
             IncidentReportReadSerializer(report, context={"request": request}).data
@@ -153,7 +295,8 @@ class ReportDetailView(APIView):
             return Response(
                 {"detail": "Report not found."}, status=status.HTTP_404_NOT_FOUND
             )
-        report.delete()
+        with transaction.atomic():
+            report.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -170,15 +313,15 @@ class ReportVerifyView(APIView):
 
         report.status = "VERIFIED"
         report.verifiedBy = request.user
-        report.save(update_fields=["status", "verifiedBy"])
-
-        Notification.objects.create(
-            recipient=report.user,
-            notificationType="REPORT_VERIFIED",
-            title="Report Verified",
-            message="Your incident report has been verified by an admin.",
-            incidentReport=report,
-        )
+        with transaction.atomic():
+            report.save(update_fields=["status", "verifiedBy"])
+            Notification.objects.create(
+                recipient=report.user,
+                notificationType="REPORT_VERIFIED",
+                title="Report Verified",
+                message="Your incident report has been verified by an admin.",
+                incidentReport=report,
+            )
 
         return Response(
             IncidentReportReadSerializer(report, context={"request": request}).data
@@ -200,83 +343,273 @@ class ReportRejectView(APIView):
         report.status = "REJECTED"
         report.rejectionReason = reason
         report.verifiedBy = request.user
-        report.save(update_fields=["status", "rejectionReason", "verifiedBy"])
-
-        Notification.objects.create(
-            recipient=report.user,
-            notificationType="REPORT_REJECTED",
-            title="Report Rejected",
-            message=f"Your incident report was rejected. Reason: {reason or 'N/A'}",
-            incidentReport=report,
-        )
+        with transaction.atomic():
+            report.save(update_fields=["status", "rejectionReason", "verifiedBy"])
+            Notification.objects.create(
+                recipient=report.user,
+                notificationType="REPORT_REJECTED",
+                title="Report Rejected",
+                message=f"Your incident report was rejected. Reason: {reason or 'N/A'}",
+                incidentReport=report,
+            )
 
         return Response(
             IncidentReportReadSerializer(report, context={"request": request}).data
         )
 
 
+class ReportBulkModerateView(APIView):
+    """
+    POST /reports/moderate  {"ids": [...], "action": "verify"|"reject", "reason"?}
+
+    Verifies or rejects up to REPORTS_MODERATION_MAX_IDS reports in one
+    UPDATE and notifies their authors. Returns a result per id.
+    """
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        serializer = BulkModerationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = moderate_reports(
+            request.user,
+            serializer.validated_data["ids"],
+            serializer.validated_data["action"],
+            serializer.validated_data["reason"],
+        )
+        return Response({"results": results})
+
+
 class ReportsOverviewView(APIView):
     permission_classes = [IsAdminUser]
 
     def get(self, request):
-        now = timezone.now()
-        this_week = now - timedelta(days=7)
-        last_week = now - timedelta(days=14)
+        return Response(reports_overview())
 
-        total = IncidentReport.objects.count()
-        this_w = IncidentReport.objects.filter(createdAt__gte=this_week).count()
-        last_w = IncidentReport.objects.filter(
-            createdAt__gte=last_week,
-            createdAt__lt=this_week,
-        ).count()
 
-        weekly_change = (
-            round(((this_w - last_w) / last_w) * 100, 1) if last_w > 0 else 0
+def _near_or_error(request):
+    """(near, None) from ?near=lat,lon&radius=km, or (None, 400 response)."""
+    try:
+        return parse_near(request.query_params), None
+    except ValueError:
+        return None, Response(
+            {
+                "detail": "near=lat,lon and radius (km, at most "
+                f"{settings.REPORTS_NEARBY_MAX_RADIUS_KM}) must be valid numbers."
+            },
+            status=status.HTTP_400_BAD_REQUEST,
         )
 
-        weekly_data = []
-        for i in range(6, -1, -1):
-            day = now - timedelta(days=i)
-            weekly_data.append(
-                {
-                    "day": day.strftime("%a"),
-                    "count": IncidentReport.objects.filter(
-                        createdAt__date=day.date()
-                    ).count(),
-                }
+
+def _nearby_response(view, request, qs, lat_field, lon_field, near, serializer_class):
+    """Distance-sorted, offset-paginated response for ``qs`` around ``near``."""
+    pairs = view.paginator.paginate_queryset(
+        nearest(qs, lat_field, lon_field, *near), request, view=view
+    )
+    page = load_in_order(qs, pairs)
+    data = serializer_class(page, many=True, context={"request": request}).data
+    for item, obj in zip(data, page):
+        item["distanceKm"] = obj.distanceKm
+    return view.paginator.get_paginated_response(data)
+
+
+class NearbyReportListView(GenericAPIView):
+    """
+    GET /reports/nearby?near=lat,lon&radius=km&hours=
+
+    Verified reports from the last ``hours`` within ``radius`` km, nearest
+    first. See reports.nearby.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NearbyPagination
+
+    def get(self, request):
+        near, error = _near_or_error(request)
+        if error:
+            return error
+        if near is None:
+            return Response(
+                {"detail": "near=lat,lon is required."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
+        try:
+            hours = int(request.query_params.get("hours", settings.REPORTS_MAP_DEFAULT_HOURS))
+        except ValueError:
+            return Response(
+                {"detail": "hours must be an integer."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        hours = max(1, min(hours, settings.REPORTS_MAP_MAX_HOURS))
 
-        by_category = list(
-            IncidentReport.objects.values("category")
-            .annotate(count=Count("id"))
-            .order_by("-count")
+        qs = (
+            IncidentReport.objects.filter(
+                status="VERIFIED",
+                createdAt__gte=timezone.now() - timedelta(hours=hours),
+            )
+            .select_related("user")
+            .only(*ReportListCreateView.LIST_FIELDS)
         )
+        return _nearby_response(
+            self, request, qs, "latitude", "longitude", near, IncidentReportReadSerializer
+        )
+
+
+class MapGridView(APIView):
+    """
+    GET /reports/map?bbox=west,south,east,north&zoom=&hours=&category=
+
+    Report counts/centroids and cluster counts per grid cell for the map
+    viewport, instead of every marker. See reports.mapgrid.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        try:
+            west, south, east, north = (
+                float(v) for v in request.query_params.get("bbox", "").split(",")
+            )
+            zoom = int(request.query_params.get("zoom", ""))
+            hours = int(
+                request.query_params.get("hours", settings.REPORTS_MAP_DEFAULT_HOURS)
+            )
+        except ValueError:
+            return Response(
+                {"detail": "bbox=west,south,east,north and an integer zoom are required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        status_map = dict(
-            IncidentReport.objects.values_list("status").annotate(n=Count("id"))
+        if not (-180 <= west < east <= 180 and -90 <= south < north <= 90):
+            return Response(
+                {"detail": "bbox is out of range or empty."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        zoom = max(0, min(zoom, MAX_ZOOM))
+        hours = max(1, min(hours, settings.REPORTS_MAP_MAX_HOURS))
+        # Counted from the bounds: a huge viewport must not build its tile list
+        if tile_count(west, south, east, north, zoom) > settings.REPORTS_MAP_MAX_TILES:
+            return Response(
+                {"detail": "Viewport too large for this zoom level; zoom out."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        category = request.query_params.get("category")
+        cells = map_grid(
+            west, south, east, north, zoom, hours, category.upper() if category else None
+        )
+        return Response(
+            {
+                "zoom": zoom,
+                "cellDegrees": tile_degrees(zoom) / settings.REPORTS_MAP_CELLS_PER_TILE,
+                "hours": hours,
+                "cells": cells,
+            }
         )
 
+
+class RouteSafetyView(APIView):
+    """
+    POST /reports/route-safety
+        {"path": [[lat, lon], ...]} or {"destinations": [slug, ...]},
+        "radiusKm"?, "hours"?
+
+    Recent reports and active clusters within radiusKm of the route,
+    ordered along it. See reports.routes.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = RouteSafetySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        if "destinations" in data:
+            try:
+                route = route_from_slugs(data["destinations"])
+            except KeyError as exc:
+                return Response(
+                    {"destinations": [f"Unknown destination(s): {', '.join(exc.args[0])}."]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        else:
+            route = data["path"]
+
+        hazards, length, truncated = route_hazards(route, data["radiusKm"], data["hours"])
         return Response(
             {
-                "total_reports": total,
-                "pending_count": status_map.get("PENDING", 0),
-                "verified_count": status_map.get("VERIFIED", 0),
-                "rejected_count": status_map.get("REJECTED", 0),
-                "auto_alerted_count": status_map.get("AUTO_ALERTED", 0),
-                "active_clusters": IncidentCluster.objects.count(),
-                "alerts_sent": AlertBroadcast.objects.count(),
-                "weekly_change": weekly_change,
-                "weekly_data": weekly_data,
-                "by_category": by_category,
+                "radiusKm": data["radiusKm"],
+                "hours": data["hours"],
+                "routeLengthKm": round(length, 3),
+                "route": route,
+                "truncated": truncated,
+                "hazards": hazards,
             }
         )
 
 
-class ClusterListView(APIView):
+class ExportView(APIView):
+    """
+    GET /reports/export/<reports|clusters|alerts>.<csv|geojson>
+        ?since=YYYY-MM-DD&until=YYYY-MM-DD&category=
+
+    Streams every matching row; nothing is buffered under WSGI or ASGI.
+    See reports.exports.
+    """
+    permission_classes = [IsAdminUser]
+
+    CONTENT_TYPES = {
+        "csv": "text/csv; charset=utf-8",
+        "geojson": "application/geo+json",
+    }
+
+    def get(self, request, dataset, fmt):
+        if dataset not in DATASETS or fmt not in FORMATS:
+            return Response(
+                {"detail": "Export not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            since, until = (
+                date.fromisoformat(v) if v else None
+                for v in (
+                    request.query_params.get("since"),
+                    request.query_params.get("until"),
+                )
+            )
+        except ValueError:
+            return Response(
+                {"detail": "since/until must be YYYY-MM-DD."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        category = request.query_params.get("category")
+
+        names, rows = export_rows(
+            dataset, since, until, category.upper() if category else None
+        )
+        body = stream_csv(names, rows) if fmt == "csv" else stream_geojson(dataset, names, rows)
+        if isinstance(request._request, ASGIRequest):
+            body = stream_async(body)
+        response = StreamingHttpResponse(body, content_type=self.CONTENT_TYPES[fmt])
+        response["Content-Disposition"] = f'attachment; filename="{dataset}.{fmt}"'
+        return response
+
+
+class ClusterListView(GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NearbyPagination
 
     def get(self, request):
-        qs = IncidentCluster.objects.annotate(_report_count=Count("reports")).order_by("-createdAt")
+        near, error = _near_or_error(request)
+        if error:
+            return error
+
+        # Active incidents by default; ?state=expired|all reaches into history
+        state = (request.query_params.get("state") or "active").lower()
+        if state == "all":
+            qs = IncidentCluster.objects.all()
+        elif state == "expired":
+            qs = IncidentCluster.objects.filter(state="EXPIRED")
+        else:
+            qs = active_clusters()
+        qs = qs.order_by("-createdAt")
 
         status_param = request.query_params.get("status")
         if status_param == "Verified":
@@ -288,6 +621,13 @@ class ClusterListView(APIView):
         if category_param:
             qs = qs.filter(dominantCategory__iexact=category_param)
 
+        # ?near=lat,lon&radius=km: nearest first, paginated
+        if near:
+            return _nearby_response(
+                self, request, qs, "centerLatitude", "centerLongitude", near,
+                IncidentClusterSerializer,
+            )
+
         serializer = IncidentClusterSerializer(
             qs, many=True, context={"request": request}
         )
@@ -302,7 +642,7 @@ class ClusterDetailView(APIView):
 
     def get_object(self, pk):
         try:
-            return IncidentCluster.objects.prefetch_related("reports__user").get(pk=pk)
+            return IncidentCluster.objects.get(pk=pk)
         except IncidentCluster.DoesNotExist:
             return None
 
@@ -323,9 +663,36 @@ class ClusterDetailView(APIView):
                 {"detail": "Cluster not found."}, status=status.HTTP_404_NOT_FOUND
             )
         cluster.delete()
+        # The deleted cluster no longer counts towards nearby destinations
+        refresh_hazards_near([cluster])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class ClusterReportListView(GenericAPIView):
+    """
+    GET /reports/clusters/<id>/reports — the cluster's member reports,
+    cursor-paginated newest first.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ReportCursorPagination
+
+    def get(self, request, pk):
+        if not IncidentCluster.objects.filter(pk=pk).exists():
+            return Response(
+                {"detail": "Cluster not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        qs = (
+            IncidentReport.objects.filter(cluster=pk)
+            .select_related("user")
+            .only(*ReportListCreateView.LIST_FIELDS)
+        )
+        page = self.paginate_queryset(qs)
+        serializer = IncidentReportReadSerializer(
+            page, many=True, context={"request": request}
+        )
+        return self.get_paginated_response(serializer.data)
+
+
 class ClusterBroadcastView(APIView):
     permission_classes = [IsAdminUser]
 
@@ -364,14 +731,19 @@ class ClusterBroadcastView(APIView):
         cluster.isAlertTriggered = True
         cluster.save(update_fields=["isAlertTriggered"]) 
 
-        for report in cluster.reports.select_related("user").all():
-            Notification.objects.create(
-                recipient=report.user,  
-                notificationType="ALERT_BROADCAST",
-                title=f"Alert: {cluster.dominantCategory.replace('_', ' ').title()}",
-                message=message,
-                incidentReport=report,
-            )
+        title = f"Alert: {cluster.dominantCategory.replace('_', ' ').title()}"
+        bulk_notify(
+            [
+                Notification(
+                    recipient_id=report.user_id,
+                    notificationType="ALERT_BROADCAST",
+                    title=title,
+                    message=message,
+                    incidentReport=report,
+                )
+                for report in cluster.reports.all()
+            ]
+        )
 
         return Response(
             AlertBroadcastSerializer(alert, context={"request": request}).data,
@@ -379,10 +751,15 @@ class ClusterBroadcastView(APIView):
         )
 
 
-class AlertListView(APIView):
+class AlertListView(GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NearbyPagination
 
     def get(self, request):
+        near, error = _near_or_error(request)
+        if error:
+            return error
+
         qs = AlertBroadcast.objects.select_related(
             "cluster", "broadcastedBy"
         ).order_by("-broadcastTime")
@@ -393,7 +770,14 @@ class AlertListView(APIView):
 
         trigger = request.query_params.get("trigger")
         if trigger:
-            qs = qs.filter(trigger_type__iexact=trigger)
+            qs = qs.filter(triggerType__iexact=trigger)
+
+        # ?near=lat,lon&radius=km: by the alert's cluster centre, nearest first
+        if near:
+            return _nearby_response(
+                self, request, qs, "cluster__centerLatitude", "cluster__centerLongitude",
+                near, AlertBroadcastSerializer,
+            )
 
         serializer = AlertBroadcastSerializer(
             qs, many=True, context={"request": request}
@@ -435,14 +819,42 @@ class AlertDetailView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class NotificationListView(APIView):
+class NotificationListView(GenericAPIView):
+    """
+    Cursor-paginated inbox, newest first.
+
+    Rows are slim by default (report referenced by id). ``?expand=report``
+    nests the full report, fetched with its author in the same query.
+    """
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
+
+    SLIM_FIELDS = (
+        "id",
+        "notificationType",
+        "title",
+        "message",
+        "isRead",
+        "createdAt",
+        "incidentReport",
+    )
 
     def get(self, request):
-        qs = Notification.objects.filter(recipient=request.user).order_by("-createdAt")
-        unread = qs.filter(isRead=False).count()
-        serializer = NotificationSerializer(qs, many=True, context={"request": request})
-        response = Response(serializer.data)
+        qs = Notification.objects.filter(recipient=request.user)
+
+        expand = request.query_params.get("expand", "").split(",")
+        if "report" in expand:
+            qs = qs.select_related("incidentReport__user")
+            serializer_class = NotificationExpandedSerializer
+        else:
+            qs = qs.only(*self.SLIM_FIELDS)
+            serializer_class = NotificationSerializer
+
+        unread = unread_count(request.user)
+
+        page = self.paginate_queryset(qs)
+        serializer = serializer_class(page, many=True, context={"request": request})
+        response = self.get_paginated_response(serializer.data)
         response["X-Unread-Count"] = unread
         return response
 
@@ -452,7 +864,9 @@ class NotificationDetailView(APIView):
 
     def get_object(self, pk, user):
         try:
-            return Notification.objects.get(pk=pk, recipient=user)
+            return Notification.objects.select_related("incidentReport__user").get(
+                pk=pk, recipient=user
+            )
         except Notification.DoesNotExist:
             return None
 
@@ -463,7 +877,7 @@ class NotificationDetailView(APIView):
                 {"detail": "Notification not found."}, status=status.HTTP_404_NOT_FOUND
             )
         return Response(
-            NotificationSerializer(notif, context={"request": request}).data
+            NotificationExpandedSerializer(notif, context={"request": request}).data
         )
 
     def patch(self, request, pk):
@@ -472,10 +886,15 @@ class NotificationDetailView(APIView):
             return Response(
                 {"detail": "Notification not found."}, status=status.HTTP_404_NOT_FOUND
             )
+        # Conditional UPDATE so concurrent PATCHes only decrement once
+        flipped = Notification.objects.filter(pk=notif.pk, isRead=False).update(
+            isRead=True
+        )
+        if flipped:
+            decrement_unread(request.user.pk)
         notif.isRead = True
-        notif.save(update_fields=["isRead"])
         return Response(
-            NotificationSerializer(notif, context={"request": request}).data
+            NotificationExpandedSerializer(notif, context={"request": request}).data
         )
 
     def delete(self, request, pk):
@@ -484,6 +903,7 @@ class NotificationDetailView(APIView):
             return Response(
                 {"detail": "Notification not found."}, status=status.HTTP_404_NOT_FOUND
             )
+        # post_delete decrements the unread counter
         notif.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -492,10 +912,113 @@ class MarkAllNotificationsReadView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
-        updated = Notification.objects.filter(
-            recipient=request.user, isRead=False
-        ).update(isRead=True)
-        return Response({"marked_read": updated})
+        return Response({"marked_read": mark_all_read(request.user.pk)})
+
+
+class UnreadNotificationCountView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response({"unread": unread_count(request.user)})
+
+
+class NotificationStreamTicketView(APIView):
+    """
+    Single-use ticket for opening the event stream from a browser, whose
+    EventSource cannot send the Authorization header.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        return Response(
+            {
+                "ticket": issue_stream_ticket(request.user),
+                "expiresIn": settings.REPORTS_EVENT_TICKET_SECONDS,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+def _authenticate_stream(request):
+    """
+    JWT from the Authorization header, or a ``?ticket=`` from
+    NotificationStreamTicketView. Tokens are never taken from the URL.
+    """
+    ticket = request.GET.get("ticket")
+    if ticket:
+        user_id = redeem_stream_ticket(ticket)
+        if user_id is None:
+            return None
+        return get_user_model().objects.filter(pk=user_id, is_active=True).first()
+
+    auth = JWTAuthentication()
+    header = auth.get_header(request)
+    raw_token = auth.get_raw_token(header) if header else None
+    if not raw_token:
+        return None
+    try:
+        return auth.get_user(auth.get_validated_token(raw_token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+class NotificationStreamView(View):
+    """
+    Server-Sent Events stream of the user's new notifications plus every new
+    alert broadcast. Reconnects resume from ``Last-Event-ID``.
+
+    Needs the ASGI server — one long-lived response per connected client.
+    """
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse(
+                {"detail": "Event stream is only available under ASGI."},
+                status=status.HTTP_501_NOT_IMPLEMENTED,
+            )
+
+        user = await sync_to_async(_authenticate_stream)(request)
+        if user is None:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        last_event_id = request.headers.get("Last-Event-ID") or request.GET.get(
+            "lastEventId"
+        )
+        response = StreamingHttpResponse(
+            self.stream(user, parse_event_id(last_event_id)),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def stream(self, user, since):
+        # Subscribe before replaying so nothing published in between is lost;
+        # anything both replayed and queued is skipped by id.
+        subscription = get_broker().subscribe(user.pk)
+        try:
+            cursor = None
+            yield "retry: 5000\n\n"
+
+            if since is not None:
+                for event in await sync_to_async(replay_events)(user, since):
+                    yield format_sse(event)
+                    cursor = int(event["id"])
+
+            while True:
+                event = await subscription.get(timeout=HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                if cursor is not None and int(event["id"]) <= cursor:
+                    continue
+                yield format_sse(event)
+        finally:
+            subscription.close()
 
 
 class AlertSendToAllView(APIView):
@@ -520,17 +1043,26 @@ class AlertSendToAllView(APIView):
 
         users = UserModel.objects.all()
 
-        created_count = 0
-        for user in users:
-            _, created = Notification.objects.get_or_create(
-                recipient=user,
-                notificationType="ALERT_BROADCAST",
-                title=title,
-                message=message,
-                defaults={"isRead": False},
-            )
-            if created:
-                created_count += 1
+        already_sent = Notification.objects.filter(
+            notificationType="ALERT_BROADCAST",
+            title=title,
+            message=message,
+        ).values_list("recipient_id", flat=True)
+
+        created = bulk_notify(
+            [
+                Notification(
+                    recipient_id=user_id,
+                    notificationType="ALERT_BROADCAST",
+                    title=title,
+                    message=message,
+                )
+                for user_id in users.exclude(pk__in=already_sent).values_list(
+                    "pk", flat=True
+                )
+            ]
+        )
+        created_count = len(created)
 
         return Response(
             {
@@ -3,10 +3,10 @@ import { AnimatePresence, motion } from 'framer-motion';
 import {
   RefreshCw, Search, Eye, Trash2, Check, X, MapPin, Clock,
   AlertTriangle, Radio, Bell, BarChart2, FileText, ChevronDown,
-  Loader2, Shield, User, Activity, Filter, Send,
+  Loader2, Shield, User, Activity, Filter, Send, ChevronLeft, ChevronRight,
 } from 'lucide-react';
 import { T, apiFetch, parseErr } from './utils';
-import { Spinner, ErrMsg, Empty, Confirm, Pagination } from './ui';
+import { Spinner, ErrMsg, Empty, Confirm } from './ui';
 import { useSocialStore } from '@/store/socialStore';
 import type { ToastFn } from './types';
 
@@ -99,7 +99,7 @@ interface Cluster {
   reportCount?:      number;
   detectedAt?:       string;
   createdAt?:        string;
-  reports?:          ClusterReport[];
+  reports?:          ClusterReport[];   // detail: sample nearest the centre
 }
 
 interface AlertItem {
@@ -162,7 +162,7 @@ function normClusterReport(r: any): ClusterReport {
 }
 
 function normCluster(c: any): Cluster {
-  const rawReports = c.reports ?? c.report_list ?? [];
+  const rawReports = c.sampleReports ?? c.reports ?? c.report_list ?? [];
   return {
     id:               c.id,
     dominantCategory: c.dominant_category  ?? c.dominantCategory,
@@ -314,22 +314,44 @@ function StatCard({ label, value, sub, accent, icon: Icon }:
 function ClusterDetailsModal({ cluster, onClose, onBroadcast }:
   { cluster: Cluster; onClose: () => void; onBroadcast: () => void }) {
 
-  const [detail,  setDetail]  = useState<Cluster>(cluster);
-  const [loading, setLoading] = useState(false);
+  const [detail,      setDetail]      = useState<Cluster>(cluster);
+  const [loading,     setLoading]     = useState(false);
+  const [members,     setMembers]     = useState<ClusterReport[] | null>(null);
+  const [nextCursor,  setNextCursor]  = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  // Member reports are cursor-paginated; the detail only carries a sample
+  const loadMembers = useCallback((cursor?: string | null) => {
+    setLoadingMore(true);
+    const qs = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+    return apiFetch(`/reports/clusters/${cluster.id}/reports${qs}`)
+      .then(d => {
+        const page = (d.results ?? []).map(normClusterReport);
+        setMembers(prev => (cursor && prev ? [...prev, ...page] : page));
+        setNextCursor(d.next
+          ? new URL(d.next, window.location.origin).searchParams.get('cursor')
+          : null);
+      })
+      .catch(() => {/* keep the sample reports */})
+      .finally(() => setLoadingMore(false));
+  }, [cluster.id]);
 
   useEffect(() => {
     setLoading(true);
-    apiFetch(`/reports/clusters/${cluster.id}`)
-      .then(d => setDetail(normCluster(d)))
-      .catch(() => {/* use passed cluster data */})
-      .finally(() => setLoading(false));
-  }, [cluster.id]);
+    setMembers(null);
+    Promise.all([
+      apiFetch(`/reports/clusters/${cluster.id}`)
+        .then(d => setDetail(normCluster(d)))
+        .catch(() => {/* use passed cluster data */}),
+      loadMembers(),
+    ]).finally(() => setLoading(false));
+  }, [cluster.id, loadMembers]);
 
   const pct     = confPct(detail.confidenceScore);
   const confCol = pct >= 75 ? '#22C55E' : pct >= 50 ? '#F59E0B' : '#EF4444';
   const date    = detail.detectedAt ?? detail.createdAt;
   const keys    = detail.topKeywords ?? [];
-  const reports = detail.reports ?? [];
+  const reports = members ?? detail.reports ?? [];
   const count   = detail.reportCount ?? reports.length;
   const alerted = detail.isAlertTriggered;
 
@@ -481,6 +503,15 @@ function ClusterDetailsModal({ cluster, onClose, onBroadcast }:
                     </div>
                   );
                 })}
+                {nextCursor && (
+                  <button onClick={() => loadMembers(nextCursor)} disabled={loadingMore}
+                    className="w-full flex items-center justify-center gap-2 py-2 rounded-xl border
+                      text-xs font-semibold disabled:opacity-60"
+                    style={{ borderColor: C.borderSm, color: T.primary }}>
+                    {loadingMore && <Loader2 className="w-3.5 h-3.5 animate-spin" />}
+                    Load more reports
+                  </button>
+                )}
               </div>
             )}
           </div>
@@ -898,29 +929,41 @@ function RecentPendingCard({ onViewAll }: { onViewAll: () => void }) {
 
 function ReportsTab({ toast }: { toast: ToastFn }) {
   const [reports,      setReports]      = useState<Report[]>([]);
-  const [total,        setTotal]        = useState(0);
   const [loading,      setLoading]      = useState(true);
   const [err,          setErr]          = useState('');
   const [search,       setSearch]       = useState('');
   const [status,       setStatus]       = useState('all');
   const [category,     setCategory]     = useState('all');
   const [page,         setPage]         = useState(1);
+  const [cursor,       setCursor]       = useState<string | null>(null);
+  const [nextCursor,   setNextCursor]   = useState<string | null>(null);
+  const [prevCursor,   setPrevCursor]   = useState<string | null>(null);
   const [viewing,      setViewing]      = useState<Report | null>(null);
   const [confirmId,    setConfirmId]    = useState<string | null>(null);
   const [statusCounts, setStatusCounts] = useState<Record<string, number>>({});
   const PAGE_SIZE = 10;
 
+  // The list is cursor-paginated: follow the next/previous links and keep a
+  // page number only for the row numbers shown in the table.
+  const cursorOf = (link?: string | null) =>
+    link ? new URL(link, window.location.origin).searchParams.get('cursor') : null;
+
+  const goTo = (c: string | null, p: number) => { setCursor(c); setPage(p); };
+  const resetPage = () => goTo(null, 1);
+
   const load = useCallback(async () => {
     setLoading(true); setErr('');
     try {
-      const qs = new URLSearchParams({ page: String(page), page_size: String(PAGE_SIZE) });
+      const qs = new URLSearchParams({ page_size: String(PAGE_SIZE) });
+      if (cursor)             qs.set('cursor',   cursor);
       if (search.trim())      qs.set('search',   search.trim());
       if (status !== 'all')   qs.set('status',   status.toUpperCase());
       if (category !== 'all') qs.set('category', category);
       const data = await apiFetch(`/reports/?${qs}`);
       const raw  = data.results ?? data.data ?? [];
       setReports(raw.map(normReport));
-      setTotal(data.count ?? data.total ?? raw.length);
+      setNextCursor(cursorOf(data.next));
+      setPrevCursor(cursorOf(data.previous));
       const sc = data.status_counts ?? data.statusCounts;
       if (sc) {
         setStatusCounts({
@@ -932,7 +975,7 @@ function ReportsTab({ toast }: { toast: ToastFn }) {
       }
     } catch (e: any) { setErr(parseErr(e)); }
     finally { setLoading(false); }
-  }, [page, search, status, category]);
+  }, [cursor, search, status, category]);
 
   useEffect(() => { load(); }, [load]);
 
@@ -954,8 +997,16 @@ function ReportsTab({ toast }: { toast: ToastFn }) {
     setConfirmId(null);
   };
 
+  // status_counts covers every report, so a total is only known when the
+  // list is not narrowed by search or category.
+  const countFor = (key: string) => key === 'all'
+    ? Object.values(statusCounts).reduce((a, b) => a + b, 0)
+    : statusCounts[key] ?? 0;
+  const total = search.trim() || category !== 'all' ? null : countFor(status);
+  const first = (page - 1) * PAGE_SIZE + 1;
+
   const statusTabs = [
-    { key: 'all',          label: `All (${total})` },
+    { key: 'all',          label: `All (${countFor('all')})` },
     { key: 'pending',      label: `Pending (${statusCounts.pending      ?? 0})` },
     { key: 'verified',     label: `Verified (${statusCounts.verified     ?? 0})` },
     { key: 'rejected',     label: `Rejected (${statusCounts.rejected     ?? 0})` },
@@ -967,14 +1018,14 @@ function ReportsTab({ toast }: { toast: ToastFn }) {
       <div className="flex gap-3 mb-4 flex-wrap">
         <div className="relative flex-1 min-w-[220px]">
           <Search className="absolute left-3 top-1/2 -translate-y-1/2 w-4 h-4" style={{ color: C.textMuted }} />
-          <input value={search} onChange={e => { setSearch(e.target.value); setPage(1); }}
+          <input value={search} onChange={e => { setSearch(e.target.value); resetPage(); }}
             placeholder="Search reports by description, category, reporter, location…"
             className="w-full pl-10 pr-4 py-2.5 rounded-xl border bg-white text-sm outline-none"
             style={{ borderColor: C.border }} />
         </div>
         <div className="relative">
           <Filter className="absolute left-3 top-1/2 -translate-y-1/2 w-3.5 h-3.5" style={{ color: C.textMuted }} />
-          <select value={category} onChange={e => { setCategory(e.target.value); setPage(1); }}
+          <select value={category} onChange={e => { setCategory(e.target.value); resetPage(); }}
             className="pl-8 pr-8 py-2.5 rounded-xl border bg-white text-sm outline-none appearance-none cursor-pointer"
             style={{ borderColor: C.border, color: C.textSub }}>
             <option value="all">All Categories</option>
@@ -989,7 +1040,7 @@ function ReportsTab({ toast }: { toast: ToastFn }) {
 
       <div className="flex flex-wrap gap-2 mb-4">
         {statusTabs.map(t => (
-          <button key={t.key} onClick={() => { setStatus(t.key); setPage(1); }}
+          <button key={t.key} onClick={() => { setStatus(t.key); resetPage(); }}
             className="px-3 py-1.5 rounded-full text-xs font-semibold border-2 transition-all"
             style={status === t.key
               ? { background: T.primary, borderColor: T.primary, color: '#fff' }
@@ -999,9 +1050,9 @@ function ReportsTab({ toast }: { toast: ToastFn }) {
         ))}
       </div>
 
-      {!loading && total > 0 && (
+      {!loading && reports.length > 0 && (
         <p className="text-xs mb-3" style={{ color: C.textMuted }}>
-          Showing {Math.min((page - 1) * PAGE_SIZE + 1, total)}–{Math.min(page * PAGE_SIZE, total)} of {total} reports
+          Showing {first}–{first + reports.length - 1}{total !== null && ` of ${total}`} reports
         </p>
       )}
 
@@ -1024,7 +1075,7 @@ function ReportsTab({ toast }: { toast: ToastFn }) {
                     <tr key={r.id} className="border-t hover:bg-gray-50 transition-colors"
                       style={{ borderColor: C.borderSm }}>
                       <td className="px-4 py-3 text-sm" style={{ color: C.textMuted }}>
-                        {(page - 1) * PAGE_SIZE + i + 1}
+                        {first + i}
                       </td>
                       <td className="px-4 py-3"><CatPill cat={r.category} /></td>
                       <td className="px-4 py-3 max-w-[200px]">
@@ -1077,7 +1128,21 @@ function ReportsTab({ toast }: { toast: ToastFn }) {
                 </tbody>
               </table>
             </div>
-            <Pagination page={page} total={total} pageSize={PAGE_SIZE} onPage={setPage} />
+            {(prevCursor || nextCursor) && (
+              <div className="flex items-center justify-end gap-1 px-4 py-3 border-t"
+                style={{ borderColor: C.borderSm }}>
+                <button onClick={() => goTo(prevCursor, Math.max(page - 1, 1))} disabled={!prevCursor}
+                  className="p-1.5 rounded-lg border hover:bg-gray-50 disabled:opacity-30 transition-colors"
+                  style={{ borderColor: C.border }}>
+                  <ChevronLeft className="w-4 h-4" style={{ color: C.textSub }} />
+                </button>
+                <button onClick={() => goTo(nextCursor, page + 1)} disabled={!nextCursor}
+                  className="p-1.5 rounded-lg border hover:bg-gray-50 disabled:opacity-30 transition-colors"
+                  style={{ borderColor: C.border }}>
+                  <ChevronRight className="w-4 h-4" style={{ color: C.textSub }} />
+                </button>
+              </div>
+            )}
           </>
         )}
       </div>